@@ -3,28 +3,139 @@ Startup Evaluator - Flask Backend
 Main application entry point
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 from pathlib import Path
+import json
+import multiprocessing
 import os
-from services.llm_service import LLMService
-from services.scoring import ScoringService
-from services.pdf_generator import PDFGenerator
-from utils.error_handler import handle_errors
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from services.pdf_export import stream_zip
+from services.pdf_jobs import PDFJobQueue, QueueFull, RenderTimeout
+from utils.error_handler import error_payload, handle_errors, log_error
+from utils.lazy import Lazy
+from utils.metrics import (REQUEST_SECONDS, end_request_timings, registry, request_timings,
+                           server_timing_header, start_request_timings)
 
-# Load environment variables from backend/.env
+# Load environment variables from backend/.env (the only place they are loaded;
+# values in .env take precedence over the environment)
 backend_dir = Path(__file__).parent
 env_path = backend_dir / '.env'
-load_dotenv(dotenv_path=env_path)
+load_dotenv(dotenv_path=env_path, override=True)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend
 
-# Initialize services
-llm_service = LLMService()
-scoring_service = ScoringService()
-pdf_generator = PDFGenerator()
+
+def _build_llm_service():
+    from services.llm_service import LLMService
+    return LLMService()
+
+
+def _build_scoring_service():
+    from services.scoring import ScoringService
+    return ScoringService()
+
+
+def _build_pdf_generator():
+    from services.pdf_generator import PDFGenerator
+    return PDFGenerator()
+
+
+def _build_evaluation_store():
+    from services.evaluation_store import EvaluationStore
+    return EvaluationStore(os.environ.get('EVALUATION_STORE_DB', 'evaluations.db'))
+
+
+def _build_leaderboard():
+    from services.leaderboard import Leaderboard
+    board = Leaderboard(('feasibility_score', *scoring_service.weights))
+    
+    # Index the stored scores in the background (a full table scan), so no
+    # request waits for it; evaluations saved meanwhile are added directly
+    def load():
+        try:
+            board.load(evaluation_store.iter_scores())
+        except Exception as e:
+            log_error(e, "loading leaderboard")
+    
+    board.loading = True
+    threading.Thread(target=load, name='leaderboard-load', daemon=True).start()
+    return board
+
+
+# Services (and their heavy imports: groq, numpy, ReportLab) are built on
+# first use, so importing the app stays fast; GET /ready builds them all
+llm_service = Lazy('llm_service', _build_llm_service)
+scoring_service = Lazy('scoring_service', _build_scoring_service)
+pdf_generator = Lazy('pdf_generator', _build_pdf_generator)
+evaluation_store = Lazy('evaluation_store', _build_evaluation_store)
+leaderboard = Lazy('leaderboard', _build_leaderboard)
+SERVICES = (llm_service, scoring_service, pdf_generator, evaluation_store, leaderboard)
+
+# Shared pool for /evaluate-batch, so upstream concurrency stays bounded
+# no matter how many batches are running
+BATCH_CONCURRENCY = int(os.environ.get('EVAL_BATCH_CONCURRENCY', 8))
+BATCH_MAX_ITEMS = int(os.environ.get('EVAL_BATCH_MAX_ITEMS', 1000))
+batch_pool = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix='evaluate-batch')
+
+# Background PDF rendering on worker processes (POST /generate-pdf with "async": true)
+pdf_jobs = PDFJobQueue(
+    pdf_generator,
+    max_workers=int(os.environ.get('PDF_JOB_WORKERS', os.cpu_count() or 2)),
+    max_queue=int(os.environ.get('PDF_JOB_MAX_QUEUE', 100)),
+    ttl_seconds=float(os.environ.get('PDF_JOB_TTL_SECONDS', 600)),
+    render_timeout=float(os.environ.get('PDF_RENDER_TIMEOUT_SECONDS', 120))
+)
+PDF_EXPORT_MAX_ITEMS = int(os.environ.get('PDF_EXPORT_MAX_ITEMS', 200))
+# A combined PDF is rendered in memory by one worker, so it gets a lower limit
+PDF_COMBINED_MAX_ITEMS = int(os.environ.get('PDF_COMBINED_MAX_ITEMS', 50))
+LEADERBOARD_MAX_LIMIT = int(os.environ.get('LEADERBOARD_MAX_LIMIT', 100))
+
+# Per-stage timings in a Server-Timing header on non-streamed responses
+SERVER_TIMING = os.environ.get('SERVER_TIMING', '1') == '1'
+
+
+@app.before_request
+def start_timing():
+    """Start the request clock and collect stage timings for this request"""
+    g.request_started = time.perf_counter()
+    g.timings_token = start_request_timings()
+
+
+@app.after_request
+def record_timing(response):
+    """Observe the request latency and attach the Server-Timing header"""
+    started = g.get('request_started')
+    if started is None:
+        return response
+    method = request.method
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    
+    def observe():
+        REQUEST_SECONDS.observe(time.perf_counter() - started, method=method,
+                                endpoint=endpoint, status=response.status_code)
+    
+    if response.is_streamed:
+        # Streamed bodies are produced after this hook; time them to the end
+        response.call_on_close(observe)
+    else:
+        observe()
+        if SERVER_TIMING:
+            response.headers['Server-Timing'] = server_timing_header(
+                request_timings() or {}, time.perf_counter() - started
+            )
+    return response
+
+
+@app.teardown_request
+def end_timing(error=None):
+    token = g.pop('timings_token', None)
+    if token is not None:
+        end_request_timings(token)
 
 
 @app.route('/health', methods=['GET'])
@@ -33,6 +144,130 @@ def health_check():
     return jsonify({"status": "healthy", "message": "Startup Evaluator API is running"})
 
 
+def warm_up() -> dict:
+    """
+    Build every service that is not built yet
+    
+    Returns:
+        dict: Service name -> error message, for services that failed to build
+    """
+    errors = {}
+    for service in SERVICES:
+        try:
+            service.resolve()
+        except Exception as e:
+            errors[service.load_status()['name']] = f"{type(e).__name__}: {e}"
+    return errors
+
+
+# Optionally build the services in the background as soon as the app is
+# imported, while the server is already answering /health. Spawned PDF
+# workers re-import this module as __mp_main__ and must not build them;
+# parent_process() is still None during that import, the name is not.
+if os.environ.get('WARM_UP_ON_START', '0') == '1' and multiprocessing.current_process().name == 'MainProcess':
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
+
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness endpoint
+    Builds the services on the first call and reports 503 until all of them
+    can be built (e.g. while GROQ_API_KEY is missing)
+    """
+    errors = warm_up()
+    body = {"ready": not errors, "services": [service.load_status() for service in SERVICES]}
+    if errors:
+        body["errors"] = errors
+        return jsonify(body), 503
+    return jsonify(body)
+
+
+@app.route('/stats', methods=['GET'])
+def stats():
+    """Runtime counters for the evaluation pipeline"""
+    return jsonify({
+        "cache": llm_service.cache.stats(),
+        "single_flight": llm_service.single_flight.stats(),
+        "model_router": llm_service.router.status(),
+        "hedging": llm_service.hedging.stats(),
+        "rate_limiter": llm_service.rate_limiter.stats(),
+        "prompt_tokens": llm_service.prompt_builder.stats(),
+        "response_validator": llm_service.validator.stats(),
+        "pdf_cache": pdf_generator.cache.stats(),
+        "pdf_jobs": pdf_jobs.stats(),
+        "report_store": pdf_generator.store.stats(),
+        "evaluation_store": evaluation_store.stats(),
+        "leaderboard": leaderboard.stats()
+    })
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Latency histograms and counters in the Prometheus text format"""
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+
+def validate_idea_request(data) -> tuple:
+    """
+    Validate an /evaluate request body
+    
+    Returns:
+        tuple: (idea_text, error_message); error_message is None when valid
+    """
+    if not data or 'idea' not in data:
+        return None, "Missing 'idea' field in request body"
+    
+    idea_text = data['idea'].strip()
+    if not idea_text:
+        return None, "Idea text cannot be empty"
+    return idea_text, None
+
+
+def score_evaluation(evaluation: dict, idea_text: str) -> dict:
+    """
+    Score an LLM evaluation in place and return it
+    """
+    # Score once: total, components and audit trail (pass idea_text for impossible idea detection)
+    breakdown = scoring_service.score(evaluation, idea_text)
+    
+    # If score is very low, add explicit note about impossibility
+    if breakdown.total <= 10:
+        if 'technical_feasibility' in evaluation:
+            evaluation['technical_feasibility'] = (
+                "This idea is technically impossible with current or foreseeable technology. "
+                "The required technology does not exist and may not be possible. " +
+                evaluation.get('technical_feasibility', '')
+            )
+            # Rescore, so every score and trigger describes the text returned
+            breakdown = scoring_service.score(evaluation, idea_text)
+    
+    evaluation['feasibility_score'] = breakdown.total
+    # Component scores for visualization
+    evaluation['component_scores'] = breakdown.components
+    evaluation['score_breakdown'] = breakdown.to_dict()
+    return evaluation
+
+
+def save_evaluation(evaluation: dict, idea_text: str):
+    """
+    Persist a scored evaluation so clients can refer to it by id, and rank it
+    on the leaderboard
+    
+    Returns:
+        str: The evaluation id, or None if it could not be stored
+    """
+    try:
+        evaluation_id = evaluation_store.put(evaluation, idea_text)
+        # Re-adding an already ranked id just replaces it with the same scores
+        leaderboard.add(evaluation_id, evaluation_store.scores_of(evaluation))
+        return evaluation_id
+    except Exception as e:
+        # The evaluation is still returned; only id-based lookups are unavailable
+        log_error(e, "storing evaluation")
+        return None
+
+
 @app.route('/evaluate', methods=['POST'])
 def evaluate_startup():
     """
@@ -42,40 +277,21 @@ def evaluate_startup():
     try:
         # Validate input
         data = request.get_json()
-        if not data or 'idea' not in data:
-            return jsonify({
-                "error": "Missing 'idea' field in request body"
-            }), 400
-        
-        idea_text = data['idea'].strip()
-        if not idea_text:
+        idea_text, error_message = validate_idea_request(data)
+        if error_message:
             return jsonify({
-                "error": "Idea text cannot be empty"
+                "error": error_message
             }), 400
         
-        # Get LLM evaluation
-        evaluation = llm_service.evaluate_idea(idea_text)
-        
-        # Calculate feasibility score (pass idea_text for impossible idea detection)
-        score = scoring_service.calculate_score(evaluation, idea_text)
-        evaluation['feasibility_score'] = score
-        
-        # If score is very low, add explicit note about impossibility
-        if score <= 10:
-            if 'technical_feasibility' in evaluation:
-                evaluation['technical_feasibility'] = (
-                    "This idea is technically impossible with current or foreseeable technology. "
-                    "The required technology does not exist and may not be possible. " +
-                    evaluation.get('technical_feasibility', '')
-                )
-        
-        # Get component scores for visualization
-        component_scores = scoring_service.get_component_scores(evaluation)
-        evaluation['component_scores'] = component_scores
+        # Get LLM evaluation ("use_cache": false forces a fresh evaluation)
+        use_cache = data.get('use_cache', True) is not False
+        evaluation = llm_service.evaluate_idea(idea_text, use_cache=use_cache)
+        evaluation = score_evaluation(evaluation, idea_text)
         
         # Return structured response
         return jsonify({
             "success": True,
+            "evaluation_id": save_evaluation(evaluation, idea_text),
             "evaluation": evaluation
         }), 200
         
@@ -83,19 +299,255 @@ def evaluate_startup():
         return handle_errors(e)
 
 
+def ndjson(event: dict) -> str:
+    """Serialize one streamed event as a newline-delimited JSON line"""
+    return json.dumps(event) + "\n"
+
+
+@app.route('/evaluate-stream', methods=['POST'])
+def evaluate_startup_stream():
+    """
+    Streaming evaluation endpoint (newline-delimited JSON)
+    Emits each evaluation field as soon as the LLM has generated it, each
+    component score once the fields it depends on have arrived, and finally
+    the complete scored evaluation
+    """
+    data = request.get_json(silent=True)
+    idea_text, error_message = validate_idea_request(data)
+    if error_message:
+        return jsonify({
+            "error": error_message
+        }), 400
+    use_cache = data.get('use_cache', True) is not False
+    
+    def generate():
+        received = {}
+        pending = dict(scoring_service.component_fields)
+        try:
+            for kind, field, value in llm_service.evaluate_idea_stream(idea_text, use_cache=use_cache):
+                if kind == 'field':
+                    received[field] = value
+                    yield ndjson({"type": "field", "field": field, "value": value})
+                    
+                    # Score every component whose inputs are now complete
+                    for component, fields in list(pending.items()):
+                        if all(f in received for f in fields):
+                            del pending[component]
+                            yield ndjson({
+                                "type": "component_score",
+                                "component": component,
+                                "score": scoring_service.score_component(component, received)
+                            })
+                else:
+                    evaluation = score_evaluation(value, idea_text)
+                    yield ndjson({"type": "result", "success": True,
+                                  "evaluation_id": save_evaluation(evaluation, idea_text),
+                                  "evaluation": evaluation})
+        except Exception as e:
+            # Headers are already sent, so report the error in-band
+            yield ndjson({"type": "error", **error_payload(e)})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def evaluate_batch_item(index: int, item, use_cache: bool) -> dict:
+    """
+    Evaluate and score one batch item; failures become per-item errors
+    """
+    data = {'idea': item} if isinstance(item, str) else item
+    result = {"index": index}
+    if isinstance(data, dict) and 'id' in data:
+        result["id"] = data['id']
+    try:
+        idea_text, error_message = validate_idea_request(data if isinstance(data, dict) else None)
+        if error_message:
+            return {**result, "success": False, "error": error_message, "error_type": "ValidationError"}
+        
+        evaluation = llm_service.evaluate_idea(idea_text, use_cache=use_cache)
+        evaluation = score_evaluation(evaluation, idea_text)
+        return {**result, "success": True, "evaluation_id": save_evaluation(evaluation, idea_text),
+                "evaluation": evaluation}
+    except Exception as e:
+        return {**result, **error_payload(e)}
+
+
+@app.route('/evaluate-batch', methods=['POST'])
+def evaluate_batch():
+    """
+    Batch evaluation endpoint
+    Accepts a list of ideas and evaluates them on a bounded worker pool.
+    Results are streamed as newline-delimited JSON in completion order
+    (or returned as one JSON list in input order with "stream": false)
+    """
+    data = request.get_json(silent=True)
+    ideas = data.get('ideas') if isinstance(data, dict) else None
+    if not isinstance(ideas, list) or not ideas:
+        return jsonify({
+            "error": "Missing 'ideas' list in request body"
+        }), 400
+    if len(ideas) > BATCH_MAX_ITEMS:
+        return jsonify({
+            "error": f"Too many ideas in one batch (maximum {BATCH_MAX_ITEMS})"
+        }), 400
+    
+    use_cache = data.get('use_cache', True) is not False
+    started = time.monotonic()
+    futures = [
+        batch_pool.submit(evaluate_batch_item, index, item, use_cache)
+        for index, item in enumerate(ideas)
+    ]
+    
+    def summary(results) -> dict:
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "elapsed_seconds": round(time.monotonic() - started, 3)
+        }
+    
+    if data.get('stream', True) is False:
+        results = [future.result() for future in futures]
+        return jsonify({"success": True, "results": results, "summary": summary(results)}), 200
+    
+    def generate():
+        results = []
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                yield ndjson({"type": "item", **result})
+            yield ndjson({"type": "summary", **summary(results)})
+        finally:
+            # Client went away: don't spend upstream calls on queued items
+            for future in futures:
+                future.cancel()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/evaluations/<evaluation_id>', methods=['GET'])
+def get_evaluation(evaluation_id):
+    """
+    A stored evaluation by id
+    Ids are content hashes, so the id is a strong ETag and the response
+    never changes; If-None-Match requests get 304 Not Modified
+    """
+    evaluation_json = evaluation_store.get_json(evaluation_id)
+    if evaluation_json is None:
+        return jsonify({"error": "Unknown evaluation id"}), 404
+    
+    # The stored JSON is spliced in as-is instead of being decoded and re-encoded
+    body = f'{{"success": true, "evaluation_id": {json.dumps(evaluation_id)}, "evaluation": {evaluation_json}}}'
+    response = Response(body, mimetype='application/json')
+    response.set_etag(evaluation_id)
+    response.headers['Cache-Control'] = 'private, max-age=31536000, immutable'
+    return response.make_conditional(request)
+
+
+def _query_int(name: str, default: int) -> int:
+    """Integer query parameter (ValueError with a client-facing message if malformed)"""
+    value = request.args.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer")
+
+
+@app.route('/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """
+    Top-ranked stored evaluations by the overall score or one component
+    
+    Query parameters: metric (default feasibility_score), limit (default 10,
+    at most LEADERBOARD_MAX_LIMIT), offset, min_score and max_score (0-100)
+    """
+    metric = request.args.get('metric', 'feasibility_score')
+    try:
+        limit = _query_int('limit', 10)
+        offset = _query_int('offset', 0)
+        min_score = _query_int('min_score', 0)
+        max_score = _query_int('max_score', 100)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if limit < 0 or offset < 0:
+        return jsonify({"error": "'limit' and 'offset' must not be negative"}), 400
+    
+    try:
+        board = leaderboard.top(metric, min(limit, LEADERBOARD_MAX_LIMIT), offset, min_score, max_score)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"success": True, **board})
+
+
+@app.route('/leaderboard/<evaluation_id>', methods=['GET'])
+def get_standing(evaluation_id):
+    """Rank and percentile of one stored evaluation on every metric"""
+    standing = leaderboard.standing(evaluation_id)
+    if standing is None:
+        if leaderboard.loading:
+            return jsonify({"error": "Leaderboard is still loading"}), 503, {'Retry-After': '5'}
+        return jsonify({"error": "Unknown evaluation id"}), 404
+    return jsonify({"success": True, "evaluation_id": evaluation_id, "standing": standing})
+
+
 @app.route('/generate-pdf', methods=['POST'])
 def generate_pdf():
     """
-    Generate PDF report from evaluation
+    Generate PDF report from evaluation (or "evaluation_id" of a stored one)
+    With "stream": true (or an Accept header preferring application/pdf) the
+    report is rendered in memory and returned as the response body; with
+    "async": true it is queued for a worker process and a job id is
+    returned; otherwise it is written under reports/ and its path is returned
     """
     try:
         data = request.get_json()
-        if not data or 'evaluation' not in data:
+        if data and 'evaluation_id' in data:
+            evaluation = evaluation_store.get(str(data['evaluation_id']))
+            if evaluation is None:
+                return jsonify({"error": "Unknown evaluation id"}), 404
+        elif data and 'evaluation' in data:
+            evaluation = data['evaluation']
+        else:
             return jsonify({
-                "error": "Missing 'evaluation' field in request body"
+                "error": "Missing 'evaluation' or 'evaluation_id' field in request body"
             }), 400
         
-        evaluation = data['evaluation']
+        if data.get('async') is True:
+            try:
+                job_id = pdf_jobs.submit(evaluation)
+            except QueueFull as e:
+                return jsonify({"success": False, "error": str(e)}), 503, {'Retry-After': '5'}
+            status_url = f"/pdf-jobs/{job_id}"
+            return jsonify({
+                "success": True,
+                "job_id": job_id,
+                "status_url": status_url,
+                "download_url": f"{status_url}/download"
+            }), 202, {'Location': status_url}
+        
+        wants_pdf = request.accept_mimetypes.best_match(['application/json', 'application/pdf']) == 'application/pdf'
+        if data.get('stream') is True or wants_pdf:
+            pdf_bytes = pdf_generator.generate_report_bytes(evaluation)
+            return Response(
+                pdf_bytes,
+                mimetype='application/pdf',
+                headers={
+                    'Content-Disposition': f'attachment; filename="{pdf_generator.report_filename()}"',
+                    'Cache-Control': 'no-store'
+                }
+            )
+        
         pdf_path = pdf_generator.generate_report(evaluation)
         
         # Return PDF as base64 or file path
@@ -109,6 +561,132 @@ def generate_pdf():
         return handle_errors(e)
 
 
+@app.route('/export-pdf', methods=['POST'])
+def export_pdf():
+    """
+    Bulk PDF export
+    Renders many evaluations on the PDF worker processes and returns either
+    a ZIP archive streamed as reports finish ("format": "zip") or a single
+    PDF with a table of contents ("format": "pdf"); items may be evaluation
+    objects or ids of stored evaluations
+    """
+    try:
+        data = request.get_json(silent=True)
+        evaluations = data.get('evaluations') if isinstance(data, dict) else None
+        if not isinstance(evaluations, list) or not evaluations:
+            return jsonify({
+                "error": "Missing 'evaluations' list in request body"
+            }), 400
+        if not all(isinstance(evaluation, (dict, str)) for evaluation in evaluations):
+            return jsonify({
+                "error": "Every item in 'evaluations' must be an evaluation object or an evaluation id"
+            }), 400
+        if len(evaluations) > PDF_EXPORT_MAX_ITEMS:
+            return jsonify({
+                "error": f"Too many evaluations in one export (maximum {PDF_EXPORT_MAX_ITEMS})"
+            }), 400
+        export_format = data.get('format', 'zip')
+        if export_format not in ('zip', 'pdf'):
+            return jsonify({
+                "error": "Unsupported format (use 'zip' or 'pdf')"
+            }), 400
+        if export_format == 'pdf' and len(evaluations) > PDF_COMBINED_MAX_ITEMS:
+            return jsonify({
+                "error": f"Too many evaluations for one combined PDF (maximum {PDF_COMBINED_MAX_ITEMS}); "
+                         "use format 'zip' for larger exports"
+            }), 400
+        
+        # Look up referenced evaluations in one query
+        ids = [item for item in evaluations if isinstance(item, str)]
+        if ids:
+            stored = evaluation_store.get_many(ids)
+            unknown = [evaluation_id for evaluation_id in ids if evaluation_id not in stored]
+            if unknown:
+                return jsonify({
+                    "error": "Unknown evaluation ids",
+                    "unknown_ids": unknown
+                }), 404
+            evaluations = [stored[item] if isinstance(item, str) else item for item in evaluations]
+        
+        date_stamp = time.strftime('%Y%m%d')
+        if export_format == 'pdf':
+            # One document (shared page numbers and table of contents):
+            # rendered serially by a single worker and held in memory
+            return Response(
+                pdf_jobs.render_combined(evaluations),
+                mimetype='application/pdf',
+                headers={
+                    'Content-Disposition': f'attachment; filename="startup_evaluations_{date_stamp}.pdf"',
+                    'Cache-Control': 'no-store'
+                }
+            )
+        
+        width = len(str(len(evaluations)))
+        renders = pdf_jobs.render_many(evaluations)
+        
+        def members():
+            errors = []
+            for index, pdf_bytes, error in renders:
+                if error is not None:
+                    errors.append(f"{index + 1}: {error}")
+                    continue
+                yield f"{index + 1:0{width}d}_startup_evaluation.pdf", pdf_bytes
+            # Failed renders are listed in the archive instead of breaking the stream
+            if errors:
+                yield "ERRORS.txt", "\n".join(errors).encode('utf-8')
+        
+        return Response(
+            stream_with_context(stream_zip(members())),
+            mimetype='application/zip',
+            headers={
+                'Content-Disposition': f'attachment; filename="startup_evaluations_{date_stamp}.zip"',
+                'Cache-Control': 'no-store',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+        
+    except QueueFull as e:
+        return jsonify({"success": False, "error": str(e)}), 503, {'Retry-After': '5'}
+    except RenderTimeout as e:
+        return jsonify({"success": False, "error": str(e)}), 504
+    except Exception as e:
+        return handle_errors(e)
+
+
+@app.route('/pdf-jobs/<job_id>', methods=['GET'])
+def pdf_job_status(job_id):
+    """
+    Status of a background PDF job: queued, running, done or failed
+    """
+    status = pdf_jobs.get(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown or expired PDF job"}), 404
+    if status['status'] == 'done':
+        status['download_url'] = f"/pdf-jobs/{job_id}/download"
+    return jsonify({"success": True, **status}), 200
+
+
+@app.route('/pdf-jobs/<job_id>/download', methods=['GET'])
+def pdf_job_download(job_id):
+    """
+    Download the PDF of a finished background job
+    """
+    status = pdf_jobs.get(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown or expired PDF job"}), 404
+    pdf_bytes = pdf_jobs.result(job_id)
+    if pdf_bytes is None:
+        return jsonify({"error": f"PDF job is {status['status']}", **status}), 409
+    return Response(
+        pdf_bytes,
+        mimetype='application/pdf',
+        headers={
+            'Content-Disposition': f'attachment; filename="{pdf_generator.report_filename()}"',
+            'Cache-Control': 'no-store'
+        }
+    )
+
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,124 @@
+"""
+Startup Evaluator - ASGI entry point
+Serves POST /evaluate natively async so a single process can hold hundreds
+of in-flight evaluations; every other route is delegated to the Flask app.
+
+Run with:
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from asgiref.wsgi import WsgiToAsgi
+from app import (SERVER_TIMING, app, llm_service, pdf_jobs, save_evaluation, score_evaluation,
+                 validate_idea_request)
+from utils.error_handler import handle_errors
+from utils.metrics import REQUEST_SECONDS, request_timings, server_timing_header, start_request_timings
+
+
+flask_application = WsgiToAsgi(app)
+
+
+async def _read_body(receive) -> bytes:
+    """Read the full request body from the ASGI receive channel"""
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    return body
+
+
+async def _send_json(send, payload: bytes, status: int, started: float, retry_after: str = None) -> None:
+    """
+    Send a JSON response (with the same CORS header Flask-CORS adds) and
+    record its latency and stage timings like the Flask app does
+    """
+    headers = [
+        (b'content-type', b'application/json'),
+        (b'content-length', str(len(payload)).encode()),
+        (b'access-control-allow-origin', b'*'),
+    ]
+    if retry_after:
+        headers.append((b'retry-after', retry_after.encode()))
+    elapsed = time.perf_counter() - started
+    REQUEST_SECONDS.observe(elapsed, method='POST', endpoint='/evaluate', status=status)
+    if SERVER_TIMING:
+        timings = server_timing_header(request_timings() or {}, elapsed)
+        headers.append((b'server-timing', timings.encode()))
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': headers,
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+async def evaluate_startup(scope, receive, send) -> None:
+    """
+    Async /evaluate endpoint
+    Same request/response contract as the Flask view in app.py
+    """
+    # Each request runs in its own task, so the timings need no reset
+    started = time.perf_counter()
+    start_request_timings()
+    try:
+        body = await _read_body(receive)
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+
+        # Validate input
+        idea_text, error_message = validate_idea_request(data)
+        if error_message:
+            await _send_json(send, json.dumps({"error": error_message}).encode(), 400, started)
+            return
+
+        # Get LLM evaluation without blocking the event loop
+        use_cache = data.get('use_cache', True) is not False
+        evaluation = await llm_service.evaluate_idea_async(idea_text, use_cache=use_cache)
+        evaluation = score_evaluation(evaluation, idea_text)
+
+        # SQLite write (and leaderboard update) on a worker thread, off the event loop
+        evaluation_id = await asyncio.to_thread(save_evaluation, evaluation, idea_text)
+        body = {"success": True, "evaluation_id": evaluation_id, "evaluation": evaluation}
+        await _send_json(send, json.dumps(body).encode(), 200, started)
+
+    except asyncio.CancelledError:
+        # Cancelled mid-request (e.g. server shutdown): still answer if the
+        # connection allows it, then let the cancellation propagate
+        body = {"success": False, "error": "Request was cancelled", "error_type": "CancelledError"}
+        with contextlib.suppress(Exception):
+            await _send_json(send, json.dumps(body).encode(), 503, started)
+        raise
+    except Exception as e:
+        with app.app_context():
+            response, status = handle_errors(e)
+            await _send_json(send, response.get_data(), status, started,
+                             retry_after=response.headers.get('Retry-After'))
+
+
+async def _lifespan(receive, send) -> None:
+    """Acknowledge server startup/shutdown (services are built on first use; PDF workers are stopped on shutdown)"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            pdf_jobs.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send) -> None:
+    """ASGI application: async /evaluate, everything else via Flask"""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+    elif scope['type'] == 'http' and scope['path'] == '/evaluate' and scope['method'] == 'POST':
+        await evaluate_startup(scope, receive, send)
+    else:
+        await flask_application(scope, receive, send)
@@ -0,0 +1,58 @@
+"""
+PDF Render Benchmark - Render time per report before and after style reuse and caching
+
+"before" rebuilds the style sheet for every report (the old behaviour),
+"shared styles" renders with the styles built once, and "cache hit" is a
+repeat download of an already rendered evaluation.
+
+Run from backend/:
+    python -m benchmarks.bench_pdf_render [count]
+"""
+
+import sys
+import time
+from services.pdf_generator import PDFGenerator, build_report_styles
+from benchmarks.corpus import generate_evaluations
+
+
+class _PerCallStyles(PDFGenerator):
+    """Renders like the original generator: a fresh style sheet per report"""
+
+    def _render(self, target, evaluation, date_str):
+        self.styles = build_report_styles()
+        super()._render(target, evaluation, date_str)
+
+
+def _per_report_ms(render, evaluations) -> float:
+    start = time.perf_counter()
+    for evaluation in evaluations:
+        render(evaluation)
+    return (time.perf_counter() - start) / len(evaluations) * 1000
+
+
+def run(count: int) -> None:
+    evaluations, _ = generate_evaluations(count)
+    for index, evaluation in enumerate(evaluations):
+        evaluation['feasibility_score'] = (index * 37) % 101
+    date_str = "January 01, 2025"
+
+    before = _PerCallStyles()
+    after = PDFGenerator()
+
+    # Warm up font metrics and imports so neither variant pays for them
+    after.render_bytes(evaluations[0], date_str)
+
+    before_ms = _per_report_ms(lambda e: before.render_bytes(e, date_str), evaluations)
+    shared_ms = _per_report_ms(lambda e: after.render_bytes(e, date_str), evaluations)
+
+    for evaluation in evaluations:
+        after.generate_report_bytes(evaluation)
+    cached_ms = _per_report_ms(after.generate_report_bytes, evaluations)
+
+    print(f"n={count}  before: {before_ms:7.3f} ms/report  "
+          f"shared styles: {shared_ms:7.3f} ms/report ({before_ms / shared_ms:4.2f}x)  "
+          f"cache hit: {cached_ms:7.4f} ms/report ({before_ms / cached_ms:6.0f}x)")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
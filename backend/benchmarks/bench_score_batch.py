@@ -0,0 +1,42 @@
+"""
+Batch Scoring Benchmark - Compares per-item calculate_score with score_batch
+
+Run from backend/:
+    python -m benchmarks.bench_score_batch [sizes...]
+"""
+
+import sys
+import time
+import numpy as np
+from services.scoring import ScoringService
+from benchmarks.corpus import generate_evaluations
+
+
+def run(size: int, scoring_service: ScoringService) -> None:
+    evaluations, ideas = generate_evaluations(size)
+
+    start = time.perf_counter()
+    scalar = [scoring_service.calculate_score(e, i) for e, i in zip(evaluations, ideas)]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    features = scoring_service.extract_features(evaluations, ideas)
+    extract_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scoring_service.score_features(features)
+    score_time = time.perf_counter() - start
+
+    assert np.array_equal(batch.totals, np.array(scalar)), "batch results differ from calculate_score"
+
+    batch_time = extract_time + score_time
+    print(f"n={size:>7}  calculate_score loop: {scalar_time:8.3f}s  "
+          f"score_batch: {batch_time:8.3f}s ({scalar_time / batch_time:4.1f}x)  "
+          f"re-weight only: {score_time * 1000:8.1f}ms ({scalar_time / score_time:6.0f}x)")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    service = ScoringService()
+    for n in sizes:
+        run(n, service)
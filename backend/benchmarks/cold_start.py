@@ -0,0 +1,84 @@
+"""
+Cold Start Profile - Import-time breakdown and time to the first served requests
+
+Starts a fresh interpreter with -X importtime, imports the app, and sends the
+first /health, /ready, /evaluate and /generate-pdf requests through the Flask
+test client (on the fake LLM backend, so no API key or network is needed).
+Prints the slowest imports and how long each first request took.
+
+Run from backend/:
+    python -m benchmarks.cold_start [--top 15]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Runs in the child interpreter; prints one JSON line of timings
+_CHILD = r'''
+import json, time
+started = time.perf_counter()
+from app import app
+timings = {"import app": time.perf_counter() - started}
+client = app.test_client()
+requests = [
+    ("GET /health", lambda: client.get("/health")),
+    ("POST /evaluate", lambda: client.post("/evaluate", json={"idea": "A scheduling app for small clinics"})),
+    ("POST /generate-pdf", lambda: client.post("/generate-pdf", json={
+        "evaluation": {"executive_summary": "Cold start", "feasibility_score": 50}, "stream": True})),
+    ("GET /ready", lambda: client.get("/ready")),
+]
+for name, send in requests:
+    request_started = time.perf_counter()
+    status = send().status_code
+    timings[f"first {name} ({status})"] = time.perf_counter() - request_started
+print(json.dumps(timings))
+'''
+
+
+def parse_importtime(stderr: str):
+    """(cumulative microseconds, depth, module) for each line of -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest imports to list')
+    args = parser.parse_args()
+
+    env = dict(os.environ, LLM_BACKEND='fake', FAKE_LLM_LATENCY='fixed:0')
+    started = time.perf_counter()
+    child = subprocess.run([sys.executable, '-X', 'importtime', '-c', _CHILD],
+                           capture_output=True, text=True, env=env, cwd=os.getcwd())
+    wall = time.perf_counter() - started
+    if child.returncode != 0:
+        print(child.stderr[-2000:])
+        return child.returncode
+
+    timings = json.loads(child.stdout.strip().splitlines()[-1])
+    rows = parse_importtime(child.stderr)
+
+    # Includes the imports deferred to the first requests (groq, ReportLab, ...)
+    print("Slowest imports (cumulative, indented by nesting):")
+    for cumulative, depth, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {'  ' * max(0, depth - 1)}{name}")
+
+    print("\nCold start:")
+    for name, seconds in timings.items():
+        print(f"  {seconds * 1000:8.1f} ms  {name}")
+    print(f"  {wall * 1000:8.1f} ms  process start to exit (interpreter included)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Benchmark Corpus - Generates realistic, reproducible evaluations offline
+"""
+
+import random
+from typing import Dict, List, Tuple
+
+
+_SENTENCES = {
+    'problem_statement': [
+        "Small businesses struggle to manage invoices and late payments, a clear pain point that costs them time.",
+        "Remote teams lack a simple way to share knowledge, which is a significant issue for onboarding.",
+        "Patients in rural areas need faster access to specialists, and the problem is well-defined.",
+        "The problem is vague and the target need is unclear from the description.",
+        "Students find it difficult to track deadlines across many platforms.",
+    ],
+    'market_potential': [
+        "The market is large and growing, estimated at several billion dollars globally.",
+        "Demand is expanding quickly among mid-sized companies with millions of potential users.",
+        "This is a niche market with limited demand and small budgets.",
+        "The space is saturated with established competitors and low margins.",
+        "There is substantial opportunity in emerging economies.",
+    ],
+    'technical_feasibility': [
+        "The product is feasible with existing cloud technology and standard web frameworks.",
+        "Building this requires complex machine learning that is still experimental.",
+        "Core components are proven and available as open-source libraries.",
+        "This requires a breakthrough in battery chemistry; research needed before launch.",
+        "Reading dreams is impossible with current technology and remains science fiction.",
+    ],
+    'innovation_uniqueness': [
+        "The approach is novel and differentiated, with a clear first-mover advantage.",
+        "Many similar tools exist and the market is competitive.",
+        "The idea is innovative in how it combines scheduling and payments.",
+        "It is a unique take on an existing workflow.",
+    ],
+    'risks_challenges': [
+        "Regulatory approval and legal compliance pose high risk.",
+        "Competition from incumbents is strong and customer acquisition is uncertain.",
+        "The main risk is execution speed; otherwise risks are low risk and manageable.",
+        "Funding is limited and the business model is unproven.",
+    ],
+    'list_items': [
+        "Strong founding team with domain expertise",
+        "Scalable subscription model with network effect",
+        "Clear value proposition for busy professionals",
+        "Weak distribution strategy",
+        "High customer acquisition cost",
+        "Replicable playbook across regions",
+        "Poor differentiation from free alternatives",
+    ],
+}
+
+_IDEAS = [
+    "An app that helps freelancers send invoices and chase late payments automatically.",
+    "A marketplace connecting rural clinics with remote specialists over video.",
+    "A device that lets you read your dreams and convert them into movies.",
+    "A browser extension that summarizes long meetings for remote teams.",
+    "A subscription box for locally roasted coffee.",
+]
+
+
+def _paragraph(rng: random.Random, field: str, sentences: int) -> str:
+    return ' '.join(rng.choice(_SENTENCES[field]) for _ in range(sentences))
+
+
+def generate_evaluations(count: int, seed: int = 42, sentences: int = 2) -> Tuple[List[Dict], List[str]]:
+    """
+    Generate evaluations and matching idea texts
+
+    Args:
+        count: Number of evaluations
+        seed: Random seed, so runs are comparable
+        sentences: Sentences per text field (controls evaluation length)
+
+    Returns:
+        tuple: (evaluations, idea_texts)
+    """
+    rng = random.Random(seed)
+    evaluations = []
+    ideas = []
+    for _ in range(count):
+        length = max(1, sentences + rng.randint(-1, 1))
+        evaluations.append({
+            'executive_summary': _paragraph(rng, 'problem_statement', 1),
+            'problem_statement': _paragraph(rng, 'problem_statement', length),
+            'target_users': "Small and medium businesses.",
+            'market_potential': _paragraph(rng, 'market_potential', length),
+            'technical_feasibility': _paragraph(rng, 'technical_feasibility', length),
+            'innovation_uniqueness': _paragraph(rng, 'innovation_uniqueness', length),
+            'risks_challenges': _paragraph(rng, 'risks_challenges', length),
+            'strengths': rng.sample(_SENTENCES['list_items'], 3),
+            'weaknesses': rng.sample(_SENTENCES['list_items'], 3),
+            'improvement_suggestions': rng.sample(_SENTENCES['list_items'], 3),
+            'final_recommendation': "Validate demand with a small pilot before scaling.",
+        })
+        ideas.append(rng.choice(_IDEAS))
+    return evaluations, ideas
@@ -0,0 +1,148 @@
+"""
+Load Test - Latency percentiles and throughput per endpoint at fixed concurrency
+
+Each endpoint is driven with a fixed number of requests at each concurrency
+level; every /evaluate request carries a unique idea with use_cache off, so
+each one reaches the LLM backend. By default the app runs in-process with
+LLM_BACKEND=fake (see services/fake_groq.py); --url targets a running server
+instead, whatever backend it was started with.
+
+Run from backend/:
+    python -m benchmarks.load_test [--latency lognormal:0.8:0.4] [--requests 200]
+        [--endpoints evaluate,evaluate-stream,generate-pdf,health] [--json out.json] [levels...]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import generate_evaluations
+from services.model_router import percentile
+
+_EVALUATION = generate_evaluations(1)[0][0]
+
+
+def _idea(n: int) -> Dict:
+    return {"idea": f"Load test idea {n} ({uuid.uuid4().hex[:8]}): an app that helps small clinics "
+                    f"reduce missed appointments with automated reminders", "use_cache": False}
+
+
+def _pdf(n: int) -> Dict:
+    # A unique summary per request keeps the PDF cache from answering
+    return {"evaluation": {**_EVALUATION, "feasibility_score": n % 101,
+                           "executive_summary": f"Load test report {n} ({uuid.uuid4().hex[:8]})"},
+            "stream": True}
+
+
+# Each endpoint: (method, path, payload for request n)
+ENDPOINTS = {
+    'evaluate': ('POST', '/evaluate', _idea),
+    'evaluate-stream': ('POST', '/evaluate-stream', _idea),
+    'generate-pdf': ('POST', '/generate-pdf', _pdf),
+    'health': ('GET', '/health', lambda n: None)
+}
+
+
+def _in_process_sender() -> Callable[[str, str, Dict], Tuple[int, bytes]]:
+    from app import app
+
+    def send(method, path, payload):
+        response = app.test_client().open(path, method=method, json=payload)
+        # Reading the body drains streamed responses to the end
+        return response.status_code, response.get_data()
+    return send
+
+
+def _http_sender(url: str) -> Callable[[str, str, Dict], Tuple[int, bytes]]:
+    import httpx
+    client = httpx.Client(base_url=url, timeout=None)
+
+    def send(method, path, payload):
+        response = client.request(method, path, json=payload)
+        return response.status_code, response.content
+    return send
+
+
+def run_level(send, endpoint: str, concurrency: int, requests: int) -> Dict:
+    """Send `requests` requests with `concurrency` in flight and summarise latencies"""
+    method, path, payload = ENDPOINTS[endpoint]
+    latencies: List[float] = []
+    errors = 0
+
+    def one(n):
+        start = time.perf_counter()
+        try:
+            status, _ = send(method, path, payload(n))
+        except Exception:
+            status = None
+        return time.perf_counter() - start, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, status in pool.map(one, range(requests)):
+            latencies.append(latency)
+            if status != 200:
+                errors += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': requests,
+        'errors': errors,
+        'rps': round(requests / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', help='Base URL of a running server (default: in-process app)')
+    parser.add_argument('--latency', default='lognormal:0.8:0.4', help='FakeGroq latency distribution')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='FakeGroq 503 rate')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='FakeGroq 429 rate')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and level')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS), help='Comma-separated endpoints')
+    parser.add_argument('--json', help='Also write the results to this file')
+    parser.add_argument('levels', type=int, nargs='*', default=[1, 10, 50])
+    args = parser.parse_args()
+
+    if args.url:
+        send = _http_sender(args.url)
+    else:
+        # Configure the fake backend before the app (and LLMService) is imported
+        os.environ['LLM_BACKEND'] = 'fake'
+        os.environ['FAKE_LLM_LATENCY'] = args.latency
+        os.environ['FAKE_LLM_ERROR_RATE'] = str(args.error_rate)
+        os.environ['FAKE_LLM_RATE_LIMIT_RATE'] = str(args.rate_limit_rate)
+        os.environ.setdefault('NEAR_DUPLICATE_THRESHOLD', '0')
+        send = _in_process_sender()
+
+    results = []
+    print(f"{'endpoint':<16} {'conc':>5} {'reqs':>6} {'errors':>6} {'req/s':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint in args.endpoints.split(','):
+        if endpoint not in ENDPOINTS:
+            parser.error(f"unknown endpoint: {endpoint} (choose from {', '.join(ENDPOINTS)})")
+        for level in args.levels:
+            result = run_level(send, endpoint, level, args.requests)
+            results.append(result)
+            print(f"{endpoint:<16} {level:>5} {result['requests']:>6} {result['errors']:>6} "
+                  f"{result['rps']:>9.1f} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+                  f"{result['p99_ms']:>9.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'latency': None if args.url else args.latency, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Async vs Sync /evaluate Load Test - Throughput at fixed concurrency levels
+
+Groq is replaced by FakeGroq with a fixed completion latency, so the
+comparison is purely about how many evaluations one process can keep in
+flight. The sync baseline is the Flask app behind a fixed pool of worker
+threads (like gunicorn --threads); the async run drives asgi.application.
+
+Run from backend/:
+    python -m benchmarks.load_test_async [--latency 1.0] [--workers 16] [levels...]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('LLM_BACKEND', 'fake')
+os.environ.setdefault('NEAR_DUPLICATE_THRESHOLD', '0')
+
+import httpx
+from app import app, llm_service
+from asgi import application
+from services.fake_groq import FakeGroq
+
+
+def install_fake_groq(latency: float) -> None:
+    """Replace both Groq clients with fixed-latency stand-ins"""
+    llm_service.client = FakeGroq(latency=f"fixed:{latency}")
+    llm_service.async_client = FakeGroq(latency=f"fixed:{latency}", asynchronous=True)
+
+
+def _payload(n: int) -> dict:
+    return {"idea": f"Load test idea number {n}", "use_cache": False}
+
+
+def run_sync(concurrency: int, workers: int) -> float:
+    """Requests per second for the Flask app on a fixed worker pool"""
+    def post(n):
+        response = app.test_client().post('/evaluate', json=_payload(n))
+        assert response.status_code == 200, response.get_data()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(workers, concurrency)) as pool:
+        list(pool.map(post, range(concurrency)))
+    return concurrency / (time.perf_counter() - start)
+
+
+async def run_async(concurrency: int) -> float:
+    """Requests per second for the ASGI app in one event loop"""
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=None) as client:
+        async def post(n):
+            response = await client.post('/evaluate', json=_payload(n))
+            assert response.status_code == 200, response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(post(n) for n in range(concurrency)))
+        return concurrency / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=1.0, help='Simulated Groq latency in seconds')
+    parser.add_argument('--workers', type=int, default=16, help='Sync worker threads')
+    parser.add_argument('levels', type=int, nargs='*', default=[50, 200, 500])
+    args = parser.parse_args()
+
+    install_fake_groq(args.latency)
+    print(f"latency={args.latency}s sync_workers={args.workers}")
+    for level in args.levels:
+        sync_rps = run_sync(level, args.workers)
+        async_rps = asyncio.run(run_async(level))
+        print(f"concurrency={level:>4}  sync: {sync_rps:7.1f} req/s  async: {async_rps:7.1f} req/s  "
+              f"({async_rps / sync_rps:5.1f}x)")
@@ -0,0 +1,166 @@
+"""
+Benchmark Suite - Timed scoring and PDF cases with a regression gate
+
+Times calculate_score, get_component_scores, _check_impossible_idea and
+generate_report per evaluation over a generated corpus of short, medium and
+long evaluations. Everything runs offline: the corpus comes from
+benchmarks.corpus and generate_report writes to a temporary directory with
+the PDF cache disabled, so every call renders.
+
+Each case is run for several rounds and the fastest round is kept, which
+is the least noisy estimate on a shared machine. Baselines are
+machine-specific: record one on the machine (or CI runner class) that runs
+the comparison.
+
+Run from backend/:
+    python -m benchmarks.suite --save        # record benchmarks/baseline.json
+    python -m benchmarks.suite               # compare; exit 1 on a regression
+    python -m benchmarks.suite --threshold 0.1 --cases calculate_score
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import generate_evaluations
+from services.pdf_cache import PDFCache
+from services.pdf_generator import PDFGenerator
+from services.report_store import ReportStore
+from services.scoring import ScoringService
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Sentences per text field for the short, medium and long evaluations
+LENGTHS = (1, 3, 8)
+
+
+def build_corpus(count: int) -> List[Tuple[Dict, str]]:
+    """(evaluation, idea_text) pairs, evenly split across LENGTHS"""
+    corpus = []
+    for seed, sentences in enumerate(LENGTHS):
+        evaluations, ideas = generate_evaluations(max(1, count // len(LENGTHS)), seed=seed, sentences=sentences)
+        corpus.extend(zip(evaluations, ideas))
+    return corpus
+
+
+def _report_generator() -> PDFGenerator:
+    """Generator writing to a fresh temporary store, with no PDF cache"""
+    directory = tempfile.mkdtemp(prefix='bench-reports-')
+    generator = PDFGenerator()
+    generator.output_dir = directory
+    generator.store = ReportStore(directory, max_bytes=0, max_files=0, max_age_seconds=0)
+    generator.cache = PDFCache(max_bytes=0)
+    return generator
+
+
+def cases(scoring_service: ScoringService) -> Dict[str, Callable]:
+    """Benchmark name -> function of (state, evaluation, idea_text)"""
+    return {
+        'calculate_score': lambda state, e, i: scoring_service.calculate_score(e, i),
+        'get_component_scores': lambda state, e, i: scoring_service.get_component_scores(e, i),
+        '_check_impossible_idea': lambda state, e, i: scoring_service._check_impossible_idea(i, e),
+        'generate_report': lambda state, e, i: state.generate_report(e)
+    }
+
+
+# Cases that need per-round state, and how many corpus items each round uses
+_ROUND_STATE = {'generate_report': _report_generator}
+_ITEM_LIMIT = {'generate_report': 30}
+
+
+def run_case(name: str, fn: Callable, corpus: List[Tuple[Dict, str]], rounds: int) -> float:
+    """Fastest per-item time over `rounds` passes, in microseconds"""
+    items = corpus[:_ITEM_LIMIT.get(name, len(corpus))]
+    # Spread the lengths evenly across a truncated corpus too
+    if len(items) < len(corpus):
+        step = len(corpus) / len(items)
+        items = [corpus[int(k * step)] for k in range(len(items))]
+
+    best = float('inf')
+    # The first round is a warm-up (imports, font metrics, keyword tables)
+    for round_number in range(rounds + 1):
+        state = _ROUND_STATE[name]() if name in _ROUND_STATE else None
+        try:
+            start = time.perf_counter()
+            for evaluation, idea in items:
+                fn(state, evaluation, idea)
+            elapsed = time.perf_counter() - start
+        finally:
+            if isinstance(state, PDFGenerator):
+                shutil.rmtree(state.output_dir, ignore_errors=True)
+        if round_number:
+            best = min(best, elapsed / len(items))
+    return best * 1e6
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Names of cases slower than baseline by more than threshold (a fraction)"""
+    return [
+        name for name, micros in results.items()
+        if name in baseline and micros > baseline[name] * (1 + threshold)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=300, help='Evaluations in the corpus')
+    parser.add_argument('--rounds', type=int, default=10, help='Passes per case (fastest is kept)')
+    parser.add_argument('--cases', help='Comma-separated subset of cases')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file')
+    parser.add_argument('--save', action='store_true', help='Record the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown before failing, as a fraction (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count)
+    all_cases = cases(ScoringService())
+    selected = args.cases.split(',') if args.cases else list(all_cases)
+    for name in selected:
+        if name not in all_cases:
+            parser.error(f"unknown case: {name} (choose from {', '.join(all_cases)})")
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    for name in selected:
+        results[name] = run_case(name, all_cases[name], corpus, args.rounds)
+        line = f"{name:<24} {results[name]:12.2f} us/item"
+        if name in baseline:
+            change = results[name] / baseline[name] - 1
+            line += f"   baseline {baseline[name]:12.2f} us/item ({change:+7.1%})"
+        print(line)
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'count': args.count,
+                'results': {name: round(micros, 3) for name, micros in results.items()}
+            }, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --save to record one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"No regressions (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
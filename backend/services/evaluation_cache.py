@@ -0,0 +1,172 @@
+"""
+Evaluation Cache - Content-addressed cache for LLM evaluations
+In-memory LRU tier with an optional SQLite tier that survives restarts
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_idea(idea_text: str) -> str:
+    """Normalize idea text so trivially different submissions share a key"""
+    text = unicodedata.normalize('NFKC', idea_text or '').casefold()
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+class EvaluationCache:
+    """Two-tier (memory + optional SQLite) cache with TTL and size-based eviction"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400,
+                 db_path: Optional[str] = None, max_db_entries: int = 100000):
+        """
+        Args:
+            max_entries: Maximum entries kept in memory (LRU eviction)
+            ttl_seconds: Time-to-live for entries in both tiers (0 disables expiry)
+            db_path: SQLite file for the persistent tier (None disables it)
+            max_db_entries: Maximum rows kept on disk (least recently used evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_db_entries = max_db_entries
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'sets': 0, 'evictions': 0}
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS evaluation_cache ('
+                ' key TEXT PRIMARY KEY, value TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL, last_access REAL NOT NULL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evaluation_cache_access'
+                ' ON evaluation_cache (last_access)'
+            )
+            self._db.commit()
+            self._db_count = self._db.execute('SELECT COUNT(*) FROM evaluation_cache').fetchone()[0]
+
+    @staticmethod
+    def make_key(idea_text: str, prompt_version: str) -> str:
+        """
+        Content address for an idea evaluated with a given prompt
+
+        The model is left out: the router and hedging may serve any model, and
+        the key is needed before it is known which one will answer.
+        """
+        payload = '\x1f'.join((normalize_idea(idea_text), prompt_version))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _expiry(self, now: float) -> float:
+        return now + self.ttl_seconds if self.ttl_seconds else float('inf')
+
+    def get(self, key: str, count: bool = True) -> Optional[Dict]:
+        """
+        Look up an evaluation
+
+        Args:
+            key: Cache key
+            count: False for secondary lookups (e.g. near-duplicate reuse)
+                that must not show up as hits or misses in the statistics
+
+        Returns:
+            dict: A fresh copy of the cached evaluation, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    if count:
+                        self._counters['hits'] += 1
+                    return json.loads(value)
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT value, expires_at FROM evaluation_cache WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    value, expires_at = row
+                    if expires_at > now:
+                        self._db.execute('UPDATE evaluation_cache SET last_access = ? WHERE key = ?', (now, key))
+                        self._db.commit()
+                        self._remember(key, expires_at, value)
+                        if count:
+                            self._counters['hits'] += 1
+                            self._counters['disk_hits'] += 1
+                        return json.loads(value)
+                    self._db.execute('DELETE FROM evaluation_cache WHERE key = ?', (key,))
+                    self._db.commit()
+                    self._db_count -= 1
+
+            if count:
+                self._counters['misses'] += 1
+            return None
+
+    def set(self, key: str, evaluation: Dict) -> None:
+        """Store a snapshot of an evaluation in every enabled tier"""
+        now = time.time()
+        expires_at = self._expiry(now)
+        value = json.dumps(evaluation)
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._counters['sets'] += 1
+            if self._db is not None:
+                exists = self._db.execute('SELECT 1 FROM evaluation_cache WHERE key = ?', (key,)).fetchone()
+                self._db.execute(
+                    'INSERT OR REPLACE INTO evaluation_cache (key, value, expires_at, last_access)'
+                    ' VALUES (?, ?, ?, ?)', (key, value, expires_at, now)
+                )
+                if exists is None:
+                    self._db_count += 1
+                if self._db_count > self.max_db_entries:
+                    self._evict_disk(now)
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        """Insert into the memory tier, evicting least recently used entries (lock held)"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    def _evict_disk(self, now: float) -> None:
+        """Drop expired rows, then least recently used rows down to 90% capacity (lock held)"""
+        self._db.execute('DELETE FROM evaluation_cache WHERE expires_at <= ?', (now,))
+        target = int(self.max_db_entries * 0.9)
+        count = self._db.execute('SELECT COUNT(*) FROM evaluation_cache').fetchone()[0]
+        if count > target:
+            self._db.execute(
+                'DELETE FROM evaluation_cache WHERE key IN ('
+                ' SELECT key FROM evaluation_cache ORDER BY last_access LIMIT ?)', (count - target,)
+            )
+            self._counters['evictions'] += count - target
+        self._db_count = min(count, target)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and tier sizes"""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'disk_entries': self._db_count if self._db is not None else None
+            }
@@ -0,0 +1,185 @@
+"""
+Evaluation Store - Persistent, content-addressed storage for scored evaluations
+Each evaluation is saved once under an id derived from its content, so
+clients can refer to it (GET /evaluations/<id>, /generate-pdf, /export-pdf)
+instead of sending it back
+"""
+
+import contextlib
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+class EvaluationStore:
+    """
+    SQLite (WAL) table of evaluations keyed by content hash
+
+    Ids are the first 128 bits of the SHA-256 of the canonical JSON, so the
+    same evaluation always gets the same id and a stored row never changes;
+    the id doubles as a strong ETag. Lookups are primary-key B-tree reads,
+    which stay fast at millions of rows. Every thread reads through its own
+    connection, so reads run concurrently with each other and with the
+    single writer.
+    """
+
+    def __init__(self, db_path: str = "evaluations.db"):
+        """
+        Args:
+            db_path: SQLite file (created if missing)
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._counters = {'writes': 0, 'duplicates': 0, 'failures': 0, 'reads': 0, 'misses': 0}
+        self._counter_lock = threading.Lock()
+
+        self._writer = self._connect()
+        self._writer.execute('PRAGMA journal_mode=WAL')
+        self._writer.execute(
+            'CREATE TABLE IF NOT EXISTS evaluations ('
+            ' id TEXT PRIMARY KEY, idea TEXT, evaluation TEXT NOT NULL,'
+            ' created_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        self._writer.execute(
+            'CREATE TABLE IF NOT EXISTS evaluation_scores ('
+            ' metric TEXT NOT NULL, id TEXT NOT NULL, score INTEGER NOT NULL,'
+            ' PRIMARY KEY (metric, id)) WITHOUT ROWID'
+        )
+        self._migrate()
+        self._writer.commit()
+
+    def _migrate(self) -> None:
+        """Fill evaluation_scores for rows saved before scores were kept (schema version 0)"""
+        version = self._writer.execute('PRAGMA user_version').fetchone()[0]
+        if version < 1:
+            self._writer.execute(
+                "INSERT OR IGNORE INTO evaluation_scores (metric, id, score)"
+                " SELECT 'feasibility_score', id, CAST(json_extract(evaluation, '$.feasibility_score') AS INTEGER)"
+                " FROM evaluations WHERE json_type(evaluation, '$.feasibility_score') IN ('integer', 'real')"
+            )
+            self._writer.execute(
+                "INSERT OR IGNORE INTO evaluation_scores (metric, id, score)"
+                " SELECT component.key, evaluations.id, CAST(component.value AS INTEGER)"
+                " FROM evaluations, json_each(evaluations.evaluation, '$.component_scores') AS component"
+                " WHERE component.type IN ('integer', 'real')"
+            )
+            self._writer.execute('PRAGMA user_version = 1')
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[name] += amount
+
+    @staticmethod
+    def canonical_json(evaluation: Dict) -> str:
+        return json.dumps(evaluation, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+    @staticmethod
+    def make_id(canonical: str) -> str:
+        """Id of an evaluation from its canonical JSON"""
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+    @staticmethod
+    def scores_of(evaluation: Dict) -> Dict[str, int]:
+        """Overall and component scores of an evaluation, by metric name"""
+        scores = {'feasibility_score': evaluation.get('feasibility_score')}
+        components = evaluation.get('component_scores')
+        if isinstance(components, dict):
+            scores.update(components)
+        return {
+            metric: int(score) for metric, score in scores.items()
+            if isinstance(score, (int, float)) and not isinstance(score, bool)
+        }
+
+    def put(self, evaluation: Dict, idea_text: Optional[str] = None) -> str:
+        """
+        Save an evaluation (a no-op if the identical evaluation is stored)
+
+        Args:
+            evaluation: Scored evaluation
+            idea_text: The idea it evaluates, kept alongside for reference
+
+        Returns:
+            str: The evaluation id
+        """
+        canonical = self.canonical_json(evaluation)
+        evaluation_id = self.make_id(canonical)
+        try:
+            inserted = self._insert(evaluation_id, idea_text, canonical, evaluation)
+        except sqlite3.Error:
+            self._count('failures')
+            raise
+        self._count('writes' if inserted else 'duplicates')
+        return evaluation_id
+
+    def _insert(self, evaluation_id: str, idea_text: Optional[str], canonical: str, evaluation: Dict) -> bool:
+        """Insert an evaluation and its scores in one transaction; False if it was already stored"""
+        with self._write_lock:
+            try:
+                cursor = self._writer.execute(
+                    'INSERT OR IGNORE INTO evaluations (id, idea, evaluation, created_at) VALUES (?, ?, ?, ?)',
+                    (evaluation_id, idea_text, canonical, time.time())
+                )
+                if cursor.rowcount:
+                    self._writer.executemany(
+                        'INSERT OR IGNORE INTO evaluation_scores (metric, id, score) VALUES (?, ?, ?)',
+                        [(metric, evaluation_id, score) for metric, score in self.scores_of(evaluation).items()]
+                    )
+                self._writer.commit()
+            except sqlite3.Error:
+                # Leave the connection usable for the next write
+                with contextlib.suppress(sqlite3.Error):
+                    self._writer.rollback()
+                raise
+        return bool(cursor.rowcount)
+
+    def get_json(self, evaluation_id: str) -> Optional[str]:
+        """The stored evaluation as JSON text (served as-is, without re-encoding), or None"""
+        row = self._reader().execute(
+            'SELECT evaluation FROM evaluations WHERE id = ?', (evaluation_id,)
+        ).fetchone()
+        self._count('reads' if row else 'misses')
+        return row[0] if row else None
+
+    def get(self, evaluation_id: str) -> Optional[Dict]:
+        """The stored evaluation, or None"""
+        text = self.get_json(evaluation_id)
+        return json.loads(text) if text is not None else None
+
+    def get_many(self, evaluation_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Stored evaluations by id (unknown ids are left out)"""
+        ids = list(dict.fromkeys(evaluation_ids))
+        found = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self._reader().execute(
+                f'SELECT id, evaluation FROM evaluations WHERE id IN ({",".join("?" * len(chunk))})', chunk
+            ).fetchall()
+            found.update((evaluation_id, json.loads(text)) for evaluation_id, text in rows)
+        self._count('reads', len(found))
+        self._count('misses', len(ids) - len(found))
+        return found
+
+    def iter_scores(self) -> Iterator[Tuple[str, str, int]]:
+        """(evaluation id, metric, score) for every stored evaluation, to rebuild a Leaderboard"""
+        yield from self._reader().execute('SELECT id, metric, score FROM evaluation_scores')
+
+    def stats(self) -> Dict:
+        """Writes, duplicate saves, failed saves, reads and misses since startup"""
+        with self._counter_lock:
+            return dict(self._counters)
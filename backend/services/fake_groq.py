@@ -0,0 +1,358 @@
+"""
+Fake Groq - Offline stand-ins for the Groq clients
+Simulates latency, errors and responses from a corpus, and records or
+replays real responses, so the service can be load-tested without the API
+
+Selected in LLMService with LLM_BACKEND:
+    groq    - the real API (default)
+    fake    - simulated responses (FAKE_LLM_* settings)
+    record  - the real API, appending every completion to LLM_RECORD_FILE
+    replay  - responses (and latencies) replayed from LLM_RECORD_FILE
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+from groq import InternalServerError, RateLimitError
+from services.prompt_builder import estimate_tokens
+
+# Built-in response corpus: one strong, one middling and one impossible idea
+DEFAULT_CORPUS = [
+    {
+        "executive_summary": "A scheduling assistant that cuts no-shows for small clinics with automated reminders.",
+        "problem_statement": "Clinics lose significant revenue to missed appointments, a clear and well-defined problem.",
+        "target_users": "Independent clinics and small practices with 2-20 practitioners.",
+        "market_potential": "A large and growing market of small healthcare providers worldwide.",
+        "technical_feasibility": "Feasible with existing technology; standard web, SMS and calendar integrations.",
+        "innovation_uniqueness": "A novel approach to reminder timing based on patient history.",
+        "risks_challenges": "Health data compliance and integration with legacy practice software.",
+        "strengths": ["Clear value proposition", "Simple to pilot", "Recurring revenue"],
+        "weaknesses": ["Crowded adjacent market", "Sales cycle to clinics", "Limited initial funding"],
+        "improvement_suggestions": ["Pilot with three clinics", "Integrate with top practice systems", "Measure no-show reduction"],
+        "final_recommendation": "Proceed with a focused pilot and validate the revenue impact.",
+        "feasibility_score": 78
+    },
+    {
+        "executive_summary": "A marketplace connecting freelance translators with small e-commerce shops.",
+        "problem_statement": "Small shops struggle to localize listings, though the need varies by segment.",
+        "target_users": "Online sellers expanding to new language markets.",
+        "market_potential": "A moderate market with established competitors and price pressure.",
+        "technical_feasibility": "Technically feasible with standard marketplace tooling, but quality control is complex.",
+        "innovation_uniqueness": "Similar services already exist; differentiation would come from e-commerce focus.",
+        "risks_challenges": "Competition from machine translation and large freelance platforms.",
+        "strengths": ["Real need", "Low technical risk", "Clear customer segment"],
+        "weaknesses": ["Competitive market", "Thin margins", "Two-sided marketplace cold start"],
+        "improvement_suggestions": ["Start with one language pair", "Bundle SEO services", "Partner with a shop platform"],
+        "final_recommendation": "Viable with a sharp niche; validate willingness to pay first.",
+        "feasibility_score": 58
+    },
+    {
+        "executive_summary": "A headset that records and replays dreams as video.",
+        "problem_statement": "People forget their dreams, although the problem is not well-defined as a need.",
+        "target_users": "Consumers interested in sleep and self-reflection.",
+        "market_potential": "Unclear demand; a niche novelty market.",
+        "technical_feasibility": "Reading dreams is impossible with current technology and remains science fiction.",
+        "innovation_uniqueness": "Unique concept, but it depends on breakthrough neuroscience.",
+        "risks_challenges": "The core technology does not exist; regulatory and ethical concerns.",
+        "strengths": ["Compelling story", "Strong curiosity factor", "No direct competitors"],
+        "weaknesses": ["Technically impossible today", "Unclear need", "Massive research cost"],
+        "improvement_suggestions": ["Pivot to dream journaling", "Use existing sleep sensors", "Partner with sleep researchers"],
+        "final_recommendation": "Not feasible as described; consider a journaling product instead.",
+        "feasibility_score": 12
+    }
+]
+
+
+def parse_latency(spec: str, rng: random.Random) -> Callable[[], float]:
+    """
+    Latency sampler from a distribution spec (seconds)
+
+    Specs: "fixed:0.8", "uniform:0.3:1.5", "normal:0.8:0.2",
+    "lognormal:0.8:0.5" (median and sigma), "exponential:0.8" (mean).
+    """
+    kind, *params = spec.split(':')
+    values = [float(param) for param in params]
+    if kind == 'fixed':
+        return lambda: values[0]
+    if kind == 'uniform':
+        return lambda: rng.uniform(values[0], values[1])
+    if kind == 'normal':
+        return lambda: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == 'lognormal':
+        mu = math.log(values[0])
+        return lambda: rng.lognormvariate(mu, values[1])
+    if kind == 'exponential':
+        return lambda: rng.expovariate(1 / values[0])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def load_corpus(path: str) -> List[str]:
+    """
+    Response texts from a JSONL file: one evaluation object per line, or
+    {"content": "<raw completion text>"} for deliberately malformed output
+    """
+    corpus = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            corpus.append(record['content'] if set(record) == {'content'} else json.dumps(record))
+    return corpus
+
+
+def prompt_key(messages: List[Dict]) -> str:
+    """Stable key of a request's messages (used to match recordings)"""
+    return hashlib.sha256(json.dumps(messages, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _simulated_error(kind: str) -> Exception:
+    request = httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions')
+    if kind == 'rate_limit':
+        response = httpx.Response(429, headers={'retry-after': '1'}, request=request)
+        return RateLimitError("Rate limit reached (simulated)", response=response, body=None)
+    response = httpx.Response(503, request=request)
+    return InternalServerError("Service unavailable (simulated)", response=response, body=None)
+
+
+class FakeGroq:
+    """
+    Stand-in for Groq / AsyncGroq: client.chat.completions.create(**kwargs)
+
+    Responses are picked from the corpus by prompt hash, so the same idea
+    gets the same answer. A response longer than max_tokens is cut off with
+    finish_reason "length", like the real API.
+    """
+
+    def __init__(self, latency: str = 'fixed:0.5', error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, corpus: Optional[List[str]] = None,
+                 seed: Optional[int] = None, asynchronous: bool = False):
+        """
+        Args:
+            latency: Latency distribution spec (see parse_latency)
+            error_rate: Fraction of calls failing with a 503
+            rate_limit_rate: Fraction of calls failing with a 429 (retry-after: 1)
+            corpus: Response texts (defaults to DEFAULT_CORPUS)
+            seed: Random seed for reproducible runs
+            asynchronous: Expose an async create(), like AsyncGroq
+        """
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._latency = parse_latency(latency, self._rng)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.corpus = corpus or [json.dumps(evaluation) for evaluation in DEFAULT_CORPUS]
+        create = self._create_async if asynchronous else self._create
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+        self.calls = 0
+
+    def _plan(self, kwargs: Dict) -> Tuple[float, Optional[Exception], str]:
+        """Latency, error to raise (or None) and response text for one call"""
+        with self._rng_lock:
+            self.calls += 1
+            latency = self._latency()
+            roll = self._rng.random()
+        error = None
+        if roll < self.rate_limit_rate:
+            error = _simulated_error('rate_limit')
+        elif roll < self.rate_limit_rate + self.error_rate:
+            error = _simulated_error('server')
+        key = prompt_key(kwargs.get('messages', []))
+        return latency, error, self.corpus[int(key, 16) % len(self.corpus)]
+
+    @staticmethod
+    def _truncate(content: str, max_tokens: Optional[int]) -> Tuple[str, str]:
+        """Cut content at max_tokens, returning (content, finish_reason)"""
+        if not max_tokens or estimate_tokens(content) <= max_tokens:
+            return content, 'stop'
+        # Binary search for the longest prefix within the limit
+        low, high = 0, len(content)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if estimate_tokens(content[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return content[:low], 'length'
+
+    def _response(self, kwargs: Dict, content: str):
+        content, finish_reason = self._truncate(content, kwargs.get('max_tokens'))
+        prompt_tokens = sum(estimate_tokens(message.get('content', '')) for message in kwargs.get('messages', []))
+        completion_tokens = estimate_tokens(content)
+        if kwargs.get('stream'):
+            return content, finish_reason, None
+        return content, finish_reason, SimpleNamespace(
+            id=f"fake-{self.calls}",
+            model=kwargs.get('model'),
+            choices=[SimpleNamespace(index=0, message=SimpleNamespace(role='assistant', content=content),
+                                     finish_reason=finish_reason)],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                                  total_tokens=prompt_tokens + completion_tokens)
+        )
+
+    @staticmethod
+    def _chunks(content: str, finish_reason: str, size: int = 24):
+        pieces = [content[i:i + size] for i in range(0, len(content), size)]
+        for piece in pieces:
+            yield SimpleNamespace(choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=piece),
+                                                           finish_reason=None)])
+        yield SimpleNamespace(choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=None),
+                                                       finish_reason=finish_reason)])
+
+    def _create(self, **kwargs):
+        latency, error, content = self._plan(kwargs)
+        content, finish_reason, response = self._response(kwargs, content)
+        if not kwargs.get('stream'):
+            time.sleep(latency)
+            if error is not None:
+                raise error
+            return response
+
+        # Streams fail before the first chunk; a third of the latency is time to first token
+        time.sleep(latency / 3)
+        if error is not None:
+            raise error
+
+        def stream():
+            chunks = list(self._chunks(content, finish_reason))
+            for chunk in chunks:
+                time.sleep(latency * 2 / 3 / len(chunks))
+                yield chunk
+        return stream()
+
+    async def _create_async(self, **kwargs):
+        latency, error, content = self._plan(kwargs)
+        content, finish_reason, response = self._response(kwargs, content)
+        if not kwargs.get('stream'):
+            await asyncio.sleep(latency)
+            if error is not None:
+                raise error
+            return response
+
+        await asyncio.sleep(latency / 3)
+        if error is not None:
+            raise error
+
+        async def stream():
+            chunks = list(self._chunks(content, finish_reason))
+            for chunk in chunks:
+                await asyncio.sleep(latency * 2 / 3 / len(chunks))
+                yield chunk
+        return stream()
+
+
+class ReplayGroq(FakeGroq):
+    """
+    Replays completions recorded by RecordingGroq
+
+    Requests are matched to recordings by their messages; unmatched
+    requests get the recordings round-robin (counted in misses). Recorded
+    latencies are replayed unless a latency spec is given.
+    """
+
+    def __init__(self, path: str, latency: Optional[str] = None, seed: Optional[int] = None,
+                 asynchronous: bool = False):
+        self._records: Dict[str, Dict] = {}
+        ordered = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._records[record['key']] = record
+                    ordered.append(record)
+        if not ordered:
+            raise ValueError(f"No recordings in {path}")
+        super().__init__(latency=latency or 'fixed:0', corpus=[r['content'] for r in ordered],
+                         seed=seed, asynchronous=asynchronous)
+        self._replay_latency = latency is None
+        self._round_robin = itertools.cycle(ordered)
+        self.misses = 0
+
+    def _plan(self, kwargs: Dict) -> Tuple[float, Optional[Exception], str]:
+        latency, error, _ = super()._plan(kwargs)
+        with self._rng_lock:
+            record = self._records.get(prompt_key(kwargs.get('messages', [])))
+            if record is None:
+                self.misses += 1
+                record = next(self._round_robin)
+        if self._replay_latency:
+            latency = record.get('latency', 0.0)
+        return latency, error, record['content']
+
+
+class RecordingGroq:
+    """
+    Wraps a real Groq or AsyncGroq client and appends each non-streamed
+    completion (content, usage and latency) to a JSONL file for ReplayGroq
+    """
+
+    def __init__(self, client, path: str, asynchronous: bool = False):
+        self._client = client
+        self.path = path
+        self._lock = threading.Lock()
+        create = self._create_async if asynchronous else self._create
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    def _record(self, kwargs: Dict, response, latency: float) -> None:
+        if kwargs.get('stream'):
+            return
+        choice = response.choices[0]
+        usage = getattr(response, 'usage', None)
+        record = {
+            'key': prompt_key(kwargs.get('messages', [])),
+            'model': kwargs.get('model'),
+            'content': choice.message.content,
+            'finish_reason': choice.finish_reason,
+            'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+            'completion_tokens': getattr(usage, 'completion_tokens', None),
+            'latency': round(latency, 4)
+        }
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+
+    def _create(self, **kwargs):
+        started = time.monotonic()
+        response = self._client.chat.completions.create(**kwargs)
+        self._record(kwargs, response, time.monotonic() - started)
+        return response
+
+    async def _create_async(self, **kwargs):
+        started = time.monotonic()
+        response = await self._client.chat.completions.create(**kwargs)
+        self._record(kwargs, response, time.monotonic() - started)
+        return response
+
+
+def offline_clients(backend: str) -> Tuple[FakeGroq, FakeGroq]:
+    """
+    (client, async_client) for the "fake" and "replay" backends, configured
+    from FAKE_LLM_* and LLM_RECORD_FILE
+    """
+    seed = os.getenv('FAKE_LLM_SEED')
+    seed = int(seed) if seed else None
+    if backend == 'replay':
+        path = os.getenv('LLM_RECORD_FILE', 'llm_recordings.jsonl')
+        latency = os.getenv('FAKE_LLM_LATENCY') or None
+        return (ReplayGroq(path, latency=latency, seed=seed),
+                ReplayGroq(path, latency=latency, seed=seed, asynchronous=True))
+    if backend == 'fake':
+        corpus_path = os.getenv('FAKE_LLM_CORPUS')
+        options = dict(
+            latency=os.getenv('FAKE_LLM_LATENCY', 'lognormal:0.8:0.4'),
+            error_rate=float(os.getenv('FAKE_LLM_ERROR_RATE', '0')),
+            rate_limit_rate=float(os.getenv('FAKE_LLM_RATE_LIMIT_RATE', '0')),
+            corpus=load_corpus(corpus_path) if corpus_path else None,
+            seed=seed
+        )
+        return FakeGroq(**options), FakeGroq(**options, asynchronous=True)
+    raise ValueError(f"Unknown LLM_BACKEND: {backend} (use groq, fake, record or replay)")
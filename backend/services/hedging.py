@@ -0,0 +1,72 @@
+"""
+Hedging Policy - Decides when to send a backup LLM request
+Bounds hedges with a budget so they cannot more than double upstream spend
+"""
+
+import threading
+from typing import Dict
+from services.model_router import ModelRouter
+
+
+class HedgePolicy:
+    """
+    Percentile-based hedge delay plus a hedge budget
+
+    A hedge fires when the primary model has not answered within its
+    recent p<percentile> latency. At most budget_ratio hedges are allowed
+    per request (ratio capped at 1.0, i.e. at most double the calls).
+    """
+
+    def __init__(self, enabled: bool = False, percentile: float = 95, default_delay: float = 3.0,
+                 min_delay: float = 0.25, budget_ratio: float = 0.1):
+        """
+        Args:
+            enabled: Whether hedging is on
+            percentile: Primary-model latency percentile used as the hedge delay
+            default_delay: Delay (seconds) while the primary has no latency samples
+            min_delay: Lower bound on the delay (seconds)
+            budget_ratio: Maximum hedges per request (0-1)
+        """
+        self.enabled = enabled
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.budget_ratio = max(0.0, min(1.0, budget_ratio))
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'hedges_fired': 0, 'hedges_won': 0, 'hedges_skipped_budget': 0}
+
+    def delay_for(self, router: ModelRouter, model: str) -> float:
+        """Seconds to wait on the primary before hedging"""
+        observed = router.latency_percentile(model, self.percentile)
+        delay = observed if observed is not None else self.default_delay
+        return max(self.min_delay, delay)
+
+    def start_request(self) -> None:
+        """Count a hedgeable request (grows the budget)"""
+        with self._lock:
+            self._counters['requests'] += 1
+
+    def try_acquire_hedge(self) -> bool:
+        """Reserve budget for one hedge; False if the budget is exhausted"""
+        with self._lock:
+            if self._counters['hedges_fired'] + 1 > self.budget_ratio * self._counters['requests']:
+                self._counters['hedges_skipped_budget'] += 1
+                return False
+            self._counters['hedges_fired'] += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before the primary"""
+        with self._lock:
+            self._counters['hedges_won'] += 1
+
+    def stats(self) -> Dict:
+        """Hedge counters"""
+        with self._lock:
+            fired = self._counters['hedges_fired']
+            return {
+                'enabled': self.enabled,
+                **self._counters,
+                'hedge_rate': round(fired / self._counters['requests'], 4) if self._counters['requests'] else 0.0,
+                'win_rate': round(self._counters['hedges_won'] / fired, 4) if fired else 0.0
+            }
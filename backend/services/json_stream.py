@@ -0,0 +1,85 @@
+"""
+JSON Stream - Incremental parser for a streamed top-level JSON object
+Emits each top-level member as soon as its value is complete
+"""
+
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalObjectParser:
+    """
+    Parses a JSON object that arrives in arbitrary chunks
+
+    Only tracks string/escape state and nesting depth while scanning, so
+    each character is looked at once; a member is handed to json.loads
+    only when the comma or closing brace that ends it has arrived.
+    Anything before the opening brace (e.g. a markdown code fence) is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+        self.done = False
+        self.skipped = 0   # Malformed members left for the final repair
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of text
+
+        Returns:
+            list: (key, value) pairs of top-level members completed by this chunk
+        """
+        members = []
+        self._buffer += chunk
+        buffer = self._buffer
+        while self._pos < len(buffer) and not self.done:
+            char = buffer[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = self._pos + 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buffer[self._member_start:self._pos], members)
+                    self.done = True
+            elif char == ',' and self._depth == 1:
+                self._emit(buffer[self._member_start:self._pos], members)
+                self._member_start = self._pos + 1
+            self._pos += 1
+        return members
+
+    def _emit(self, member_text: str, members: List[Tuple[str, Any]]) -> None:
+        """
+        Parse one `"key": value` member and append it
+
+        A malformed member (e.g. a trailing comma inside a list) is skipped
+        rather than aborting the stream; the caller recovers it by repairing
+        the full text once the stream ends.
+        """
+        if not member_text.strip():
+            return
+        try:
+            members.extend(json.loads('{' + member_text + '}', strict=False).items())
+        except json.JSONDecodeError:
+            self.skipped += 1
+
+    @property
+    def text(self) -> str:
+        """Everything received so far"""
+        return self._buffer
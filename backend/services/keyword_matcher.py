@@ -0,0 +1,95 @@
+"""
+Keyword Matcher - Finds many keyword phrases in a single pass over text
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+# Words are runs of letters/digits; everything else is a boundary.
+# "well-defined" and "well defined" therefore tokenize identically.
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+_END = object()  # Trie node key marking the end of a phrase
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern, word-boundary-aware keyword matcher
+
+    Every phrase from every group is compiled once into a word-level trie.
+    Scanning tokenizes the text once and walks the trie from each token,
+    so the cost is linear in the text length (times the longest phrase,
+    a small constant) instead of text length x number of keywords.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """
+        Args:
+            groups: Mapping of group name -> keyword phrases
+        """
+        self._trie: Dict = {}
+        self._phrase_groups: Dict[str, Tuple[str, ...]] = {}
+        self.max_phrase_length = 0
+
+        for group, phrases in groups.items():
+            for phrase in phrases:
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                key = ' '.join(tokens)
+                self._phrase_groups[key] = self._phrase_groups.get(key, ()) + (group,)
+                if len(self._phrase_groups[key]) > 1:
+                    continue  # Already inserted for another group
+
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_END] = key
+                self.max_phrase_length = max(self.max_phrase_length, len(tokens))
+
+        self.groups = tuple(groups)
+
+    def find_phrases(self, text: str) -> List[str]:
+        """
+        Find every distinct keyword phrase present in text
+
+        Returns:
+            list: Matched phrases in order of first occurrence
+        """
+        if not text:
+            return []
+
+        tokens = tokenize(text)
+        trie = self._trie
+        seen = {}
+        for start in range(len(tokens)):
+            node = trie.get(tokens[start])
+            position = start
+            while node is not None:
+                phrase = node.get(_END)
+                if phrase is not None and phrase not in seen:
+                    seen[phrase] = None
+                position += 1
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+        return list(seen)
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """
+        Scan text once and bucket the matched phrases by group
+
+        Returns:
+            dict: Group name -> matched phrases (groups without hits are omitted)
+        """
+        hits: Dict[str, List[str]] = {}
+        for phrase in self.find_phrases(text):
+            for group in self._phrase_groups[phrase]:
+                hits.setdefault(group, []).append(phrase)
+        return hits
@@ -0,0 +1,296 @@
+"""
+Leaderboard - Ranking of stored evaluations by overall and component scores
+Scores are integers from 0 to 100, so each metric is indexed by a Fenwick
+tree of counts per score plus the evaluation ids holding each score
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAX_SCORE = 100
+
+
+class _FenwickTree:
+    """Binary indexed tree of counts over scores 0..size-1"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._tree = [0] * (size + 1)
+        self._top_bit = 1 << (size.bit_length() - 1)
+
+    def rebuild(self, counts: List[int]) -> None:
+        """Replace all counts at once (counts[score] for every score), in O(size)"""
+        self._tree = [0] + list(counts)
+        for index in range(1, self.size + 1):
+            parent = index + (index & -index)
+            if parent <= self.size:
+                self._tree[parent] += self._tree[index]
+
+    def add(self, score: int, delta: int) -> None:
+        index = score + 1
+        while index <= self.size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix(self, score: int) -> int:
+        """Number of entries with a score <= score"""
+        index = min(score, self.size - 1) + 1
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, count: int) -> int:
+        """Lowest score whose prefix count exceeds count (count < total)"""
+        position = 0
+        bit = self._top_bit
+        while bit:
+            following = position + bit
+            if following <= self.size and self._tree[following] <= count:
+                position = following
+                count -= self._tree[following]
+            bit >>= 1
+        return position
+
+
+class _MetricIndex:
+    """Counts and tie-sorted ids per score for one metric"""
+
+    def __init__(self):
+        self.tree = _FenwickTree(MAX_SCORE + 1)
+        self.buckets: List[List[str]] = [[] for _ in range(MAX_SCORE + 1)]
+        self.total = 0
+
+    def add(self, evaluation_id: str, score: int) -> None:
+        insort(self.buckets[score], evaluation_id)
+        self.tree.add(score, 1)
+        self.total += 1
+
+    def extend(self, entries: Iterable[Tuple[str, int]]) -> None:
+        """Add many (evaluation id, score) entries: append, sort each touched score once, rebuild the counts"""
+        touched = set()
+        for evaluation_id, score in entries:
+            self.buckets[score].append(evaluation_id)
+            touched.add(score)
+        for score in touched:
+            self.buckets[score].sort()
+        self.tree.rebuild([len(bucket) for bucket in self.buckets])
+        self.total = sum(len(bucket) for bucket in self.buckets)
+
+    def remove(self, evaluation_id: str, score: int) -> None:
+        bucket = self.buckets[score]
+        del bucket[bisect_left(bucket, evaluation_id)]
+        self.tree.add(score, -1)
+        self.total -= 1
+
+    def above(self, score: int) -> int:
+        """Number of entries scoring strictly higher than score"""
+        return self.total - self.tree.prefix(score)
+
+    def count(self, min_score: int, max_score: int) -> int:
+        if min_score > max_score:
+            return 0
+        below = self.tree.prefix(min_score - 1) if min_score > 0 else 0
+        return self.tree.prefix(max_score) - below
+
+    def entries(self, start: int, limit: int, min_score: int) -> List[Tuple[int, str, int]]:
+        """
+        Entries from position `start` in descending score order (ties by id),
+        stopping below min_score
+
+        Returns:
+            list: (position, evaluation id, score) tuples
+        """
+        results = []
+        position = start
+        while len(results) < limit and position < self.total:
+            # Score of the entry at this descending position
+            score = self.tree.find(self.total - 1 - position)
+            if score < min_score:
+                break
+            offset = position - self.above(score)
+            for evaluation_id in self.buckets[score][offset:offset + limit - len(results)]:
+                results.append((position, evaluation_id, score))
+                position += 1
+        return results
+
+
+class Leaderboard:
+    """
+    In-memory ranking over the overall score and each component score
+
+    Rank, range-count and percentile queries cost O(log S) tree steps
+    (S = 101 possible scores); listings add the entries returned. Ties are
+    listed in id order, so adding or removing an evaluation also inserts
+    into or deletes from its score's sorted id list, an O(N/S) memmove for
+    N evaluations. Updates and queries are serialized by one lock.
+    """
+
+    def __init__(self, metrics: Iterable[str]):
+        """
+        Args:
+            metrics: Score names to index, e.g. feasibility_score and the component names
+        """
+        self.metrics = tuple(metrics)
+        self._indexes = {metric: _MetricIndex() for metric in self.metrics}
+        self._scores: Dict[str, Dict[str, int]] = {}   # evaluation id -> metric -> score
+        self._lock = threading.Lock()
+        self.loading = False
+
+    @staticmethod
+    def _clamp(score) -> Optional[int]:
+        if isinstance(score, bool) or not isinstance(score, (int, float)):
+            return None
+        return max(0, min(MAX_SCORE, int(round(score))))
+
+    def add(self, evaluation_id: str, scores: Dict[str, int]) -> None:
+        """Index an evaluation's scores (replacing any earlier ones for the id)"""
+        cleaned = {}
+        for metric in self.metrics:
+            score = self._clamp(scores.get(metric))
+            if score is not None:
+                cleaned[metric] = score
+        with self._lock:
+            self._remove(evaluation_id)
+            for metric, score in cleaned.items():
+                self._indexes[metric].add(evaluation_id, score)
+            self._scores[evaluation_id] = cleaned
+
+    def add_many(self, rows: Iterable[Tuple[str, str, int]]) -> int:
+        """
+        Index (evaluation id, metric, score) rows, as read from the store
+
+        Returns:
+            int: Number of evaluations indexed
+        """
+        grouped: Dict[str, Dict[str, int]] = {}
+        for evaluation_id, metric, score in rows:
+            grouped.setdefault(evaluation_id, {})[metric] = score
+        for evaluation_id, scores in grouped.items():
+            self.add(evaluation_id, scores)
+        return len(grouped)
+
+    def load(self, rows: Iterable[Tuple[str, str, int]], chunk_size: int = 50000) -> int:
+        """
+        Bulk-index (evaluation id, metric, score) rows from the store
+
+        Meant for the initial load while the leaderboard is already in use:
+        `loading` is set meanwhile, and rows are indexed in chunks so queries
+        and adds get the lock in between. Evaluations already present (added
+        while loading) are skipped; stored scores never change for an id.
+
+        Returns:
+            int: Number of evaluations indexed
+        """
+        self.loading = True
+        try:
+            grouped: Dict[str, Dict[str, int]] = {}
+            for evaluation_id, metric, score in rows:
+                # Stored scores are almost always in-range ints: skip _clamp for those
+                if type(score) is not int or not 0 <= score <= MAX_SCORE:
+                    score = self._clamp(score)
+                    if score is None:
+                        continue
+                if metric in self._indexes:
+                    grouped.setdefault(evaluation_id, {})[metric] = score
+            items = list(grouped.items())
+            loaded = 0
+            for start in range(0, len(items), chunk_size):
+                with self._lock:
+                    entries = {metric: [] for metric in self.metrics}
+                    for evaluation_id, scores in items[start:start + chunk_size]:
+                        if evaluation_id in self._scores:
+                            continue
+                        self._scores[evaluation_id] = scores
+                        for metric, score in scores.items():
+                            entries[metric].append((evaluation_id, score))
+                        loaded += 1
+                    for metric, metric_entries in entries.items():
+                        self._indexes[metric].extend(metric_entries)
+            return loaded
+        finally:
+            self.loading = False
+
+    def remove(self, evaluation_id: str) -> None:
+        with self._lock:
+            self._remove(evaluation_id)
+
+    def _remove(self, evaluation_id: str) -> None:
+        """Unindex an evaluation (caller holds the lock)"""
+        for metric, score in self._scores.pop(evaluation_id, {}).items():
+            self._indexes[metric].remove(evaluation_id, score)
+
+    def _index(self, metric: str) -> _MetricIndex:
+        if metric not in self._indexes:
+            raise ValueError(f"Unknown metric '{metric}' (choose from {', '.join(self.metrics)})")
+        return self._indexes[metric]
+
+    def top(self, metric: str, limit: int = 10, offset: int = 0,
+            min_score: int = 0, max_score: int = MAX_SCORE) -> Dict:
+        """
+        Highest-scoring evaluations, optionally within a score range
+
+        Args:
+            metric: Score to rank by
+            limit: Maximum entries returned
+            offset: Entries to skip (for paging through the range)
+            min_score: Lowest score included
+            max_score: Highest score included
+
+        Returns:
+            dict: total, count in range, whether the initial load is still
+            running, and entries with rank (1 = best, ties share a rank),
+            evaluation id and score
+        """
+        index = self._index(metric)
+        min_score, max_score = max(0, min_score), min(MAX_SCORE, max_score)
+        with self._lock:
+            in_range = index.count(min_score, max_score)
+            start = index.above(max_score) + offset
+            rows = index.entries(start, limit, min_score) if limit > 0 and offset < in_range else []
+            entries = [
+                {"rank": index.above(score) + 1, "evaluation_id": evaluation_id, "score": score}
+                for _, evaluation_id, score in rows
+            ]
+            return {"metric": metric, "total": index.total, "count": in_range,
+                    "loading": self.loading, "entries": entries}
+
+    @staticmethod
+    def _percentile(index: _MetricIndex, score: int) -> Optional[float]:
+        """Percentile rank of a score (caller holds the lock)"""
+        if index.total == 0:
+            return None
+        below = index.tree.prefix(score - 1) if score > 0 else 0
+        equal = index.tree.prefix(score) - below
+        return round(100.0 * (below + 0.5 * equal) / index.total, 2)
+
+    def percentile(self, metric: str, score: int) -> Optional[float]:
+        """
+        Percentile rank of a score: the share of evaluations scoring lower,
+        counting ties as half (None while the metric has no entries)
+        """
+        index = self._index(metric)
+        with self._lock:
+            return self._percentile(index, self._clamp(score))
+
+    def standing(self, evaluation_id: str) -> Optional[Dict]:
+        """Score, rank and percentile of one evaluation on every metric (None if unknown)"""
+        with self._lock:
+            scores = self._scores.get(evaluation_id)
+            if scores is None:
+                return None
+            return {
+                metric: {
+                    "score": score,
+                    "rank": self._indexes[metric].above(score) + 1,
+                    "total": self._indexes[metric].total,
+                    "percentile": self._percentile(self._indexes[metric], score)
+                }
+                for metric, score in scores.items()
+            }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"evaluations": len(self._scores), "metrics": list(self.metrics), "loading": self.loading}
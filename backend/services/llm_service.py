@@ -5,51 +5,73 @@ Ensures structured JSON output with prompt guardrails
 
 import os
 import json
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load .env file from the backend directory
-# __file__ is in services/llm_service.py, so parent.parent is backend/
-backend_dir = Path(__file__).parent.parent
-env_path = backend_dir / '.env'
-load_dotenv(dotenv_path=env_path, override=True)
+import time
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Compatibility patch for groq/httpx issue
 try:
     import httpx
-    # Patch httpx.Client to handle proxies parameter if needed
-    _original_init = httpx.Client.__init__
-    def _patched_init(self, *args, **kwargs):
-        # Remove 'proxies' if it exists and httpx version doesn't support it
-        if 'proxies' in kwargs:
-            # Convert proxies to transport if needed for newer httpx
-            proxies_val = kwargs.pop('proxies', None)
-            if proxies_val and hasattr(httpx, 'Proxy'):
-                # Handle proxies differently for newer httpx versions
-                pass
-        return _original_init(self, *args, **kwargs)
+    
+    def _make_patched_init(_original_init):
+        # Patch httpx clients to handle proxies parameter if needed
+        def _patched_init(self, *args, **kwargs):
+            # Remove 'proxies' if it exists and httpx version doesn't support it
+            if 'proxies' in kwargs:
+                # Convert proxies to transport if needed for newer httpx
+                proxies_val = kwargs.pop('proxies', None)
+                if proxies_val and hasattr(httpx, 'Proxy'):
+                    # Handle proxies differently for newer httpx versions
+                    pass
+            return _original_init(self, *args, **kwargs)
+        return _patched_init
     
     # Only patch if the version is problematic
     if hasattr(httpx, '__version__') and int(httpx.__version__.split('.')[0]) >= 0:
-        try:
-            httpx.Client.__init__ = _patched_init
-        except:
-            pass
+        # Both the sync (Groq) and async (AsyncGroq) clients pass proxies
+        for _client_class in (httpx.Client, httpx.AsyncClient):
+            try:
+                _client_class.__init__ = _make_patched_init(_client_class.__init__)
+            except:
+                pass
 except:
     pass
 
-from groq import Groq
-
+from groq import AsyncGroq, Groq
+from services.evaluation_cache import EvaluationCache
+from services.fake_groq import RecordingGroq, offline_clients
+from services.hedging import HedgePolicy
+from services.json_stream import IncrementalObjectParser
+from services.model_router import ModelRouter
+from services.prompt_builder import PROMPT_VERSION, SYSTEM_PROMPT, PromptBuilder, estimate_tokens
+from services.rate_limiter import RateLimiter, RateLimitExceeded, is_transient_error
+from services.response_validator import LIST_FIELDS, ResponseValidator
+from services.similarity_index import SimilarityIndex
+from utils.metrics import CACHE_LOOKUPS, LLM_REQUESTS, LLM_TOKENS, record_stage, timed
+from utils.single_flight import AsyncSingleFlight, SingleFlight
 
 class LLMService:
     """Service for interacting with Groq LLM API"""
     
     def __init__(self):
-        api_key = os.getenv('GROQ_API_KEY')
-        if not api_key:
-            raise ValueError("GROQ_API_KEY not found in environment variables. Please check backend/.env file.")
-        
-        self.client = Groq(api_key=api_key)
+        # groq (default), record, or the offline fake/replay backends (see fake_groq.py)
+        self.backend = os.getenv('LLM_BACKEND', 'groq').lower()
+        if self.backend in ('groq', 'record'):
+            api_key = os.getenv('GROQ_API_KEY')
+            if not api_key:
+                raise ValueError("GROQ_API_KEY not found in environment variables. Please check backend/.env file.")
+            
+            # Retries are handled by the shared rate limiter below, not per client
+            self.client = Groq(api_key=api_key, max_retries=0)
+            # Async client for the ASGI /evaluate route (see asgi.py)
+            self.async_client = AsyncGroq(api_key=api_key, max_retries=0)
+            if self.backend == 'record':
+                record_file = os.getenv('LLM_RECORD_FILE', 'llm_recordings.jsonl')
+                self.client = RecordingGroq(self.client, record_file)
+                self.async_client = RecordingGroq(self.async_client, record_file, asynchronous=True)
+        else:
+            self.client, self.async_client = offline_clients(self.backend)
         # Updated to use available model (llama-3.1-70b-versatile was decommissioned)
         # Try models in order of preference with fallback
         self.models_to_try = [
@@ -59,175 +81,578 @@ class LLMService:
             "mixtral-8x7b-32768"        # Alternative model
         ]
         self.model = self.models_to_try[0]  # Default to first model
+        
+        # Quality tier per model (higher is better); requests are routed to the
+        # fastest healthy model at or above LLM_MIN_QUALITY_TIER
+        self.model_tiers = {
+            "llama-3.1-8b-instant": 1,
+            "llama-3.3-70b-versatile": 2,
+            "llama-3.1-405b-reasoning": 3,
+            "mixtral-8x7b-32768": 1
+        }
+        self.router = ModelRouter(
+            {model: self.model_tiers.get(model, 1) for model in self.models_to_try},
+            min_tier=int(os.getenv('LLM_MIN_QUALITY_TIER', '1')),
+            failure_threshold=int(os.getenv('LLM_BREAKER_FAILURES', '3')),
+            cooldown_seconds=float(os.getenv('LLM_BREAKER_COOLDOWN_SECONDS', '30'))
+        )
+        
+        # Optional hedging: a backup request to the next model when the primary is slow
+        self.hedging = HedgePolicy(
+            enabled=os.getenv('LLM_HEDGING', '0') == '1',
+            percentile=float(os.getenv('LLM_HEDGE_PERCENTILE', '95')),
+            default_delay=float(os.getenv('LLM_HEDGE_DEFAULT_DELAY_SECONDS', '3')),
+            budget_ratio=float(os.getenv('LLM_HEDGE_BUDGET', '0.1'))
+        )
+        self._hedge_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv('LLM_HEDGE_MAX_WORKERS', '64')),
+            thread_name_prefix='llm-hedge'
+        )
+        
+        # Client-side pacing against the Groq quota (0 = unlimited) and
+        # backoff on rate-limit and transient upstream errors
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=float(os.getenv('LLM_REQUESTS_PER_MINUTE', '0')),
+            tokens_per_minute=float(os.getenv('LLM_TOKENS_PER_MINUTE', '0')),
+            max_wait_seconds=float(os.getenv('LLM_RATE_LIMIT_MAX_WAIT_SECONDS', '60')),
+            max_retries=int(os.getenv('LLM_MAX_RETRIES', '3'))
+        )
+        
+        # Prompt token budget and adaptive completion limit
+        self.prompt_builder = PromptBuilder(
+            max_idea_tokens=int(os.getenv('LLM_MAX_IDEA_TOKENS', '1500')),
+            max_max_tokens=int(os.getenv('LLM_MAX_TOKENS', '2000')),
+            min_max_tokens=int(os.getenv('LLM_MIN_MAX_TOKENS', '600')),
+            adaptive=os.getenv('LLM_ADAPTIVE_MAX_TOKENS', '1') == '1'
+        )
+        
+        # Schema-compiled parsing, repair and coercion of completions
+        self.validator = ResponseValidator()
+        
+        # Content-addressed cache of evaluations (memory LRU + optional SQLite tier)
+        self.cache = EvaluationCache(
+            max_entries=int(os.getenv('EVAL_CACHE_MAX_ENTRIES', '1024')),
+            ttl_seconds=float(os.getenv('EVAL_CACHE_TTL_SECONDS', '86400')),
+            db_path=os.getenv('EVAL_CACHE_DB') or None,
+            max_db_entries=int(os.getenv('EVAL_CACHE_MAX_DB_ENTRIES', '100000'))
+        )
+        
+        # Near-duplicate detection over previously evaluated ideas (0 disables it)
+        self.near_duplicate_threshold = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8'))
+        self.similarity_index = SimilarityIndex(
+            max_items=int(os.getenv('NEAR_DUPLICATE_MAX_IDEAS', '500000'))
+        )
+        
+        # Concurrent requests for the same idea share one upstream call
+        self.single_flight = SingleFlight()
+        self.async_single_flight = AsyncSingleFlight()
     
     def _get_evaluation_prompt(self, idea_text: str) -> str:
         """
         Constructs a structured prompt with guardrails to ensure JSON output
+        (long ideas are trimmed to the prompt token budget)
         """
-        prompt = f"""You are an expert startup evaluator and business analyst. Analyze the following startup idea and provide a comprehensive evaluation.
-
-STARTUP IDEA:
-{idea_text}
-
-INSTRUCTIONS:
-1. Analyze the idea thoroughly across all required dimensions
-2. Be CRITICAL and REALISTIC - if the idea is technically impossible, clearly state this
-3. Consider current technology limitations - do not give high scores to science fiction ideas
-4. Provide ONLY valid JSON output - no markdown, no extra text
-5. Do NOT hallucinate metrics or data - use reasonable estimates based on the idea description
-6. Be objective and balanced - penalize unrealistic/impossible ideas appropriately
-7. Ensure all fields are filled with meaningful content
-8. If the idea requires technology that doesn't exist (e.g., reading dreams, time travel, teleportation), mark technical feasibility as very low
-
-REQUIRED OUTPUT FORMAT (JSON only):
-{{
-  "executive_summary": "A 2-3 sentence overview of the startup idea and its potential",
-  "problem_statement": "Clear description of the problem being solved",
-  "target_users": "Description of the target customer segment",
-  "market_potential": "Assessment of market size and opportunity",
-  "technical_feasibility": "Analysis of technical requirements and feasibility",
-  "innovation_uniqueness": "Evaluation of how innovative and unique the idea is",
-  "risks_challenges": "Key risks and challenges the startup may face",
-  "strengths": ["Strength 1", "Strength 2", "Strength 3"],
-  "weaknesses": ["Weakness 1", "Weakness 2", "Weakness 3"],
-  "improvement_suggestions": ["Suggestion 1", "Suggestion 2", "Suggestion 3"],
-  "final_recommendation": "Overall recommendation and next steps",
-  "feasibility_score": 0
-}}
-
-IMPORTANT:
-- Return ONLY the JSON object, no markdown formatting
-- feasibility_score should be an integer between 0-100 (you will provide initial estimate)
-- Be REALISTIC with the score:
-  * 0-30: Technically impossible or requires non-existent technology
-  * 31-50: Very difficult, requires breakthrough technology not yet available
-  * 51-70: Challenging but feasible with current technology
-  * 71-85: Good idea, technically feasible, clear path to execution
-  * 86-100: Excellent idea, highly feasible, strong market potential
-- All string fields should be 1-3 sentences
-- Arrays should have 3 items each
-- Be specific and actionable in your analysis
-- If the idea is impossible (e.g., reading dreams, mind control, time travel), give a low score (0-40) and explain why in technical_feasibility
-
-Now provide the JSON evaluation:"""
+        with timed("prompt"):
+            return self.prompt_builder.build(idea_text)
+    
+    def _lookup_cached(self, idea_text: str, use_cache: bool):
+        """
+        Returns (cache_key, evaluation) where evaluation is a cached or
+        near-duplicate result, or None when the LLM has to be called
+        """
+        cache_key = self.cache.make_key(idea_text, PROMPT_VERSION)
+        if not use_cache:
+            CACHE_LOOKUPS.inc(result="bypass")
+            return cache_key, None
         
-        return prompt
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            CACHE_LOOKUPS.inc(result="hit")
+            return cache_key, cached
+        evaluation = self._find_near_duplicate(idea_text)
+        CACHE_LOOKUPS.inc(result="miss" if evaluation is None else "near_duplicate")
+        return cache_key, evaluation
     
-    def evaluate_idea(self, idea_text: str) -> dict:
+    def _remember(self, cache_key: str, idea_text: str, evaluation: dict) -> None:
+        """Store a fresh evaluation for exact and near-duplicate reuse"""
+        self.cache.set(cache_key, evaluation)
+        if self.near_duplicate_threshold > 0:
+            self.similarity_index.add(cache_key, idea_text)
+    
+    def evaluate_idea(self, idea_text: str, use_cache: bool = True) -> dict:
         """
         Evaluates a startup idea using LLM and returns structured JSON
         
         Args:
             idea_text: The startup idea description
+            use_cache: Set to False to skip the cache lookup and force a fresh
+                evaluation (the fresh result still refreshes the cache)
             
         Returns:
             dict: Structured evaluation with all required fields
         """
+        cache_key, evaluation = self._lookup_cached(idea_text, use_cache)
+        if evaluation is not None:
+            return evaluation
+        
+        def fetch():
+            evaluation = self._request_evaluation(idea_text)
+            self._remember(cache_key, idea_text, evaluation)
+            return evaluation
+        
+        return self.single_flight.do(cache_key, fetch)
+    
+    async def evaluate_idea_async(self, idea_text: str, use_cache: bool = True) -> dict:
+        """
+        Async variant of evaluate_idea using the AsyncGroq client
+        
+        The event loop is free while the completion is pending, so a single
+        process can hold many in-flight evaluations. Cache reads and writes
+        (SQLite under a lock) run on a worker thread for the same reason.
+        """
+        cache_key, evaluation = await asyncio.to_thread(self._lookup_cached, idea_text, use_cache)
+        if evaluation is not None:
+            return evaluation
+        
+        async def fetch():
+            evaluation = await self._request_evaluation_async(idea_text)
+            await asyncio.to_thread(self._remember, cache_key, idea_text, evaluation)
+            return evaluation
+        
+        return await self.async_single_flight.do(cache_key, fetch)
+    
+    def evaluate_idea_stream(self, idea_text: str, use_cache: bool = True):
+        """
+        Streaming variant of evaluate_idea
+        
+        Yields ("field", name, value) as soon as each top-level field of the
+        streamed completion is complete, then ("complete", None, evaluation)
+        with the fully validated evaluation. Cached and near-duplicate
+        evaluations are replayed field by field.
+        """
+        cache_key, evaluation = self._lookup_cached(idea_text, use_cache)
+        if evaluation is None:
+            try:
+                prompt = self._get_evaluation_prompt(idea_text)
+                model, started, stream = self._open_stream(prompt)
+                
+                parser = IncrementalObjectParser()
+                emitted = set()
+                finish_reason = None
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].finish_reason:
+                        finish_reason = chunk.choices[0].finish_reason
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    for field, value in parser.feed(delta):
+                        value = self.validator.coerce_field(field, value)
+                        if value is None:
+                            # Null fields are requested again; the recovered value is sent below
+                            continue
+                        emitted.add(field)
+                        yield "field", field, value
+                self.router.record_success(model, time.monotonic() - started)
+                record_stage("upstream", time.monotonic() - started)
+                # Streamed chunks carry no usage: record local estimates
+                prompt_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt)
+                completion_tokens = estimate_tokens(parser.text)
+                LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+                LLM_TOKENS.inc(completion_tokens, model=model, kind="completion")
+                self.prompt_builder.record_usage(
+                    prompt_tokens, completion_tokens,
+                    truncated=finish_reason == "length"
+                )
+                
+                # Fields recovered by repair or a follow-up call were not streamed yet
+                evaluation = self._validated(model, prompt, parser.text)
+                for field, value in evaluation.items():
+                    if field not in emitted:
+                        yield "field", field, value
+                self._remember(cache_key, idea_text, evaluation)
+                
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse LLM response as JSON: {str(e)}")
+            except RateLimitExceeded:
+                raise
+            except Exception as e:
+                raise Exception(f"Error evaluating idea with LLM: {str(e)}")
+        else:
+            for field, value in evaluation.items():
+                yield "field", field, value
+        
+        yield "complete", None, evaluation
+    
+    def _open_stream(self, prompt: str):
+        """
+        Start a streamed completion on the first router candidate that accepts it
+        
+        Returns:
+            tuple: (model, start time, chunk iterator)
+        """
+        last_error = None
+        for model in self.router.candidates():
+            try:
+                stream, started = self._create_completion(model, prompt, stream=True)
+            except RateLimitExceeded:
+                raise
+            except Exception as e:
+                last_error = e
+                self.router.record_failure(model, e, permanent=self._is_permanent_model_error(e))
+                if self._is_model_error(e):
+                    continue
+                raise
+            self.model = model
+            return model, started, stream
+        raise Exception(f"All models failed. Last error: {str(last_error)}")
+    
+    def _find_near_duplicate(self, idea_text: str):
+        """
+        Reuse the evaluation of a previously evaluated, near-identical idea
+        
+        The stored evaluation is returned unscored; callers rescore it with
+        ScoringService against the new idea text. The match is reported in
+        the "near_duplicate" field as the matched idea id and similarity.
+        """
+        if self.near_duplicate_threshold <= 0:
+            return None
+        match = self.similarity_index.query(idea_text, self.near_duplicate_threshold)
+        if match is None:
+            return None
+        
+        matched_id, similarity = match
+        # Not a separate lookup: the exact-match miss is already counted
+        evaluation = self.cache.get(matched_id, count=False)
+        if evaluation is None:
+            # The evaluation has been evicted from the cache; forget the idea too
+            self.similarity_index.remove(matched_id)
+            return None
+        evaluation["near_duplicate"] = {"idea_id": matched_id, "similarity": round(similarity, 4)}
+        return evaluation
+    
+    def _completion_request(self, model: str, prompt: str) -> dict:
+        """Keyword arguments for chat.completions.create"""
+        return {
+            "model": model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": self.prompt_builder.max_tokens(),
+            "response_format": {"type": "json_object"}  # Force JSON output
+        }
+    
+    def _create_completion(self, model: str, prompt: str, max_tokens: int = None, **options):
+        """
+        chat.completions.create paced by the rate limiter, retrying
+        rate-limit and transient errors with backoff
+        
+        Args:
+            model: Model name
+            prompt: User prompt
+            max_tokens: Override the adaptive completion limit (follow-up calls)
+            options: Extra arguments for create (e.g. stream=True)
+        
+        Returns:
+            tuple: (response, start time of the successful attempt)
+        """
+        request = self._completion_request(model, prompt)
+        if max_tokens is not None:
+            request["max_tokens"] = max_tokens
+        reserved = estimate_tokens(prompt) + request["max_tokens"]
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(reserved)
+            started = time.monotonic()
+            try:
+                response = self.client.chat.completions.create(**request, **options)
+            except Exception as e:
+                self._record_call(model, started, e, options)
+                self.rate_limiter.settle(reserved, 0)
+                delay = self.rate_limiter.backoff(attempt, e)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._record_call(model, started, None, options)
+            if not options.get("stream"):
+                self._record_usage(model, response, prompt, reserved, sample=max_tokens is None)
+            return response, started
+    
+    async def _create_completion_async(self, model: str, prompt: str, max_tokens: int = None, **options):
+        """Async counterpart of _create_completion"""
+        request = self._completion_request(model, prompt)
+        if max_tokens is not None:
+            request["max_tokens"] = max_tokens
+        reserved = estimate_tokens(prompt) + request["max_tokens"]
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async(reserved)
+            started = time.monotonic()
+            try:
+                response = await self.async_client.chat.completions.create(**request, **options)
+            except Exception as e:
+                self._record_call(model, started, e, options)
+                self.rate_limiter.settle(reserved, 0)
+                delay = self.rate_limiter.backoff(attempt, e)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._record_call(model, started, None, options)
+            if not options.get("stream"):
+                self._record_usage(model, response, prompt, reserved, sample=max_tokens is None)
+            return response, started
+    
+    @staticmethod
+    def _record_call(model: str, started: float, error, options: dict) -> None:
+        """Count a completion call by outcome; non-streamed calls also time the upstream stage"""
+        LLM_REQUESTS.inc(model=model, outcome="ok" if error is None else type(error).__name__)
+        if not options.get("stream"):
+            record_stage("upstream", time.monotonic() - started)
+    
+    def _record_usage(self, model: str, response, prompt: str, reserved: int, sample: bool = True) -> None:
+        """Feed a completion's token usage to the rate limiter, the prompt builder and the metrics"""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        choice = response.choices[0] if response.choices else None
+        if prompt_tokens is None:
+            prompt_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt)
+        if completion_tokens is None and choice is not None:
+            completion_tokens = estimate_tokens(choice.message.content or "")
+        
+        self.rate_limiter.settle(reserved, getattr(usage, "total_tokens", None))
+        LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+        LLM_TOKENS.inc(completion_tokens or 0, model=model, kind="completion")
+        self.prompt_builder.record_usage(
+            prompt_tokens, completion_tokens,
+            truncated=getattr(choice, "finish_reason", None) == "length",
+            sample=sample
+        )
+    
+    @staticmethod
+    def _is_model_error(error: Exception) -> bool:
+        """
+        True if the error means this model is unavailable and the next should be tried
+        (including rate-limit and transient errors that outlasted their retries)
+        """
+        if is_transient_error(error):
+            return True
+        return "model" in str(error).lower() or "decommissioned" in str(error).lower()
+    
+    @staticmethod
+    def _is_permanent_model_error(error: Exception) -> bool:
+        """True if the model is gone for good (decommissioned or unknown), not just failing"""
+        message = str(error).lower()
+        return any(marker in message for marker in ("decommissioned", "does not exist", "not found", "model_not_found"))
+    
+    def _attempt(self, model: str, prompt: str) -> dict:
+        """
+        One call to one model: request, record model health, parse and validate
+        """
+        try:
+            # Call Groq API
+            response, started = self._create_completion(model, prompt)
+        except RateLimitExceeded:
+            # Our own quota queue is full: not a sign the model is unhealthy
+            raise
+        except Exception as e:
+            self.router.record_failure(model, e, permanent=self._is_permanent_model_error(e))
+            raise
+        # If successful, record latency and update default model
+        self.router.record_success(model, time.monotonic() - started)
+        self.model = model
+        return self._validated(model, prompt, response.choices[0].message.content)
+    
+    async def _attempt_async(self, model: str, prompt: str) -> dict:
+        """
+        Async counterpart of _attempt
+        """
+        try:
+            response, started = await self._create_completion_async(model, prompt)
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            self.router.record_failure(model, e, permanent=self._is_permanent_model_error(e))
+            raise
+        self.router.record_success(model, time.monotonic() - started)
+        self.model = model
+        return await self._validated_async(model, prompt, response.choices[0].message.content)
+    
+    def _try_in_order(self, prompt: str, models: list) -> dict:
+        """Try models one after another until one works"""
+        last_error = None
+        for model in models:
+            try:
+                return self._attempt(model, prompt)
+            except Exception as e:
+                last_error = e
+                # If model not found or failing, try next one
+                if self._is_model_error(e):
+                    continue
+                # Other error, re-raise
+                raise
+        # All models failed
+        raise Exception(f"All models failed. Last error: {str(last_error)}")
+    
+    async def _try_in_order_async(self, prompt: str, models: list) -> dict:
+        """Async counterpart of _try_in_order"""
+        last_error = None
+        for model in models:
+            try:
+                return await self._attempt_async(model, prompt)
+            except Exception as e:
+                last_error = e
+                if self._is_model_error(e):
+                    continue
+                raise
+        raise Exception(f"All models failed. Last error: {str(last_error)}")
+    
+    def _hedged(self, prompt: str, candidates: list) -> dict:
+        """
+        Send the request to the primary model and, if it is slower than its
+        recent latency percentile, a backup request to the next model
+        
+        The first response that passes validation wins. A losing sync call
+        cannot be aborted mid-flight, so its result is simply discarded.
+        """
+        primary, backup = candidates[0], candidates[1]
+        self.hedging.start_request()
+        # Run attempts in a copy of this context, so their stage timings reach the request
+        attempts = {self._hedge_pool.submit(contextvars.copy_context().run, self._attempt, primary, prompt): primary}
+        done, _ = wait(attempts, timeout=self.hedging.delay_for(self.router, primary))
+        if not done and self.hedging.try_acquire_hedge():
+            attempts[self._hedge_pool.submit(contextvars.copy_context().run, self._attempt, backup, prompt)] = backup
+        
+        pending = set(attempts)
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if attempts[future] == backup:
+                        self.hedging.record_win()
+                    return future.result()
+                last_error = future.exception()
+        
+        # Every launched attempt failed: fall back to the remaining models
+        if not self._is_model_error(last_error):
+            raise last_error
+        remaining = [model for model in candidates if model not in attempts.values()]
+        return self._try_in_order(prompt, remaining)
+    
+    async def _hedged_async(self, prompt: str, candidates: list) -> dict:
+        """Async counterpart of _hedged; the losing request is cancelled"""
+        primary, backup = candidates[0], candidates[1]
+        self.hedging.start_request()
+        attempts = {asyncio.ensure_future(self._attempt_async(primary, prompt)): primary}
+        done, _ = await asyncio.wait(attempts, timeout=self.hedging.delay_for(self.router, primary))
+        if not done and self.hedging.try_acquire_hedge():
+            attempts[asyncio.ensure_future(self._attempt_async(backup, prompt))] = backup
+        
+        pending = set(attempts)
+        last_error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if attempts[task] == backup:
+                            self.hedging.record_win()
+                        return task.result()
+                    last_error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if not self._is_model_error(last_error):
+            raise last_error
+        remaining = [model for model in candidates if model not in attempts.values()]
+        return await self._try_in_order_async(prompt, remaining)
+    
+    def _request_evaluation(self, idea_text: str) -> dict:
+        """
+        Requests a fresh evaluation from the LLM, trying the router's
+        candidates (fastest healthy model first)
+        """
         try:
             prompt = self._get_evaluation_prompt(idea_text)
+            candidates = self.router.candidates()
+            if self.hedging.enabled and len(candidates) > 1:
+                return self._hedged(prompt, candidates)
+            return self._try_in_order(prompt, candidates)
             
-            # Try models in order until one works
-            last_error = None
-            for model in self.models_to_try:
-                try:
-                    # Call Groq API
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a professional startup evaluator. Always respond with valid JSON only, no markdown formatting."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=0.7,
-                        max_tokens=2000,
-                        response_format={"type": "json_object"}  # Force JSON output
-                    )
-                    # If successful, update default model and break
-                    self.model = model
-                    break
-                except Exception as e:
-                    last_error = e
-                    # If model not found, try next one
-                    if "model" in str(e).lower() or "decommissioned" in str(e).lower():
-                        continue
-                    else:
-                        # Other error, re-raise
-                        raise
-            else:
-                # All models failed
-                raise Exception(f"All models failed. Last error: {str(last_error)}")
-            
-            # Extract and parse JSON response
-            response_text = response.choices[0].message.content.strip()
-            
-            # Clean response (remove markdown code blocks if any)
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
-            
-            # Parse JSON
-            evaluation = json.loads(response_text)
-            
-            # Validate required fields
-            required_fields = [
-                "executive_summary", "problem_statement", "target_users",
-                "market_potential", "technical_feasibility", "innovation_uniqueness",
-                "risks_challenges", "strengths", "weaknesses",
-                "improvement_suggestions", "final_recommendation"
-            ]
-            
-            for field in required_fields:
-                if field not in evaluation:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Ensure arrays are lists and handle type conversions
-            def ensure_list(value, default=[]):
-                """Convert value to list if it's not already a list"""
-                if value is None:
-                    return default
-                if isinstance(value, list):
-                    return value
-                if isinstance(value, str):
-                    # Try to parse as JSON array if it's a string representation
-                    try:
-                        parsed = json.loads(value)
-                        if isinstance(parsed, list):
-                            return parsed
-                    except:
-                        pass
-                    # If it's a plain string, return as single-item list
-                    return [value] if value.strip() else default
-                # For other types, convert to string and wrap in list
-                return [str(value)]
-            
-            evaluation["strengths"] = ensure_list(evaluation.get("strengths"), [])
-            evaluation["weaknesses"] = ensure_list(evaluation.get("weaknesses"), [])
-            evaluation["improvement_suggestions"] = ensure_list(evaluation.get("improvement_suggestions"), [])
-            
-            # Ensure all string fields are actually strings
-            string_fields = [
-                "executive_summary", "problem_statement", "target_users",
-                "market_potential", "technical_feasibility", "innovation_uniqueness",
-                "risks_challenges", "final_recommendation"
-            ]
-            for field in string_fields:
-                value = evaluation.get(field)
-                if value is not None and not isinstance(value, str):
-                    evaluation[field] = str(value)
-            
-            return evaluation
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse LLM response as JSON: {str(e)}")
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            raise Exception(f"Error evaluating idea with LLM: {str(e)}")
+    
+    async def _request_evaluation_async(self, idea_text: str) -> dict:
+        """
+        Async counterpart of _request_evaluation
+        """
+        try:
+            prompt = self._get_evaluation_prompt(idea_text)
+            candidates = self.router.candidates()
+            if self.hedging.enabled and len(candidates) > 1:
+                return await self._hedged_async(prompt, candidates)
+            return await self._try_in_order_async(prompt, candidates)
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse LLM response as JSON: {str(e)}")
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             raise Exception(f"Error evaluating idea with LLM: {str(e)}")
-
+    
+    def _validated(self, model: str, prompt: str, response_text: str) -> dict:
+        """
+        Parses (repairing if needed) and validates a completion; missing
+        fields are requested from the same model on their own instead of
+        regenerating the whole evaluation
+        """
+        evaluation, missing = self.validator.parse(response_text)
+        if not missing:
+            return evaluation
+        
+        # Counted as "incomplete" in validator.stats()
+        follow_up, max_tokens = self.prompt_builder.build_missing_fields(prompt, missing)
+        response, _ = self._create_completion(model, follow_up, max_tokens=max_tokens)
+        return self._merge_missing(evaluation, missing, response.choices[0].message.content)
+    
+    async def _validated_async(self, model: str, prompt: str, response_text: str) -> dict:
+        """Async counterpart of _validated"""
+        evaluation, missing = self.validator.parse(response_text)
+        if not missing:
+            return evaluation
+        
+        follow_up, max_tokens = self.prompt_builder.build_missing_fields(prompt, missing)
+        response, _ = await self._create_completion_async(model, follow_up, max_tokens=max_tokens)
+        return self._merge_missing(evaluation, missing, response.choices[0].message.content)
+    
+    def _merge_missing(self, evaluation: dict, missing: list, response_text: str) -> dict:
+        """Add the fields returned by a follow-up call and validate required fields"""
+        fields = self.validator.load(response_text)
+        self.validator.merge(evaluation, {field: fields[field] for field in missing if field in fields})
+        
+        # Validate required fields (list fields the model still leaves null become empty lists)
+        for field in self.validator.missing_fields(evaluation):
+            if field not in LIST_FIELDS:
+                raise ValueError(f"Missing required field: {field}")
+            evaluation[field] = []
+        
+        return evaluation
@@ -0,0 +1,178 @@
+"""
+Model Router - Picks the fastest healthy Groq model for each request
+Tracks per-model success rate and latency and trips circuit breakers on
+models that keep failing
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+
+def percentile(values, q: float) -> Optional[float]:
+    """Nearest-rank percentile of a sequence (None if empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+class _ModelHealth:
+    """Rolling health statistics and circuit state for one model"""
+
+    def __init__(self, name: str, tier: int, order: int, window: int):
+        self.name = name
+        self.tier = tier
+        self.order = order
+        self.outcomes = deque(maxlen=window)    # True = success
+        self.latencies = deque(maxlen=window)   # Seconds, successful calls only
+        self.consecutive_failures = 0
+        self.state = 'closed'                   # closed | open | half_open
+        self.open_until = 0.0
+        self.last_error = None
+
+    def success_rate(self) -> Optional[float]:
+        if not self.outcomes:
+            return None
+        return sum(self.outcomes) / len(self.outcomes)
+
+
+class ModelRouter:
+    """
+    Routes requests across models with per-model circuit breakers
+
+    A model's breaker opens after failure_threshold consecutive failures
+    (or immediately on a permanent error such as a decommissioned model)
+    and stays open for the cooldown. After the cooldown one trial request
+    is let through (half-open); success closes the breaker again.
+    """
+
+    def __init__(self, models: Dict[str, int], min_tier: int = 1, failure_threshold: int = 3,
+                 cooldown_seconds: float = 30.0, permanent_cooldown_seconds: float = 3600.0,
+                 window: int = 100):
+        """
+        Args:
+            models: Model name -> quality tier (higher is better), in preference order
+            min_tier: Lowest quality tier a request may be routed to
+            failure_threshold: Consecutive failures that open a breaker
+            cooldown_seconds: How long a breaker stays open after transient failures
+            permanent_cooldown_seconds: How long it stays open after a permanent error
+            window: Number of recent calls used for success rate and latency
+
+        Raises:
+            ValueError: If no model meets min_tier, so no request could be routed
+        """
+        if not any(tier >= min_tier for tier in models.values()):
+            best = max(models.values(), default=None)
+            raise ValueError(
+                f"No model meets the minimum quality tier {min_tier} "
+                f"(highest configured tier is {best}); lower LLM_MIN_QUALITY_TIER"
+            )
+        self.min_tier = min_tier
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.permanent_cooldown_seconds = permanent_cooldown_seconds
+        self._models = {
+            name: _ModelHealth(name, tier, order, window)
+            for order, (name, tier) in enumerate(models.items())
+        }
+        self._lock = threading.Lock()
+
+    def candidates(self) -> List[str]:
+        """
+        Models to try for the next request, best first
+
+        Healthy models meeting the quality tier are ordered by p50 latency
+        (models without measurements keep their configured order, after the
+        measured ones). If every eligible breaker is open, the models are
+        returned anyway, soonest-to-recover first, so requests still have a
+        chance instead of failing outright.
+        """
+        now = time.monotonic()
+        with self._lock:
+            eligible = [m for m in self._models.values() if m.tier >= self.min_tier]
+            healthy = []
+            for model in eligible:
+                if model.state == 'closed':
+                    healthy.append(model)
+                elif now >= model.open_until:
+                    # Let one trial request through; the lease expires after
+                    # another cooldown in case that request never reaches it
+                    model.state = 'half_open'
+                    model.open_until = now + self.cooldown_seconds
+                    healthy.append(model)
+
+            if not healthy:
+                return [m.name for m in sorted(eligible, key=lambda m: m.open_until)]
+
+            def speed(model):
+                p50 = percentile(model.latencies, 50)
+                return (p50 is None, p50 or 0.0, model.order)
+
+            return [m.name for m in sorted(healthy, key=speed)]
+
+    def latency_percentile(self, model: str, q: float) -> Optional[float]:
+        """Recent latency percentile (seconds) of a model, None without samples"""
+        with self._lock:
+            health = self._models.get(model)
+            return percentile(health.latencies, q) if health is not None else None
+
+    def record_success(self, model: str, latency: float) -> None:
+        """Record a successful call and close the model's breaker"""
+        with self._lock:
+            health = self._models.get(model)
+            if health is None:
+                return
+            health.outcomes.append(True)
+            health.latencies.append(latency)
+            health.consecutive_failures = 0
+            health.state = 'closed'
+
+    def record_failure(self, model: str, error: Exception, permanent: bool = False) -> None:
+        """
+        Record a failed call
+
+        Args:
+            model: Model name
+            error: The exception raised
+            permanent: True for errors that will not go away by retrying
+                (decommissioned or unknown model)
+        """
+        with self._lock:
+            health = self._models.get(model)
+            if health is None:
+                return
+            health.outcomes.append(False)
+            health.consecutive_failures += 1
+            health.last_error = str(error)[:200]
+            if permanent:
+                health.state = 'open'
+                health.open_until = time.monotonic() + self.permanent_cooldown_seconds
+            elif health.state == 'half_open' or health.consecutive_failures >= self.failure_threshold:
+                health.state = 'open'
+                health.open_until = time.monotonic() + self.cooldown_seconds
+
+    def status(self) -> Dict:
+        """Per-model routing state for the status endpoint"""
+        now = time.monotonic()
+        with self._lock:
+            models = {}
+            for health in self._models.values():
+                p50 = percentile(health.latencies, 50)
+                p95 = percentile(health.latencies, 95)
+                rate = health.success_rate()
+                models[health.name] = {
+                    'tier': health.tier,
+                    'state': health.state,
+                    'success_rate': round(rate, 4) if rate is not None else None,
+                    'p50_latency_ms': round(p50 * 1000, 1) if p50 is not None else None,
+                    'p95_latency_ms': round(p95 * 1000, 1) if p95 is not None else None,
+                    'calls': len(health.outcomes),
+                    'consecutive_failures': health.consecutive_failures,
+                    'retry_in_seconds': round(max(0.0, health.open_until - now), 1) if health.state != 'closed' else 0,
+                    'last_error': health.last_error
+                }
+            return {'min_tier': self.min_tier, 'models': models}
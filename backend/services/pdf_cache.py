@@ -0,0 +1,85 @@
+"""
+PDF Cache - Size-bounded in-memory cache of rendered PDF reports
+Keyed by a hash of the evaluation content, so repeat downloads skip rendering
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class PDFCache:
+    """
+    LRU cache of rendered reports bounded by total bytes
+
+    Least recently used reports are evicted once the cached PDFs exceed
+    max_bytes; a single report larger than max_bytes is not cached.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Upper bound on the total size of cached PDFs (0 disables the cache)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(evaluation: Dict, *parts: str) -> str:
+        """
+        Content hash of an evaluation plus anything else printed in the report
+
+        Args:
+            evaluation: Evaluation dict (key order does not matter)
+            parts: Extra values that change the rendered output (e.g. the date)
+        """
+        canonical = json.dumps(evaluation, sort_keys=True, ensure_ascii=False, default=str)
+        payload = '\x1f'.join((canonical,) + parts)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached PDF for key, or None"""
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+            if pdf_bytes is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pdf_bytes
+
+    def set(self, key: str, pdf_bytes: bytes) -> None:
+        """Store a rendered PDF, evicting least recently used reports as needed"""
+        if len(pdf_bytes) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = pdf_bytes
+            self._size += len(pdf_bytes)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,55 @@
+"""
+PDF Export - Streams many rendered reports as one ZIP archive
+The archive is written to the response as each report arrives, so only the
+reports currently being rendered are held in memory
+"""
+
+import time
+import zipfile
+from typing import Iterable, Iterator, Tuple
+
+
+class _ChunkSink:
+    """
+    Write-only, non-seekable file object collecting what zipfile writes
+
+    zipfile detects the missing tell()/seek() and writes each member with
+    a trailing data descriptor instead of seeking back to patch its header.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(members: Iterable[Tuple[str, bytes]]) -> Iterator[bytes]:
+    """
+    Build a ZIP archive incrementally
+
+    Args:
+        members: (filename, content) pairs, consumed lazily
+
+    Yields:
+        bytes: Consecutive pieces of the archive
+    """
+    sink = _ChunkSink()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for filename, content in members:
+            info = zipfile.ZipInfo(filename, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, content)
+            yield sink.drain()
+    # Central directory, written when the archive closes
+    yield sink.drain()
@@ -1,75 +1,88 @@
 """
 PDF Generator Service - Creates downloadable PDF reports
+Styles are built once per process and rendered reports are cached by content
 """
 
 import os
 from datetime import datetime
+from io import BytesIO
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Flowable
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from typing import Dict
+from typing import Dict, List
+from xml.sax.saxutils import escape
+from services.pdf_cache import PDFCache
+from services.report_store import ReportStore
 
+# Report sections in order: (evaluation field, heading, is a bullet list)
+REPORT_SECTIONS = [
+    ('executive_summary', "Executive Summary", False),
+    ('problem_statement', "Problem Statement", False),
+    ('target_users', "Target Users", False),
+    ('market_potential', "Market Potential", False),
+    ('technical_feasibility', "Technical Feasibility", False),
+    ('innovation_uniqueness', "Innovation & Uniqueness", False),
+    ('risks_challenges', "Risks & Challenges", False),
+    ('strengths', "Strengths", True),
+    ('weaknesses', "Weaknesses", True),
+    ('improvement_suggestions', "Improvement Suggestions", True),
+    ('final_recommendation', "Final Recommendation", False),
+]
 
-class PDFGenerator:
-    """Service for generating PDF evaluation reports"""
+# Feasibility score color bands: (minimum score, color)
+SCORE_COLORS = [
+    (70, '#27ae60'),  # Green
+    (50, '#f39c12'),  # Orange
+    (None, '#e74c3c'),  # Red
+]
+
+
+class _Bookmark(Flowable):
+    """Zero-size flowable marking a link destination and an outline entry"""
     
-    def __init__(self):
-        self.output_dir = "reports"
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+    def __init__(self, key: str, title: str):
+        super().__init__()
+        self.key = key
+        self.title = title
     
-    def generate_report(self, evaluation: Dict) -> str:
-        """
-        Generate PDF report from evaluation data
-        
-        Args:
-            evaluation: Dictionary containing evaluation results
-            
-        Returns:
-            str: Path to generated PDF file
-        """
-        # Create filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"startup_evaluation_{timestamp}.pdf"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
-        
-        # Container for PDF elements
-        story = []
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
+    def wrap(self, available_width, available_height):
+        return 0, 0
+    
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+
+
+def build_report_styles() -> Dict[str, ParagraphStyle]:
+    """
+    Build every paragraph style the report uses
+    
+    Returns:
+        dict: Style name -> ParagraphStyle (one 'score_<color>' style per score band)
+    """
+    styles = getSampleStyleSheet()
+    report_styles = {
+        'normal': styles['Normal'],
+        'title': ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=24,
             textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=30,
             alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=16,
             textColor=colors.HexColor('#2c3e50'),
             spaceAfter=12,
             spaceBefore=20
-        )
-        
-        body_style = ParagraphStyle(
+        ),
+        'body': ParagraphStyle(
             'CustomBody',
             parent=styles['BodyText'],
             fontSize=11,
@@ -77,101 +90,210 @@ class PDFGenerator:
             alignment=TA_JUSTIFY,
             spaceAfter=12
         )
-        
-        # Title
-        story.append(Paragraph("Startup Evaluation Report", title_style))
-        story.append(Spacer(1, 0.2*inch))
-        
-        # Date
-        date_str = datetime.now().strftime("%B %d, %Y")
-        story.append(Paragraph(f"<i>Generated on: {date_str}</i>", styles['Normal']))
-        story.append(Spacer(1, 0.3*inch))
-        
-        # Feasibility Score (Highlighted)
-        score = evaluation.get('feasibility_score', 0)
-        score_color = self._get_score_color(score)
-        score_style = ParagraphStyle(
+    }
+    for _, color in SCORE_COLORS:
+        report_styles[f'score_{color}'] = ParagraphStyle(
             'ScoreStyle',
             parent=styles['Heading1'],
             fontSize=48,
-            textColor=score_color,
+            textColor=colors.HexColor(color),
             alignment=TA_CENTER,
             spaceAfter=20
         )
-        story.append(Paragraph(f"Feasibility Score: {score}/100", score_style))
-        story.append(Spacer(1, 0.3*inch))
+    return report_styles
+
+
+class PDFGenerator:
+    """Service for generating PDF evaluation reports"""
+    
+    def __init__(self):
+        self.output_dir = "reports"
+        # Written reports, named by content hash and evicted by age, size and count
+        # (the directory is created and indexed on first use)
+        self.store = ReportStore(
+            self.output_dir,
+            max_bytes=int(os.getenv('REPORT_STORE_MAX_BYTES', str(512 * 1024 * 1024))),
+            max_files=int(os.getenv('REPORT_STORE_MAX_FILES', '10000')),
+            max_age_seconds=float(os.getenv('REPORT_STORE_MAX_AGE_SECONDS', str(7 * 24 * 3600)))
+        )
         
-        # Executive Summary
-        story.append(Paragraph("Executive Summary", heading_style))
-        story.append(Paragraph(evaluation.get('executive_summary', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        # Styles are read-only during layout, so one set serves every render
+        self.styles = build_report_styles()
         
-        # Problem Statement
-        story.append(Paragraph("Problem Statement", heading_style))
-        story.append(Paragraph(evaluation.get('problem_statement', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        # Rendered reports by content hash, so repeat downloads skip rendering
+        self.cache = PDFCache(max_bytes=int(os.getenv('PDF_CACHE_MAX_BYTES', str(64 * 1024 * 1024))))
+    
+    def generate_report(self, evaluation: Dict) -> str:
+        """
+        Generate PDF report from evaluation data
         
-        # Target Users
-        story.append(Paragraph("Target Users", heading_style))
-        story.append(Paragraph(evaluation.get('target_users', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        Args:
+            evaluation: Dictionary containing evaluation results
+            
+        Returns:
+            str: Path to generated PDF file (identical evaluations share one file)
+        """
+        date_str = self.report_date()
+        key = self.cache.make_key(evaluation, date_str)
+        filepath = self.store.get(key)
+        if filepath is None:
+            filepath = self.store.put(key, self._cached_render(key, evaluation, date_str))
+        return filepath
+    
+    def generate_report_bytes(self, evaluation: Dict) -> bytes:
+        """
+        Generate PDF report in memory, without touching the disk
         
-        # Market Potential
-        story.append(Paragraph("Market Potential", heading_style))
-        story.append(Paragraph(evaluation.get('market_potential', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        Reports are cached by a hash of the evaluation and the date printed
+        on them, so downloading the same evaluation again costs a lookup.
         
-        # Technical Feasibility
-        story.append(Paragraph("Technical Feasibility", heading_style))
-        story.append(Paragraph(evaluation.get('technical_feasibility', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        Args:
+            evaluation: Dictionary containing evaluation results
+            
+        Returns:
+            bytes: The PDF document
+        """
+        date_str = self.report_date()
+        return self._cached_render(self.cache.make_key(evaluation, date_str), evaluation, date_str)
+    
+    def _cached_render(self, key: str, evaluation: Dict, date_str: str) -> bytes:
+        """Rendered report from the PDF cache, rendering it on a miss"""
+        pdf_bytes = self.cache.get(key)
+        if pdf_bytes is None:
+            pdf_bytes = self.render_bytes(evaluation, date_str)
+            self.cache.set(key, pdf_bytes)
+        return pdf_bytes
+    
+    @staticmethod
+    def report_date() -> str:
+        """Date printed on reports generated now"""
+        return datetime.now().strftime("%B %d, %Y")
+    
+    @staticmethod
+    def report_filename() -> str:
+        """Download filename for a report generated today"""
+        return f"startup_evaluation_{datetime.now().strftime('%Y%m%d')}.pdf"
+    
+    def render_bytes(self, evaluation: Dict, date_str: str) -> bytes:
+        """Render a report into a fresh in-memory buffer (bypasses the cache)"""
+        buffer = BytesIO()
+        self._render(buffer, evaluation, date_str)
+        return buffer.getvalue()
+    
+    def render_combined_bytes(self, evaluations: List[Dict], date_str: str) -> bytes:
+        """
+        Render several reports into one PDF with a table of contents
         
-        # Innovation & Uniqueness
-        story.append(Paragraph("Innovation & Uniqueness", heading_style))
-        story.append(Paragraph(evaluation.get('innovation_uniqueness', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        The contents page links to each report, and each report is also a
+        PDF outline (bookmark) entry. Links need no page numbers, so the
+        document is laid out in a single pass.
         
-        # Risks & Challenges
-        story.append(Paragraph("Risks & Challenges", heading_style))
-        story.append(Paragraph(evaluation.get('risks_challenges', 'N/A'), body_style))
-        story.append(Spacer(1, 0.2*inch))
+        Args:
+            evaluations: Evaluations in the order they should appear
+            date_str: Date printed on the reports
+            
+        Returns:
+            bytes: The combined PDF document
+        """
+        styles = self.styles
+        story = [
+            Paragraph("Startup Evaluation Reports", styles['title']),
+            Paragraph(f"<i>Generated on: {date_str} - {len(evaluations)} reports</i>", styles['normal']),
+            Spacer(1, 0.3*inch),
+            Paragraph("Contents", styles['heading'])
+        ]
+        for number, evaluation in enumerate(evaluations, 1):
+            story.append(Paragraph(
+                f'<a href="#report-{number}" color="#2c3e50">{number}. {escape(self.report_title(evaluation))}'
+                f' ({evaluation.get("feasibility_score", 0)}/100)</a>',
+                styles['normal']
+            ))
         
-        # Strengths
-        story.append(Paragraph("Strengths", heading_style))
-        strengths = evaluation.get('strengths', [])
-        for strength in strengths:
-            story.append(Paragraph(f"• {strength}", body_style))
-        story.append(Spacer(1, 0.2*inch))
+        for number, evaluation in enumerate(evaluations, 1):
+            story.append(PageBreak())
+            story.append(_Bookmark(f"report-{number}", f"{number}. {self.report_title(evaluation)}"))
+            story.extend(self._report_story(evaluation, date_str))
         
-        # Weaknesses
-        story.append(Paragraph("Weaknesses", heading_style))
-        weaknesses = evaluation.get('weaknesses', [])
-        for weakness in weaknesses:
-            story.append(Paragraph(f"• {weakness}", body_style))
-        story.append(Spacer(1, 0.2*inch))
+        buffer = BytesIO()
+        self._document(buffer).build(story)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def report_title(evaluation: Dict, max_length: int = 80) -> str:
+        """Short title for an evaluation: its title field or the start of its summary"""
+        title = evaluation.get('title') or evaluation.get('executive_summary') or 'Untitled evaluation'
+        title = ' '.join(str(title).split())
+        return title if len(title) <= max_length else title[:max_length - 3].rstrip() + '...'
+    
+    @staticmethod
+    def _document(target) -> SimpleDocTemplate:
+        """
+        Document template writing to target (a file path or a binary buffer)
         
-        # Improvement Suggestions
-        story.append(Paragraph("Improvement Suggestions", heading_style))
-        suggestions = evaluation.get('improvement_suggestions', [])
-        for suggestion in suggestions:
-            story.append(Paragraph(f"• {suggestion}", body_style))
+        Rendered with invariant=True so identical content gives identical bytes.
+        """
+        return SimpleDocTemplate(
+            target,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18,
+            invariant=True
+        )
+    
+    def _render(self, target, evaluation: Dict, date_str: str) -> None:
+        """
+        Lay out the report and write it to target (a file path or a binary buffer)
+        
+        Every call builds its own document and story: flowables are
+        measured and split in place during layout, so only the styles are
+        shared between concurrent renders.
+        """
+        # Build PDF
+        self._document(target).build(self._report_story(evaluation, date_str))
+    
+    def _report_story(self, evaluation: Dict, date_str: str) -> list:
+        """Flowables of one report"""
+        styles = self.styles
+        
+        # Container for PDF elements
+        story = []
+        
+        # Title
+        story.append(Paragraph("Startup Evaluation Report", styles['title']))
         story.append(Spacer(1, 0.2*inch))
         
-        # Final Recommendation
-        story.append(Paragraph("Final Recommendation", heading_style))
-        story.append(Paragraph(evaluation.get('final_recommendation', 'N/A'), body_style))
+        # Date
+        story.append(Paragraph(f"<i>Generated on: {date_str}</i>", styles['normal']))
+        story.append(Spacer(1, 0.3*inch))
         
-        # Build PDF
-        doc.build(story)
+        # Feasibility Score (Highlighted)
+        score = evaluation.get('feasibility_score', 0)
+        score_style = styles[f'score_{self._score_color_hex(score)}']
+        story.append(Paragraph(f"Feasibility Score: {score}/100", score_style))
+        story.append(Spacer(1, 0.3*inch))
         
-        return filepath
+        # Sections
+        for index, (field, heading, is_list) in enumerate(REPORT_SECTIONS):
+            story.append(Paragraph(heading, styles['heading']))
+            if is_list:
+                for item in evaluation.get(field, []):
+                    story.append(Paragraph(f"• {item}", styles['body']))
+            else:
+                story.append(Paragraph(evaluation.get(field, 'N/A'), styles['body']))
+            if index < len(REPORT_SECTIONS) - 1:
+                story.append(Spacer(1, 0.2*inch))
+        
+        return story
+    
+    @staticmethod
+    def _score_color_hex(score: int) -> str:
+        """Hex color of the score band a score falls in"""
+        for minimum, color in SCORE_COLORS:
+            if minimum is None or score >= minimum:
+                return color
     
     def _get_score_color(self, score: int) -> colors.HexColor:
         """Get color based on score"""
-        if score >= 70:
-            return colors.HexColor('#27ae60')  # Green
-        elif score >= 50:
-            return colors.HexColor('#f39c12')  # Orange
-        else:
-            return colors.HexColor('#e74c3c')  # Red
-
+        return colors.HexColor(self._score_color_hex(score))
@@ -0,0 +1,366 @@
+"""
+PDF Jobs - Background PDF rendering on a process pool
+Keeps CPU-bound ReportLab layout off the request threads; clients submit a
+job, poll its status and download the result
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+# ReportLab is only imported by the worker processes and the generator itself
+if TYPE_CHECKING:
+    from services.pdf_generator import PDFGenerator
+
+
+class QueueFull(Exception):
+    """Raised when too many PDF jobs are already waiting"""
+
+
+class RenderTimeout(Exception):
+    """Raised when a render does not finish within the queue's render timeout"""
+
+
+# One generator per worker process, so styles are built once per worker
+_worker_generator = None
+
+
+def _worker() -> "PDFGenerator":
+    """This worker process's generator"""
+    global _worker_generator
+    if _worker_generator is None:
+        from services.pdf_generator import PDFGenerator
+        _worker_generator = PDFGenerator()
+    return _worker_generator
+
+
+def _render_job(evaluation: Dict, date_str: str) -> bytes:
+    """Render one report inside a worker process"""
+    return _worker().render_bytes(evaluation, date_str)
+
+
+def _render_combined_job(evaluations: List[Dict], date_str: str) -> bytes:
+    """Render a combined multi-report PDF inside a worker process"""
+    return _worker().render_combined_bytes(evaluations, date_str)
+
+
+class _Job:
+    """State of one submitted render"""
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.created_at = time.time()
+        self.finished_at = None
+        self.future: Optional[Future] = None
+        self.result: Optional[bytes] = None
+        self.error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.result is not None:
+            return 'done'
+        if self.error is not None:
+            return 'failed'
+        if self.future is not None and self.future.running():
+            return 'running'
+        return 'queued'
+
+
+class PDFJobQueue:
+    """
+    Process-pool job queue for PDF reports
+
+    Worker processes are started on the first submission (with the spawn
+    start method, which is safe in a multi-threaded server). Rendered
+    reports go through the generator's PDF cache, so a cached report
+    completes immediately. Finished jobs are kept for ttl_seconds.
+    """
+
+    def __init__(self, pdf_generator: "PDFGenerator", max_workers: int = 2,
+                 max_queue: int = 100, ttl_seconds: float = 600.0,
+                 render_timeout: float = 120.0):
+        """
+        Args:
+            pdf_generator: Generator whose cache and report date are used
+            max_workers: Number of rendering processes
+            max_queue: Maximum renders waiting or running at once (jobs and exports)
+            ttl_seconds: How long finished jobs (and their PDFs) are kept
+            render_timeout: Longest a request thread waits for a render (or for
+                room in the queue during an export)
+        """
+        self.pdf_generator = pdf_generator
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.ttl_seconds = ttl_seconds
+        self.render_timeout = render_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, _Job] = {}
+        self._inline = 0   # Export renders in flight (not tracked as jobs)
+        self._lock = threading.Lock()
+        self._room = threading.Condition(self._lock)
+        self._counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'cache_hits': 0,
+                          'rejected': 0, 'expired': 0}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    def _submit(self, fn, *args) -> Future:
+        """Submit work to the pool (caller holds the lock)"""
+        try:
+            return self._executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory): start a fresh pool
+            self._pool = None
+            return self._executor().submit(fn, *args)
+
+    def _pending(self) -> int:
+        """Renders waiting or running, jobs and exports alike (caller holds the lock)"""
+        return self._inline + sum(1 for job in self._jobs.values() if job.finished_at is None)
+
+    def _admit(self) -> None:
+        """
+        Check there is room for one more render (caller holds the lock)
+
+        Raises:
+            QueueFull: If max_queue renders are already pending
+        """
+        if self._pending() >= self.max_queue:
+            self._counters['rejected'] += 1
+            raise QueueFull(f"PDF job queue is full ({self.max_queue} pending); try again later")
+
+    def _submit_inline(self, fn, *args, wait_seconds: float = 0) -> Optional[Future]:
+        """
+        Submit an export render, counted against max_queue until it finishes
+
+        Args:
+            wait_seconds: How long to wait for room; 0 raises QueueFull at once,
+                None returns None instead of waiting
+
+        Raises:
+            QueueFull: If there is still no room after wait_seconds
+        """
+        with self._room:
+            if wait_seconds is None:
+                if self._pending() >= self.max_queue:
+                    return None
+            elif wait_seconds > 0:
+                self._room.wait_for(lambda: self._pending() < self.max_queue, timeout=wait_seconds)
+            self._admit()
+            self._inline += 1
+            future = self._submit(fn, *args)
+        future.add_done_callback(self._release_inline)
+        return future
+
+    def _release_inline(self, future: Future) -> None:
+        with self._room:
+            self._inline -= 1
+            self._room.notify_all()
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop finished jobs older than the TTL (caller holds the lock)"""
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._counters['expired'] += len(expired)
+
+    def submit(self, evaluation: Dict) -> str:
+        """
+        Queue a report for rendering
+
+        Returns:
+            str: Job id
+
+        Raises:
+            QueueFull: If max_queue jobs are already pending
+        """
+        date_str = self.pdf_generator.report_date()
+        cache = self.pdf_generator.cache
+        key = cache.make_key(evaluation, date_str)
+        job = _Job(uuid.uuid4().hex)
+
+        with self._lock:
+            now = time.time()
+            self._purge_expired(now)
+            cached = cache.get(key)
+            if cached is not None:
+                job.result = cached
+                job.finished_at = now
+                self._counters['cache_hits'] += 1
+            else:
+                self._admit()
+                job.future = self._submit(_render_job, evaluation, date_str)
+            self._jobs[job.id] = job
+            self._counters['submitted'] += 1
+
+        if job.future is not None:
+            job.future.add_done_callback(lambda future: self._finish(job, key, future))
+        return job.id
+
+    def _finish(self, job: _Job, key: str, future: Future) -> None:
+        """Record a finished render (runs on the pool's result thread)"""
+        try:
+            result = future.result()
+        except Exception as e:
+            with self._room:
+                job.error = f"{type(e).__name__}: {e}"
+                job.finished_at = time.time()
+                self._counters['failed'] += 1
+                self._room.notify_all()
+            return
+        self.pdf_generator.cache.set(key, result)
+        with self._room:
+            job.result = result
+            job.finished_at = time.time()
+            self._counters['completed'] += 1
+            self._room.notify_all()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Status of a job, or None if it is unknown or expired"""
+        with self._lock:
+            self._purge_expired(time.time())
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            status = {
+                'job_id': job.id,
+                'status': job.status,
+                'created_at': job.created_at,
+                'finished_at': job.finished_at
+            }
+            if job.error is not None:
+                status['error'] = job.error
+            if job.result is not None:
+                status['size_bytes'] = len(job.result)
+            return status
+
+    def result(self, job_id: str) -> Optional[bytes]:
+        """The rendered PDF of a finished job, or None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.result if job is not None else None
+
+    def render_many(self, evaluations: List[Dict], window: int = None) -> Iterator[Tuple[int, Optional[bytes], Optional[str]]]:
+        """
+        Render many reports in parallel on the worker pool
+
+        At most `window` renders (default: twice the worker count) are in
+        flight, and only as many as max_queue leaves room for, so memory
+        and queue depth stay bounded however many reports are requested.
+        Cached reports are yielded without rendering.
+
+        Returns:
+            iterator: (index, PDF bytes or None, error message or None), in completion order
+
+        Raises:
+            QueueFull: If the queue is already full (checked before any rendering,
+                so callers can still answer 503)
+        """
+        with self._lock:
+            self._admit()
+        return self._render_many(evaluations, window or 2 * self.max_workers)
+
+    def _render_many(self, evaluations: List[Dict], window: int) -> Iterator[Tuple[int, Optional[bytes], Optional[str]]]:
+        """Generator behind render_many"""
+        date_str = self.pdf_generator.report_date()
+        cache = self.pdf_generator.cache
+        items = iter(enumerate(evaluations))
+        pending: Dict[Future, Tuple[int, str]] = {}
+        waiting = None   # Item that found the queue full, submitted once there is room
+        exhausted = False
+        try:
+            while pending or waiting or not exhausted:
+                while len(pending) < window:
+                    item, waiting = waiting or next(items, None), None
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, evaluation = item
+                    key = cache.make_key(evaluation, date_str)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        yield index, cached, None
+                        continue
+                    try:
+                        # With nothing of ours in flight, wait for room instead of stalling
+                        future = self._submit_inline(_render_job, evaluation, date_str,
+                                                     wait_seconds=None if pending else self.render_timeout)
+                    except QueueFull as e:
+                        # Still no room after render_timeout: fail the rest of the export
+                        for index, _ in [item, *items]:
+                            yield index, None, f"QueueFull: {e}"
+                        exhausted = True
+                        break
+                    if future is None:
+                        waiting = item
+                        break
+                    pending[future] = (index, key)
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, timeout=self.render_timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Nothing finished in time: give up on what is still in flight
+                    for future in list(pending):
+                        index, _ = pending.pop(future)
+                        future.cancel()
+                        yield index, None, f"RenderTimeout: not rendered within {self.render_timeout:g}s"
+                    continue
+                for future in done:
+                    index, key = pending.pop(future)
+                    try:
+                        pdf_bytes = future.result()
+                    except Exception as e:
+                        yield index, None, f"{type(e).__name__}: {e}"
+                        continue
+                    cache.set(key, pdf_bytes)
+                    yield index, pdf_bytes, None
+        finally:
+            # Consumer stopped early (e.g. client disconnected)
+            for future in pending:
+                future.cancel()
+
+    def render_combined(self, evaluations: List[Dict]) -> bytes:
+        """
+        Render one PDF with a table of contents on a worker process and wait for it
+
+        Raises:
+            QueueFull: If max_queue renders are already pending
+            RenderTimeout: If rendering takes longer than render_timeout
+        """
+        future = self._submit_inline(_render_combined_job, evaluations, self.pdf_generator.report_date())
+        try:
+            return future.result(timeout=self.render_timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise RenderTimeout(f"Combined PDF was not rendered within {self.render_timeout:g}s")
+
+    def stats(self) -> Dict:
+        """Job counters and queue depth"""
+        with self._lock:
+            pending_jobs = sum(1 for job in self._jobs.values() if job.finished_at is None)
+            return {
+                **self._counters,
+                'pending': pending_jobs + self._inline,
+                'export_renders': self._inline,
+                'retained': len(self._jobs) - pending_jobs,
+                'max_queue': self.max_queue,
+                'workers': self.max_workers
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
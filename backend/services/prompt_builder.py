@@ -0,0 +1,247 @@
+"""
+Prompt Builder - Builds the evaluation prompt within a token budget
+Precompiles the static instructions once, trims overly long ideas and sizes
+max_tokens from the observed lengths of previous completions
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from services.model_router import percentile
+
+# Bump whenever the prompt or response post-processing changes, so cached
+# evaluations produced by an older prompt are not served
+PROMPT_VERSION = "1"
+
+SYSTEM_PROMPT = "You are a professional startup evaluator. Always respond with valid JSON only, no markdown formatting."
+
+IDEA_PLACEHOLDER = "<<IDEA_TEXT>>"
+
+EVALUATION_TEMPLATE = """You are an expert startup evaluator and business analyst. Analyze the following startup idea and provide a comprehensive evaluation.
+
+STARTUP IDEA:
+<<IDEA_TEXT>>
+
+INSTRUCTIONS:
+1. Analyze the idea thoroughly across all required dimensions
+2. Be CRITICAL and REALISTIC - if the idea is technically impossible, clearly state this
+3. Consider current technology limitations - do not give high scores to science fiction ideas
+4. Provide ONLY valid JSON output - no markdown, no extra text
+5. Do NOT hallucinate metrics or data - use reasonable estimates based on the idea description
+6. Be objective and balanced - penalize unrealistic/impossible ideas appropriately
+7. Ensure all fields are filled with meaningful content
+8. If the idea requires technology that doesn't exist (e.g., reading dreams, time travel, teleportation), mark technical feasibility as very low
+
+REQUIRED OUTPUT FORMAT (JSON only):
+{
+  "executive_summary": "A 2-3 sentence overview of the startup idea and its potential",
+  "problem_statement": "Clear description of the problem being solved",
+  "target_users": "Description of the target customer segment",
+  "market_potential": "Assessment of market size and opportunity",
+  "technical_feasibility": "Analysis of technical requirements and feasibility",
+  "innovation_uniqueness": "Evaluation of how innovative and unique the idea is",
+  "risks_challenges": "Key risks and challenges the startup may face",
+  "strengths": ["Strength 1", "Strength 2", "Strength 3"],
+  "weaknesses": ["Weakness 1", "Weakness 2", "Weakness 3"],
+  "improvement_suggestions": ["Suggestion 1", "Suggestion 2", "Suggestion 3"],
+  "final_recommendation": "Overall recommendation and next steps",
+  "feasibility_score": 0
+}
+
+IMPORTANT:
+- Return ONLY the JSON object, no markdown formatting
+- feasibility_score should be an integer between 0-100 (you will provide initial estimate)
+- Be REALISTIC with the score:
+  * 0-30: Technically impossible or requires non-existent technology
+  * 31-50: Very difficult, requires breakthrough technology not yet available
+  * 51-70: Challenging but feasible with current technology
+  * 71-85: Good idea, technically feasible, clear path to execution
+  * 86-100: Excellent idea, highly feasible, strong market potential
+- All string fields should be 1-3 sentences
+- Arrays should have 3 items each
+- Be specific and actionable in your analysis
+- If the idea is impossible (e.g., reading dreams, mind control, time travel), give a low score (0-40) and explain why in technical_feasibility
+
+Now provide the JSON evaluation:"""
+
+# Words, digit runs and single punctuation marks, roughly how BPE tokenizers split text
+_TOKEN_PIECE = re.compile(r'[A-Za-z]+|\d+|[^\sA-Za-z\d]')
+_TRIM_MARKER = " [...] "
+
+# Completion budget per field when asking only for missing fields
+MISSING_FIELD_TOKENS = 200
+
+
+def _piece_tokens(piece: str) -> int:
+    """Approximate tokens in one piece: long words and numbers split into several"""
+    if piece[0].isalpha():
+        return 1 + (len(piece) - 1) // 6
+    if piece[0].isdigit():
+        return 1 + (len(piece) - 1) // 3
+    return 1
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Local estimate of the number of tokens in a text
+
+    Slightly overestimates typical English for Llama-family tokenizers,
+    which is the safe side for budgeting.
+    """
+    return sum(_piece_tokens(piece) for piece in _TOKEN_PIECE.findall(text))
+
+
+class PromptBuilder:
+    """
+    Builds evaluation prompts and chooses max_tokens
+
+    Ideas longer than max_idea_tokens are condensed (runs of whitespace
+    collapsed) and, if still too long, trimmed to their beginning and end
+    with a marker in between. max_tokens follows the recent completion
+    lengths (p99 plus headroom) between min_max_tokens and max_max_tokens.
+    The ceiling is used until enough completions have been seen, and for
+    the next ceiling_hold requests after a completion is cut off by the
+    limit, so a truncation takes effect immediately instead of waiting for
+    enough cut-off samples to reach the p99.
+    """
+
+    def __init__(self, max_idea_tokens: int = 1500, max_max_tokens: int = 2000,
+                 min_max_tokens: int = 600, adaptive: bool = True, headroom: float = 1.25,
+                 min_samples: int = 20, window: int = 500, ceiling_hold: int = 50):
+        """
+        Args:
+            max_idea_tokens: Token budget for the idea text (0 = unlimited)
+            max_max_tokens: Ceiling (and cold-start value) for max_tokens
+            min_max_tokens: Floor for adaptive max_tokens
+            adaptive: Size max_tokens from observed completions
+            headroom: Multiplier applied to the p99 completion length
+            min_samples: Completions needed before adapting
+            window: Number of recent requests kept for statistics
+            ceiling_hold: Requests that use the ceiling after a truncation
+        """
+        self.max_idea_tokens = max_idea_tokens
+        self.max_max_tokens = max_max_tokens
+        self.min_max_tokens = min(min_max_tokens, max_max_tokens)
+        self.adaptive = adaptive
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self.ceiling_hold = ceiling_hold
+
+        # Precompiled static parts of the prompt
+        self._prefix, _, self._suffix = EVALUATION_TEMPLATE.partition(IDEA_PLACEHOLDER)
+        self.static_tokens = estimate_tokens(self._prefix + self._suffix) + estimate_tokens(SYSTEM_PROMPT)
+
+        self._lock = threading.Lock()
+        self._completion_tokens = deque(maxlen=window)
+        self._prompt_tokens = deque(maxlen=window)
+        self._hold_remaining = 0
+        self._counters = {'requests': 0, 'prompt_tokens': 0, 'completion_tokens': 0,
+                          'truncated_completions': 0, 'trimmed_ideas': 0}
+
+    def fit_idea(self, idea_text: str) -> str:
+        """Condense and trim an idea to the idea token budget"""
+        if self.max_idea_tokens <= 0 or estimate_tokens(idea_text) <= self.max_idea_tokens:
+            return idea_text
+
+        with self._lock:
+            self._counters['trimmed_ideas'] += 1
+
+        condensed = re.sub(r'\n\s*\n+', '\n\n', re.sub(r'[ \t]+', ' ', idea_text)).strip()
+        if estimate_tokens(condensed) <= self.max_idea_tokens:
+            return condensed
+
+        # Keep the opening (usually the pitch) and the end (usually the ask)
+        head_budget = self.max_idea_tokens * 2 // 3
+        tail_budget = self.max_idea_tokens - head_budget - estimate_tokens(_TRIM_MARKER)
+        pieces = list(_TOKEN_PIECE.finditer(condensed))
+
+        used, head_end = 0, 0
+        for piece in pieces:
+            used += _piece_tokens(piece.group())
+            if used > head_budget:
+                break
+            head_end = piece.end()
+
+        used, tail_start = 0, len(condensed)
+        for piece in reversed(pieces):
+            used += _piece_tokens(piece.group())
+            if used > tail_budget or piece.start() < head_end:
+                break
+            tail_start = piece.start()
+
+        return condensed[:head_end].rstrip() + _TRIM_MARKER + condensed[tail_start:].lstrip()
+
+    def build(self, idea_text: str) -> str:
+        """Full user prompt for an idea"""
+        return self._prefix + self.fit_idea(idea_text) + self._suffix
+
+    def build_missing_fields(self, prompt: str, fields: List[str]) -> Tuple[str, int]:
+        """
+        Follow-up prompt asking only for fields missing from a response
+
+        Returns:
+            tuple: (prompt, max_tokens sized for just those fields)
+        """
+        follow_up = (
+            f"{prompt}\n\nYour previous answer was missing these fields: {', '.join(fields)}. "
+            "Respond with a JSON object containing ONLY these fields, in the format described above."
+        )
+        return follow_up, min(self.max_max_tokens, MISSING_FIELD_TOKENS * len(fields) + 50)
+
+    def max_tokens(self) -> int:
+        """Completion token limit for the next request"""
+        if not self.adaptive:
+            return self.max_max_tokens
+        with self._lock:
+            if self._hold_remaining or len(self._completion_tokens) < self.min_samples:
+                return self.max_max_tokens
+            observed = percentile(self._completion_tokens, 99)
+        return int(max(self.min_max_tokens, min(self.max_max_tokens, observed * self.headroom)))
+
+    def record_usage(self, prompt_tokens: Optional[int], completion_tokens: Optional[int],
+                     truncated: bool = False, sample: bool = True) -> None:
+        """
+        Record the token counts of one request
+
+        Args:
+            prompt_tokens: Prompt tokens reported (or estimated) for the request
+            completion_tokens: Completion tokens reported (or estimated)
+            truncated: True if the completion stopped at max_tokens
+            sample: False for requests (e.g. missing-field follow-ups) whose
+                length should not steer the adaptive max_tokens
+        """
+        with self._lock:
+            self._counters['requests'] += 1
+            if prompt_tokens is not None:
+                self._counters['prompt_tokens'] += prompt_tokens
+                self._prompt_tokens.append(prompt_tokens)
+            if completion_tokens is not None:
+                self._counters['completion_tokens'] += completion_tokens
+            if completion_tokens is not None and sample:
+                # A cut-off completion says nothing about the real length:
+                # count it as needing the ceiling, and hold the ceiling for
+                # the next requests since one sample barely moves the p99
+                self._completion_tokens.append(self.max_max_tokens if truncated else completion_tokens)
+                if truncated:
+                    self._hold_remaining = self.ceiling_hold
+                elif self._hold_remaining:
+                    self._hold_remaining -= 1
+            if truncated:
+                self._counters['truncated_completions'] += 1
+
+    def stats(self) -> Dict:
+        """Token usage counters and the current max_tokens"""
+        with self._lock:
+            completions = list(self._completion_tokens)
+            prompts = list(self._prompt_tokens)
+            counters = dict(self._counters)
+        return {
+            **counters,
+            'avg_prompt_tokens': round(sum(prompts) / len(prompts), 1) if prompts else None,
+            'avg_completion_tokens': round(sum(completions) / len(completions), 1) if completions else None,
+            'p95_completion_tokens': percentile(completions, 95),
+            'static_prompt_tokens': self.static_tokens,
+            'max_idea_tokens': self.max_idea_tokens,
+            'current_max_tokens': self.max_tokens()
+        }
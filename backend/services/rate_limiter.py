@@ -0,0 +1,265 @@
+"""
+Rate Limiter - Client-side pacing and retry policy for Groq calls
+Keeps requests and tokens per minute under the account quota and backs off
+on rate-limit and transient upstream errors instead of failing requests
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from groq import APIConnectionError, APIStatusError
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when a call would have to wait longer than the limiter allows,
+    even after backing off; retry_after is the suggested wait in seconds
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_transient_error(error: Exception) -> bool:
+    """True for errors worth retrying: rate limits, timeouts, connection and 5xx errors"""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_SECONDS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse '12', '7.66s', '2m59.56s' or '250ms' into seconds"""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    How long the upstream asked us to wait, from the error's response headers
+
+    Checks retry-after-ms, retry-after (seconds or HTTP date) and Groq's
+    x-ratelimit-reset-requests / x-ratelimit-reset-tokens headers.
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+
+    if headers.get('retry-after-ms'):
+        try:
+            return float(headers['retry-after-ms']) / 1000
+        except ValueError:
+            pass
+    if headers.get('retry-after'):
+        seconds = _parse_duration(headers['retry-after'])
+        if seconds is not None:
+            return seconds
+        try:
+            return max(0.0, parsedate_to_datetime(headers['retry-after']).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    resets = [
+        _parse_duration(headers[name])
+        for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+        if headers.get(name)
+    ]
+    resets = [seconds for seconds in resets if seconds is not None]
+    return max(resets) if resets else None
+
+
+class _Bucket:
+    """Token bucket refilled continuously at rate_per_minute (not thread-safe)"""
+
+    def __init__(self, rate_per_minute: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(rate_per_minute)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until the (possibly negative) level covers amount"""
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute token buckets shared by all callers
+
+    Callers reserve capacity up front and then sleep until their reservation
+    is covered, so under sustained overload requests queue up in arrival
+    order instead of all hitting the upstream and failing together. A
+    retry-after from the upstream pauses every caller until it has passed.
+    A quota of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_wait_seconds: float = 60.0, max_retries: int = 3,
+                 base_backoff: float = 0.5, max_backoff: float = 30.0):
+        """
+        Args:
+            requests_per_minute: Request quota (0 = unlimited)
+            tokens_per_minute: Token quota (0 = unlimited)
+            max_wait_seconds: Longest a call may queue; longer queues make it back off
+            max_retries: Retries of a transient error, and backoffs from a full
+                queue, before giving up
+            base_backoff: First backoff delay (seconds), doubled per retry
+            max_backoff: Upper bound on a single backoff delay (seconds)
+        """
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_wait_seconds = max_wait_seconds
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._counters = {'calls': 0, 'queued': 0, 'wait_seconds': 0.0, 'requeued': 0,
+                          'retries': 0, 'upstream_rate_limits': 0, 'rejected': 0}
+
+    def _reserve(self, tokens: int) -> Tuple[float, bool]:
+        """
+        Reserve one request and tokens
+
+        Returns:
+            tuple: (seconds to wait before sending, whether the reservation was
+            made); nothing is reserved when the wait exceeds max_wait_seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._paused_until - now)
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    delay = max(delay, bucket.wait_for(min(amount, bucket.capacity)))
+
+            if delay > self.max_wait_seconds:
+                return delay, False
+
+            # Buckets may go negative: later callers then wait behind this one
+            for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                if bucket is not None:
+                    bucket.level -= amount
+            self._counters['calls'] += 1
+            if delay > 0:
+                self._counters['queued'] += 1
+                self._counters['wait_seconds'] += delay
+            return delay, True
+
+    def _requeue_delay(self, attempt: int, delay: float) -> float:
+        """
+        How long to back off before asking again for a slot the queue had no
+        room for: until the queue is short enough (at most max_backoff)
+
+        Raises:
+            RateLimitExceeded: Once max_retries backoffs did not get a slot
+        """
+        with self._lock:
+            if attempt >= self.max_retries:
+                self._counters['rejected'] += 1
+                raise RateLimitExceeded(
+                    f"Rate limit queue is full (next slot in {delay:.1f}s); try again later",
+                    retry_after=delay
+                )
+            self._counters['requeued'] += 1
+        wait = min(self.max_backoff, delay - self.max_wait_seconds)
+        return wait + random.uniform(0, self.base_backoff)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a request of about `tokens` tokens may be sent
+
+        When the queue is longer than max_wait_seconds, backs off and asks
+        again, up to max_retries times, before raising RateLimitExceeded.
+        """
+        attempt = 0
+        while True:
+            delay, reserved = self._reserve(tokens)
+            if reserved:
+                break
+            time.sleep(self._requeue_delay(attempt, delay))
+            attempt += 1
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """Async counterpart of acquire"""
+        attempt = 0
+        while True:
+            delay, reserved = self._reserve(tokens)
+            if reserved:
+                break
+            await asyncio.sleep(self._requeue_delay(attempt, delay))
+            attempt += 1
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def settle(self, reserved_tokens: int, used_tokens: Optional[int]) -> None:
+        """Correct the token bucket once the actual usage of a call is known"""
+        if self._tokens is None or used_tokens is None:
+            return
+        with self._lock:
+            self._tokens.level = min(self._tokens.capacity, self._tokens.level + reserved_tokens - used_tokens)
+
+    def backoff(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Delay before retrying a failed call, or None if it should not be retried
+
+        Uses the upstream's retry-after when given (and pauses all callers
+        for that long), otherwise exponential backoff with full jitter.
+        """
+        if attempt >= self.max_retries or not is_transient_error(error):
+            return None
+
+        retry_after = retry_after_seconds(error)
+        with self._lock:
+            self._counters['retries'] += 1
+            if getattr(error, 'status_code', None) == 429:
+                self._counters['upstream_rate_limits'] += 1
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        if retry_after is not None:
+            # Small jitter so paused callers do not all resume in the same instant
+            return retry_after + random.uniform(0, self.base_backoff)
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+
+    def stats(self) -> Dict:
+        """Limiter counters and current bucket levels"""
+        with self._lock:
+            now = time.monotonic()
+            levels = {}
+            for name, bucket in (('requests', self._requests), ('tokens', self._tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    levels[f'{name}_available'] = round(bucket.level, 1)
+                    levels[f'{name}_per_minute'] = bucket.capacity
+            return {
+                **self._counters,
+                'wait_seconds': round(self._counters['wait_seconds'], 3),
+                'paused_for_seconds': round(max(0.0, self._paused_until - now), 3),
+                **levels
+            }
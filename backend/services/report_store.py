@@ -0,0 +1,157 @@
+"""
+Report Store - Bounded on-disk storage for generated PDF reports
+Files are named by content hash and evicted by age, size and count
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ReportStore:
+    """
+    Directory of reports with a maximum total size, file count and age
+
+    The directory is scanned once (on first use) into an in-memory index
+    ordered by modification time; after that, lookups and evictions only
+    touch the index and the files involved. Reading a report refreshes its
+    modification time, so the order is least-recently-used and survives
+    restarts. Files removed by another process are dropped from the index
+    when they are next looked up.
+    """
+
+    def __init__(self, directory: str = "reports", max_bytes: int = 512 * 1024 * 1024,
+                 max_files: int = 10000, max_age_seconds: float = 7 * 24 * 3600):
+        """
+        Args:
+            directory: Where reports are stored
+            max_bytes: Upper bound on the total size of stored reports (0 = unlimited)
+            max_files: Upper bound on the number of stored reports (0 = unlimited)
+            max_age_seconds: Reports unused for longer are deleted (0 = never)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.max_age_seconds = max_age_seconds
+        self._index: "OrderedDict[str, tuple]" = None   # filename -> (size, mtime), oldest first
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _ensure_index(self) -> None:
+        """Build the index with a single directory scan (caller holds the lock)"""
+        if self._index is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.tmp'):
+                    # Left over from an interrupted write
+                    self._remove(entry.name)
+                elif entry.name.endswith('.pdf'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((name, (size, mtime)) for mtime, name, size in entries)
+        self._size = sum(size for size, _ in self._index.values())
+        self._evict(time.time())
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def _remove(self, filename: str) -> None:
+        try:
+            os.remove(self._path(filename))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, filename: str) -> None:
+        size, _ = self._index.pop(filename)
+        self._size -= size
+
+    def _evict(self, now: float, keep: Optional[str] = None) -> None:
+        """
+        Delete expired reports, then least recently used ones over the limits
+
+        Args:
+            now: Current time
+            keep: Filename never evicted (the report being returned, which is
+                newest and so is only reached once it is the last one left)
+        """
+        while self._index:
+            filename, (_, mtime) = next(iter(self._index.items()))
+            if filename == keep:
+                break
+            expired = self.max_age_seconds > 0 and now - mtime > self.max_age_seconds
+            too_big = self.max_bytes > 0 and self._size > self.max_bytes
+            too_many = self.max_files > 0 and len(self._index) > self.max_files
+            if not (expired or too_big or too_many):
+                break
+            self._forget(filename)
+            self._remove(filename)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the stored report for key, or None"""
+        filename = f"{key}.pdf"
+        with self._lock:
+            self._ensure_index()
+            if filename not in self._index:
+                return None
+            now = time.time()
+            try:
+                os.utime(self._path(filename), (now, now))
+            except FileNotFoundError:
+                self._forget(filename)
+                return None
+            size, _ = self._index[filename]
+            self._index[filename] = (size, now)
+            self._index.move_to_end(filename)
+            return self._path(filename)
+
+    def put(self, key: str, pdf_bytes: bytes) -> str:
+        """
+        Store a report under its content key (no-op if already stored)
+
+        Returns:
+            str: Path of the stored report
+        """
+        path = self.get(key)
+        if path is not None:
+            return path
+
+        filename = f"{key}.pdf"
+        path = self._path(filename)
+        # Write then rename, so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            now = time.time()
+            if filename in self._index:
+                self._forget(filename)
+            self._index[filename] = (len(pdf_bytes), now)
+            self._size += len(pdf_bytes)
+            # A report larger than max_bytes is still kept until the next put
+            self._evict(now, keep=filename)
+        return path
+
+    def stats(self) -> Dict:
+        """File count, total size and evictions"""
+        with self._lock:
+            self._ensure_index()
+            return {
+                'files': len(self._index),
+                'bytes': self._size,
+                'max_files': self.max_files,
+                'max_bytes': self.max_bytes,
+                'max_age_seconds': self.max_age_seconds,
+                'evictions': self.evictions
+            }
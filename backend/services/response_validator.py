@@ -0,0 +1,229 @@
+"""
+Response Validator - Turns raw LLM completions into validated evaluations
+Compiles the evaluation schema once and repairs recoverable JSON (cut-off
+strings, missing closing brackets, trailing commas) instead of failing
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utils.metrics import timed
+
+# Evaluation fields and their types
+EVALUATION_SCHEMA = {
+    "executive_summary": "string",
+    "problem_statement": "string",
+    "target_users": "string",
+    "market_potential": "string",
+    "technical_feasibility": "string",
+    "innovation_uniqueness": "string",
+    "risks_challenges": "string",
+    "strengths": "list",
+    "weaknesses": "list",
+    "improvement_suggestions": "list",
+    "final_recommendation": "string"
+}
+STRING_FIELDS = [field for field, kind in EVALUATION_SCHEMA.items() if kind == "string"]
+LIST_FIELDS = [field for field, kind in EVALUATION_SCHEMA.items() if kind == "list"]
+REQUIRED_FIELDS = list(EVALUATION_SCHEMA)
+
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+def _to_string(value):
+    """Text fields must be strings (None is left for the missing-field check)"""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _to_list(value):
+    """Convert value to list if it's not already a list (None is left for the missing-field check)"""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        # Try to parse as JSON array if it's a string representation
+        try:
+            parsed = json.loads(value)
+            if isinstance(parsed, list):
+                return parsed
+        except ValueError:
+            pass
+        # If it's a plain string, return as single-item list
+        return [value] if value.strip() else []
+    # For other types, convert to string and wrap in list
+    return [str(value)]
+
+
+_COERCERS = {"string": _to_string, "list": _to_list}
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a surrounding markdown code block, if any"""
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def repair_json(text: str) -> List[str]:
+    """
+    Candidate repairs of a broken or cut-off JSON object, best first
+
+    Scans once, tracking string state and open brackets. Trailing commas
+    before a closing bracket are dropped. The first candidate closes an
+    unterminated final string and every open bracket; the second cuts back
+    to the last complete member (for output that stops after a key or in
+    the middle of a number or literal) and closes from there.
+    """
+    start = text.find('{')
+    if start < 0:
+        return []
+
+    out = []
+    stack = []
+    in_string = False
+    escape = False
+    last_cut = None   # (output length, open brackets) at the last separator comma
+    for char in text[start:]:
+        if in_string:
+            out.append(char)
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in '}]':
+            # Drop a trailing comma before the closing bracket
+            while out and out[-1] in ' \t\r\n,':
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(char)
+            if not stack:
+                break
+            continue
+        elif char == ',':
+            last_cut = (len(out), list(stack))
+        out.append(char)
+
+    def close(parts, open_brackets):
+        body = ''.join(parts).rstrip().rstrip(',')
+        return body + ''.join(_CLOSERS[bracket] for bracket in reversed(open_brackets))
+
+    candidates = []
+    if in_string:
+        # A dangling backslash would escape the closing quote
+        if escape:
+            out.pop()
+        out.append('"')
+    candidates.append(close(out, stack))
+    if last_cut is not None:
+        candidates.append(close(out[:last_cut[0]], last_cut[1]))
+    return candidates
+
+
+class ResponseValidator:
+    """
+    Parses, repairs and validates evaluation JSON against a compiled schema
+
+    parse() returns the evaluation together with the required fields it is
+    still missing, so the caller can ask the LLM for just those fields.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            schema: Field name -> "string" or "list" (defaults to EVALUATION_SCHEMA)
+        """
+        schema = schema or EVALUATION_SCHEMA
+        # Compiled once: one coercion function per field
+        self._coercers: Dict[str, Callable[[Any], Any]] = {
+            field: _COERCERS[kind] for field, kind in schema.items()
+        }
+        self.required_fields = tuple(schema)
+        self._lock = threading.Lock()
+        self._counters = {'parsed': 0, 'repaired': 0, 'incomplete': 0, 'unrecoverable': 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def coerce_field(self, field: str, value):
+        """Coerce one field to its schema type (fields outside the schema pass through)"""
+        coercer = self._coercers.get(field)
+        return coercer(value) if coercer is not None else value
+
+    def load(self, response_text: str) -> Dict:
+        """
+        Parse a completion into a dict, repairing it if needed
+
+        Raises:
+            json.JSONDecodeError: If the text cannot be parsed or repaired
+        """
+        text = strip_code_fences(response_text)
+        try:
+            data = json.loads(text, strict=False)
+            if isinstance(data, dict):
+                self._count('parsed')
+                return data
+        except json.JSONDecodeError as e:
+            error = e
+        else:
+            error = json.JSONDecodeError("Expected a JSON object", text, 0)
+
+        for candidate in repair_json(text):
+            try:
+                data = json.loads(candidate, strict=False)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                self._count('repaired')
+                return data
+
+        self._count('unrecoverable')
+        raise error
+
+    def parse(self, response_text: str) -> Tuple[Dict, List[str]]:
+        """
+        Parse, repair and coerce a completion
+
+        Returns:
+            tuple: (evaluation, required fields that are missing or null)
+        """
+        with timed('parse'):
+            fields = self.load(response_text)
+        with timed('validate'):
+            evaluation = self.merge({}, fields)
+            missing = self.missing_fields(evaluation)
+        if missing:
+            self._count('incomplete')
+        return evaluation, missing
+
+    def merge(self, evaluation: Dict, fields: Dict) -> Dict:
+        """Coerce fields and add them to an evaluation"""
+        for field, value in fields.items():
+            evaluation[field] = self.coerce_field(field, value)
+        return evaluation
+
+    def missing_fields(self, evaluation: Dict) -> List[str]:
+        """Required fields that are absent or null"""
+        return [field for field in self.required_fields if evaluation.get(field) is None]
+
+    def stats(self) -> Dict:
+        """How many completions parsed cleanly, needed repair, or were incomplete"""
+        with self._lock:
+            return dict(self._counters)
@@ -2,13 +2,128 @@
 Scoring Service - Calculates feasibility score using weighted factors
 """
 
-import re
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from services.keyword_matcher import KeywordMatcher
+from utils.metrics import timed
+
+
+# Columns of the batch feature matrix (see ScoringService.extract_features)
+BATCH_FEATURES = (
+    'problem_present', 'problem_long', 'problem_positive', 'problem_negative', 'problem_specific',
+    'market_present', 'market_positive', 'market_negative', 'market_size',
+    'tech_present', 'tech_positive', 'tech_negative',
+    'tech_impossible', 'tech_feasible', 'tech_moderate', 'tech_very_difficult',
+    'innovation_present', 'innovation_positive', 'innovation_negative',
+    'innovation_unique', 'innovation_crowded',
+    'scalability_positive', 'scalability_negative', 'scalability',
+    'risk_positive', 'risk_negative', 'high_risk',
+    'idea_present', 'idea_impossible', 'impossible_indicator'
+)
+_COL = {name: index for index, name in enumerate(BATCH_FEATURES)}
+
+
+def _as_text(value) -> str:
+    """Coerce an evaluation field (string, list or other) to plain text"""
+    if not value:
+        return ''
+    if isinstance(value, list):
+        return ' '.join(str(item) for item in value)
+    return str(value)
+
+
+def _merge_hits(*hits_list: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Union keyword hits from several texts, keeping each phrase once per group"""
+    merged: Dict[str, List[str]] = {}
+    for hits in hits_list:
+        for group, phrases in hits.items():
+            bucket = merged.setdefault(group, [])
+            bucket.extend(p for p in phrases if p not in bucket)
+    return merged
+
+
+def _record(trace: Optional[Dict], hits: Dict[str, List[str]], *groups: str) -> None:
+    """Record which keywords of the given groups drove a score adjustment"""
+    if trace is None:
+        return
+    for group in groups:
+        if group in hits:
+            trace[group] = list(hits[group])
+
+
+@dataclass
+class ScoreBreakdown:
+    """Result of scoring one evaluation in a single pass"""
+    components: Dict[str, int]
+    total: int
+    weighted_score: float
+    cap: Optional[float] = None  # Upper bound applied for low technical feasibility
+    impossible: bool = False
+    triggers: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable representation"""
+        return {
+            'components': dict(self.components),
+            'total': self.total,
+            'weighted_score': self.weighted_score,
+            'cap': self.cap,
+            'impossible': self.impossible,
+            'triggers': self.triggers
+        }
+
+
+@dataclass
+class BatchScores:
+    """Vectorized scoring results; row i belongs to the i-th evaluation"""
+    component_names: List[str]
+    components: np.ndarray       # (n, 6) int64, columns follow component_names
+    totals: np.ndarray           # (n,) int64
+    weighted_scores: np.ndarray  # (n,) float64
+    caps: np.ndarray             # (n,) float64, NaN where no cap was applied
+    impossible: np.ndarray       # (n,) bool
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def breakdowns(self) -> List[ScoreBreakdown]:
+        """Convert rows to ScoreBreakdown objects (without keyword triggers)"""
+        results = []
+        for row in range(len(self)):
+            cap = float(self.caps[row])
+            results.append(ScoreBreakdown(
+                components={name: int(value) for name, value in zip(self.component_names, self.components[row])},
+                total=int(self.totals[row]),
+                weighted_score=float(self.weighted_scores[row]),
+                cap=None if np.isnan(cap) else cap,
+                impossible=bool(self.impossible[row])
+            ))
+        return results
+
+
+class _EvaluationHits:
+    """Lazily scans each evaluation field at most once"""
+
+    def __init__(self, matcher: KeywordMatcher, evaluation: Dict, idea_text: str = ''):
+        self._matcher = matcher
+        self._evaluation = evaluation
+        self._idea_text = idea_text
+        self._cache: Dict[str, Dict[str, List[str]]] = {}
+
+    def __getitem__(self, field: str) -> Dict[str, List[str]]:
+        if field not in self._cache:
+            if field == 'idea':
+                text = self._idea_text
+            else:
+                text = _as_text(self._evaluation.get(field))
+            self._cache[field] = self._matcher.scan(text)
+        return self._cache[field]
 
 
 class ScoringService:
     """Service for calculating feasibility scores"""
-    
+
     def __init__(self):
         # Weight configuration
         self.weights = {
@@ -20,6 +135,16 @@ class ScoringService:
             'risk_level': 0.10            # 10%
         }
         
+        # Evaluation fields each component depends on
+        self.component_fields = {
+            'problem_clarity': ['problem_statement'],
+            'market_demand': ['market_potential'],
+            'technical_feasibility': ['technical_feasibility'],
+            'innovation_level': ['innovation_uniqueness'],
+            'scalability': ['strengths', 'market_potential'],
+            'risk_level': ['risks_challenges', 'weaknesses']
+        }
+
         # Keywords that indicate impossible/unrealistic ideas
         self.impossible_keywords = [
             'dream', 'dreams', 'dreaming', 'convert dreams', 'dream reading', 'read dreams',
@@ -36,263 +161,494 @@ class ScoringService:
             'ghost', 'spirit', 'afterlife', 'communicate with dead',
             'parallel universe', 'alternate dimension', 'multiverse travel'
         ]
-    
-    def _extract_score_from_text(self, text: str) -> int:
-        """
-        Extracts numeric score from text using keyword analysis
-        Returns a score between 0-100
-        """
-        text_lower = text.lower()
-        
+
+        # Evaluation phrases that indicate impossibility
+        self.impossible_indicators = [
+            'impossible', 'does not exist', 'not possible', 'cannot be done',
+            'science fiction', 'not feasible', 'unrealistic', 'no technology exists',
+            'requires technology that does not exist', 'beyond current science',
+            'not yet invented', 'not available', 'does not exist yet',
+            'theoretical only', 'not proven', 'no scientific basis'
+        ]
+
         # Positive indicators
-        positive_keywords = [
+        self.positive_keywords = [
             'strong', 'excellent', 'high', 'significant', 'clear', 'viable',
             'promising', 'substantial', 'robust', 'well-defined', 'large',
             'innovative', 'unique', 'scalable', 'feasible', 'low risk'
         ]
-        
+
         # Negative indicators
-        negative_keywords = [
+        self.negative_keywords = [
             'weak', 'poor', 'low', 'limited', 'unclear', 'risky',
             'challenging', 'small', 'saturated', 'difficult', 'high risk',
             'uncertain', 'vague', 'unproven', 'niche'
         ]
-        
-        positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-        negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
-        
+
+        # Component-specific indicators
+        self.component_keywords = {
+            'problem_specific': ['problem', 'issue', 'pain', 'need'],
+            'market_size': ['large', 'growing', 'billion', 'million', 'expanding'],
+            'tech_impossible': [
+                'impossible', 'does not exist', 'not possible', 'cannot be done',
+                'science fiction', 'not feasible', 'unrealistic', 'no technology',
+                'requires technology that', 'beyond current', 'not yet invented',
+                'dream reading', 'mind reading', 'brain interface', 'telepathy',
+                'time travel', 'teleportation', 'magic', 'supernatural'
+            ],
+            'tech_feasible': ['feasible', 'proven', 'existing', 'standard', 'available', 'current technology'],
+            'tech_moderate': ['complex', 'experimental', 'unproven', 'cutting-edge', 'challenging'],
+            'tech_very_difficult': ['very difficult', 'breakthrough', 'research needed', 'not yet available'],
+            'innovation_unique': ['unique', 'novel', 'innovative', 'differentiated', 'first-mover'],
+            'innovation_crowded': ['saturated', 'competitive', 'similar', 'existing'],
+            'scalability': ['scalable', 'expandable', 'replicable', 'growth', 'network effect'],
+            'high_risk': ['high risk', 'uncertain', 'regulatory', 'legal', 'competition']
+        }
+
+        # Compile every keyword list into one matcher so each text is scanned once
+        self.matcher = KeywordMatcher({
+            'positive': self.positive_keywords,
+            'negative': self.negative_keywords,
+            'idea_impossible': self.impossible_keywords,
+            'impossible_indicator': self.impossible_indicators,
+            **self.component_keywords
+        })
+
+    def _scan(self, evaluation: Dict, idea_text: str = '') -> _EvaluationHits:
+        """Prepare per-field keyword hits for one evaluation"""
+        return _EvaluationHits(self.matcher, evaluation, idea_text)
+
+    def _score_from_hits(self, hits: Dict[str, List[str]]) -> int:
+        """Keyword-based 0-100 score from pre-computed hits"""
+        positive_count = len(hits.get('positive', ()))
+        negative_count = len(hits.get('negative', ()))
+
         # Base score
         base_score = 50
-        
+
         # Adjust based on keywords
         score = base_score + (positive_count * 10) - (negative_count * 10)
-        
+
         # Clamp between 0-100
         return max(0, min(100, score))
-    
-    def _score_problem_clarity(self, evaluation: Dict) -> int:
+
+    def _extract_score_from_text(self, text: str) -> int:
+        """
+        Extracts numeric score from text using keyword analysis
+        Returns a score between 0-100
+        """
+        return self._score_from_hits(self.matcher.scan(text))
+
+    def _score_problem_clarity(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                               trace: Optional[Dict] = None) -> int:
         """Score based on problem statement clarity"""
-        problem_text = evaluation.get('problem_statement', '')
+        problem_text = _as_text(evaluation.get('problem_statement', ''))
         if not problem_text:
             return 30
-        
+
+        hits = hits or self._scan(evaluation)
+        problem_hits = hits['problem_statement']
+
         # Check for clarity indicators
-        clarity_score = self._extract_score_from_text(problem_text)
-        
+        clarity_score = self._score_from_hits(problem_hits)
+        _record(trace, problem_hits, 'positive', 'negative')
+
         # Bonus for specific problem description
-        if len(problem_text) > 50 and any(word in problem_text.lower() for word in ['problem', 'issue', 'pain', 'need']):
+        if len(problem_text) > 50 and 'problem_specific' in problem_hits:
             clarity_score = min(100, clarity_score + 10)
-        
+            _record(trace, problem_hits, 'problem_specific')
+
         return clarity_score
-    
-    def _score_market_demand(self, evaluation: Dict) -> int:
+
+    def _score_market_demand(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                             trace: Optional[Dict] = None) -> int:
         """Score based on market potential"""
-        market_text = evaluation.get('market_potential', '')
-        if not market_text:
+        if not evaluation.get('market_potential', ''):
             return 30
-        
-        market_score = self._extract_score_from_text(market_text)
-        
+
+        hits = hits or self._scan(evaluation)
+        market_hits = hits['market_potential']
+        market_score = self._score_from_hits(market_hits)
+        _record(trace, market_hits, 'positive', 'negative')
+
         # Check for market size indicators
-        market_lower = market_text.lower()
-        if any(word in market_lower for word in ['large', 'growing', 'billion', 'million', 'expanding']):
+        if 'market_size' in market_hits:
             market_score = min(100, market_score + 15)
-        
+            _record(trace, market_hits, 'market_size')
+
         return market_score
-    
-    def _score_technical_feasibility(self, evaluation: Dict) -> int:
+
+    def _score_technical_feasibility(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                                     trace: Optional[Dict] = None) -> int:
         """Score based on technical feasibility - be strict about impossible ideas"""
-        tech_text = evaluation.get('technical_feasibility', '')
-        if not tech_text:
+        if not evaluation.get('technical_feasibility', ''):
             return 50  # Neutral if not specified
-        
-        tech_score = self._extract_score_from_text(tech_text)
-        
-        # Check for feasibility indicators
-        tech_lower = tech_text.lower()
-        
+
+        hits = hits or self._scan(evaluation)
+        tech_hits = hits['technical_feasibility']
+        tech_score = self._score_from_hits(tech_hits)
+        _record(trace, tech_hits, 'positive', 'negative')
+
         # STRICT: Penalize impossible/unrealistic ideas heavily
-        impossible_keywords = [
-            'impossible', 'does not exist', 'not possible', 'cannot be done',
-            'science fiction', 'not feasible', 'unrealistic', 'no technology',
-            'requires technology that', 'beyond current', 'not yet invented',
-            'dream reading', 'mind reading', 'brain interface', 'telepathy',
-            'time travel', 'teleportation', 'magic', 'supernatural'
-        ]
-        
-        if any(keyword in tech_lower for keyword in impossible_keywords):
+        if 'tech_impossible' in tech_hits:
             tech_score = max(0, min(20, tech_score - 50))  # Cap at 20 for impossible ideas
-        
+            _record(trace, tech_hits, 'tech_impossible')
+
         # Positive indicators
-        elif any(word in tech_lower for word in ['feasible', 'proven', 'existing', 'standard', 'available', 'current technology']):
+        elif 'tech_feasible' in tech_hits:
             tech_score = min(100, tech_score + 10)
+            _record(trace, tech_hits, 'tech_feasible')
         # Moderate difficulty
-        elif any(word in tech_lower for word in ['complex', 'experimental', 'unproven', 'cutting-edge', 'challenging']):
+        elif 'tech_moderate' in tech_hits:
             tech_score = max(0, tech_score - 15)
+            _record(trace, tech_hits, 'tech_moderate')
         # Very difficult
-        elif any(word in tech_lower for word in ['very difficult', 'breakthrough', 'research needed', 'not yet available']):
+        elif 'tech_very_difficult' in tech_hits:
             tech_score = max(0, tech_score - 30)
-        
+            _record(trace, tech_hits, 'tech_very_difficult')
+
         return tech_score
-    
-    def _score_innovation_level(self, evaluation: Dict) -> int:
+
+    def _score_innovation_level(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                                trace: Optional[Dict] = None) -> int:
         """Score based on innovation and uniqueness"""
-        innovation_text = evaluation.get('innovation_uniqueness', '')
-        if not innovation_text:
+        if not evaluation.get('innovation_uniqueness', ''):
             return 40
-        
-        innovation_score = self._extract_score_from_text(innovation_text)
-        
+
+        hits = hits or self._scan(evaluation)
+        innovation_hits = hits['innovation_uniqueness']
+        innovation_score = self._score_from_hits(innovation_hits)
+        _record(trace, innovation_hits, 'positive', 'negative')
+
         # Check for uniqueness indicators
-        innovation_lower = innovation_text.lower()
-        if any(word in innovation_lower for word in ['unique', 'novel', 'innovative', 'differentiated', 'first-mover']):
+        if 'innovation_unique' in innovation_hits:
             innovation_score = min(100, innovation_score + 15)
-        elif any(word in innovation_lower for word in ['saturated', 'competitive', 'similar', 'existing']):
+            _record(trace, innovation_hits, 'innovation_unique')
+        elif 'innovation_crowded' in innovation_hits:
             innovation_score = max(0, innovation_score - 15)
-        
+            _record(trace, innovation_hits, 'innovation_crowded')
+
         return innovation_score
-    
-    def _score_scalability(self, evaluation: Dict) -> int:
+
+    def _score_scalability(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                           trace: Optional[Dict] = None) -> int:
         """Score based on scalability potential"""
         # Analyze strengths and market potential for scalability
-        strengths = evaluation.get('strengths', [])
-        market_text = evaluation.get('market_potential', '')
-        
-        # Ensure strengths is a list
-        if not isinstance(strengths, list):
-            strengths = [str(strengths)] if strengths else []
-        # Ensure market_text is a string
-        if not isinstance(market_text, str):
-            market_text = str(market_text) if market_text else ''
-        
-        # Convert list items to strings
-        strengths_str = ' '.join(str(s) for s in strengths)
-        combined_text = strengths_str + ' ' + market_text
-        scalability_score = self._extract_score_from_text(combined_text)
-        
+        hits = hits or self._scan(evaluation)
+        combined_hits = _merge_hits(hits['strengths'], hits['market_potential'])
+        scalability_score = self._score_from_hits(combined_hits)
+        _record(trace, combined_hits, 'positive', 'negative')
+
         # Check for scalability indicators
-        combined_lower = combined_text.lower()
-        if any(word in combined_lower for word in ['scalable', 'expandable', 'replicable', 'growth', 'network effect']):
+        if 'scalability' in combined_hits:
             scalability_score = min(100, scalability_score + 15)
-        
+            _record(trace, combined_hits, 'scalability')
+
         return scalability_score
-    
-    def _score_risk_level(self, evaluation: Dict) -> int:
+
+    def _score_risk_level(self, evaluation: Dict, hits: Optional[_EvaluationHits] = None,
+                          trace: Optional[Dict] = None) -> int:
         """Score based on risks (inverse - lower risk = higher score)"""
-        risks_text = evaluation.get('risks_challenges', '')
-        weaknesses = evaluation.get('weaknesses', [])
-        
-        # Ensure risks_text is a string
-        if not isinstance(risks_text, str):
-            risks_text = str(risks_text) if risks_text else ''
-        # Ensure weaknesses is a list
-        if not isinstance(weaknesses, list):
-            weaknesses = [str(weaknesses)] if weaknesses else []
-        
-        # Convert list items to strings
-        weaknesses_str = ' '.join(str(w) for w in weaknesses)
-        combined_text = risks_text + ' ' + weaknesses_str
-        risk_score = 100 - self._extract_score_from_text(combined_text)  # Invert
-        
+        hits = hits or self._scan(evaluation)
+        combined_hits = _merge_hits(hits['risks_challenges'], hits['weaknesses'])
+        risk_score = 100 - self._score_from_hits(combined_hits)  # Invert
+        _record(trace, combined_hits, 'positive', 'negative')
+
         # Check for high-risk indicators
-        combined_lower = combined_text.lower()
-        if any(word in combined_lower for word in ['high risk', 'uncertain', 'regulatory', 'legal', 'competition']):
+        if 'high_risk' in combined_hits:
             risk_score = max(0, risk_score - 20)
-        
+            _record(trace, combined_hits, 'high_risk')
+
         return max(0, min(100, risk_score))
-    
-    def _check_impossible_idea(self, idea_text: str, evaluation: Dict) -> bool:
+
+    def _check_impossible_idea(self, idea_text: str, evaluation: Dict,
+                               hits: Optional[_EvaluationHits] = None,
+                               trace: Optional[Dict] = None) -> bool:
         """
         Check if the idea is technically impossible based on keywords and evaluation
         Returns True if the idea is impossible
         """
-        idea_lower = idea_text.lower()
-        tech_text = evaluation.get('technical_feasibility', '').lower()
-        risks_text = evaluation.get('risks_challenges', '').lower()
-        
+        hits = hits or self._scan(evaluation, idea_text)
+
         # Check for impossible keywords in the idea itself
-        if any(keyword in idea_lower for keyword in self.impossible_keywords):
+        if 'idea_impossible' in hits['idea']:
+            _record(trace, hits['idea'], 'idea_impossible')
             return True
-        
+
         # Check evaluation text for impossibility indicators
-        impossible_indicators = [
-            'impossible', 'does not exist', 'not possible', 'cannot be done',
-            'science fiction', 'not feasible', 'unrealistic', 'no technology exists',
-            'requires technology that does not exist', 'beyond current science',
-            'not yet invented', 'not available', 'does not exist yet',
-            'theoretical only', 'not proven', 'no scientific basis'
-        ]
-        
-        combined_text = tech_text + ' ' + risks_text
-        if any(indicator in combined_text for indicator in impossible_indicators):
+        indicator_hits = _merge_hits(hits['technical_feasibility'], hits['risks_challenges'])
+        if 'impossible_indicator' in indicator_hits:
+            _record(trace, indicator_hits, 'impossible_indicator')
             return True
-        
+
         return False
-    
-    def calculate_score(self, evaluation: Dict, idea_text: str = '') -> int:
+
+    def _component_scores(self, evaluation: Dict, hits: _EvaluationHits,
+                          triggers: Optional[Dict] = None) -> Dict:
+        """Compute all six component scores from shared keyword hits"""
+        scorers = {
+            'problem_clarity': self._score_problem_clarity,
+            'market_demand': self._score_market_demand,
+            'technical_feasibility': self._score_technical_feasibility,
+            'innovation_level': self._score_innovation_level,
+            'scalability': self._score_scalability,
+            'risk_level': self._score_risk_level
+        }
+        scores = {}
+        for component, scorer in scorers.items():
+            trace = None if triggers is None else triggers.setdefault(component, {})
+            scores[component] = scorer(evaluation, hits, trace)
+        return scores
+
+    def score(self, evaluation: Dict, idea_text: str = '') -> ScoreBreakdown:
         """
-        Calculate weighted feasibility score
-        
+        Score an evaluation in a single pass
+
+        Computes the component scores, weighted total, applied cap and
+        impossibility flag together, recording which keywords triggered
+        each adjustment.
+
         Args:
             evaluation: Dictionary containing evaluation results
             idea_text: Original idea text (optional, for impossible idea detection)
-            
+
         Returns:
-            int: Feasibility score (0-100)
+            ScoreBreakdown: Component scores, total and audit trail
         """
+        with timed('score'):
+            return self._score(evaluation, idea_text)
+
+    def _score(self, evaluation: Dict, idea_text: str) -> ScoreBreakdown:
+        """Body of score(), outside the stage timer"""
+        hits = self._scan(evaluation, idea_text)
+        triggers: Dict[str, Dict[str, List[str]]] = {}
+
+        # Calculate individual component scores
+        scores = self._component_scores(evaluation, hits, triggers)
+        weighted_score = sum(
+            scores[factor] * self.weights[factor]
+            for factor in self.weights
+        )
+
         # FIRST: Check if idea is impossible - if so, return very low score
-        if idea_text and self._check_impossible_idea(idea_text, evaluation):
+        if idea_text and self._check_impossible_idea(idea_text, evaluation, hits,
+                                                     triggers.setdefault('impossible', {})):
             # Force impossible ideas to score 5-10
-            return 5
-        
-        # Calculate individual component scores
-        scores = {
-            'problem_clarity': self._score_problem_clarity(evaluation),
-            'market_demand': self._score_market_demand(evaluation),
-            'technical_feasibility': self._score_technical_feasibility(evaluation),
-            'innovation_level': self._score_innovation_level(evaluation),
-            'scalability': self._score_scalability(evaluation),
-            'risk_level': self._score_risk_level(evaluation)
-        }
-        
+            return ScoreBreakdown(scores, 5, weighted_score, impossible=True, triggers=triggers)
+        triggers.pop('impossible', None)
+
         # CRITICAL: If technical feasibility is very low, cap the overall score
+        cap = None
+        final_score = weighted_score
         tech_score = scores['technical_feasibility']
         if tech_score < 25:
             # If technically impossible/very difficult, cap overall score severely
-            max_possible = 10 + (tech_score * 0.2)  # Max 10-15 for impossible ideas
-            # Still calculate weighted average but cap it
-            weighted_score = sum(
-                scores[factor] * self.weights[factor]
-                for factor in self.weights
-            )
-            final_score = min(weighted_score, max_possible)
-        else:
-            # Normal calculation for feasible ideas
-            weighted_score = sum(
-                scores[factor] * self.weights[factor]
-                for factor in self.weights
-            )
-            final_score = weighted_score
-        
-        # Round to integer
-        final_score = int(round(final_score))
-        
-        # Ensure score is within bounds
-        return max(0, min(100, final_score))
-    
+            cap = 10 + (tech_score * 0.2)  # Max 10-15 for impossible ideas
+            final_score = min(weighted_score, cap)
+
+        # Round to integer and ensure score is within bounds
+        total = max(0, min(100, int(round(final_score))))
+        return ScoreBreakdown(scores, total, weighted_score, cap=cap, triggers=triggers)
+
+    def score_component(self, component: str, evaluation: Dict) -> int:
+        """
+        Score a single component, scanning only the fields it depends on
+
+        Args:
+            component: One of the keys of self.weights
+            evaluation: Dictionary containing evaluation results
+
+        Returns:
+            int: Component score (0-100)
+        """
+        scorer = getattr(self, f'_score_{component}', None)
+        if component not in self.weights or scorer is None:
+            raise ValueError(f"Unknown score component: {component}")
+        return scorer(evaluation)
+
+    def calculate_score(self, evaluation: Dict, idea_text: str = '') -> int:
+        """
+        Calculate weighted feasibility score
+
+        Args:
+            evaluation: Dictionary containing evaluation results
+            idea_text: Original idea text (optional, for impossible idea detection)
+
+        Returns:
+            int: Feasibility score (0-100)
+        """
+        return self.score(evaluation, idea_text).total
+
     def get_component_scores(self, evaluation: Dict, idea_text: str = '') -> Dict:
         """
         Get individual component scores for visualization
-        
+
         Returns:
             dict: Component scores for charting
         """
-        return {
-            'problem_clarity': self._score_problem_clarity(evaluation),
-            'market_demand': self._score_market_demand(evaluation),
-            'technical_feasibility': self._score_technical_feasibility(evaluation),
-            'innovation_level': self._score_innovation_level(evaluation),
-            'scalability': self._score_scalability(evaluation),
-            'risk_level': self._score_risk_level(evaluation)
+        return self._component_scores(evaluation, self._scan(evaluation, idea_text))
+
+    def extract_features(self, evaluations: Sequence[Dict],
+                         idea_texts: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Turn keyword hits into a feature matrix for vectorized scoring
+
+        The matrix only depends on the evaluation texts, so it can be kept
+        and re-scored with different weights via score_features().
+
+        Args:
+            evaluations: Evaluation dictionaries
+            idea_texts: Original idea texts, aligned with evaluations (optional)
+
+        Returns:
+            np.ndarray: (len(evaluations), len(BATCH_FEATURES)) int32 matrix
+        """
+        features = np.zeros((len(evaluations), len(BATCH_FEATURES)), dtype=np.int32)
+        for row, evaluation in enumerate(evaluations):
+            idea_text = idea_texts[row] if idea_texts is not None else ''
+            hits = self._scan(evaluation, idea_text or '')
+            out = features[row]
+
+            problem_text = _as_text(evaluation.get('problem_statement', ''))
+            problem = hits['problem_statement']
+            out[_COL['problem_present']] = bool(problem_text)
+            out[_COL['problem_long']] = len(problem_text) > 50
+            out[_COL['problem_positive']] = len(problem.get('positive', ()))
+            out[_COL['problem_negative']] = len(problem.get('negative', ()))
+            out[_COL['problem_specific']] = 'problem_specific' in problem
+
+            market = hits['market_potential']
+            out[_COL['market_present']] = bool(evaluation.get('market_potential', ''))
+            out[_COL['market_positive']] = len(market.get('positive', ()))
+            out[_COL['market_negative']] = len(market.get('negative', ()))
+            out[_COL['market_size']] = 'market_size' in market
+
+            tech = hits['technical_feasibility']
+            out[_COL['tech_present']] = bool(evaluation.get('technical_feasibility', ''))
+            out[_COL['tech_positive']] = len(tech.get('positive', ()))
+            out[_COL['tech_negative']] = len(tech.get('negative', ()))
+            for group in ('tech_impossible', 'tech_feasible', 'tech_moderate', 'tech_very_difficult'):
+                out[_COL[group]] = group in tech
+
+            innovation = hits['innovation_uniqueness']
+            out[_COL['innovation_present']] = bool(evaluation.get('innovation_uniqueness', ''))
+            out[_COL['innovation_positive']] = len(innovation.get('positive', ()))
+            out[_COL['innovation_negative']] = len(innovation.get('negative', ()))
+            out[_COL['innovation_unique']] = 'innovation_unique' in innovation
+            out[_COL['innovation_crowded']] = 'innovation_crowded' in innovation
+
+            scalability = _merge_hits(hits['strengths'], market)
+            out[_COL['scalability_positive']] = len(scalability.get('positive', ()))
+            out[_COL['scalability_negative']] = len(scalability.get('negative', ()))
+            out[_COL['scalability']] = 'scalability' in scalability
+
+            risk = _merge_hits(hits['risks_challenges'], hits['weaknesses'])
+            out[_COL['risk_positive']] = len(risk.get('positive', ()))
+            out[_COL['risk_negative']] = len(risk.get('negative', ()))
+            out[_COL['high_risk']] = 'high_risk' in risk
+
+            if idea_text:
+                out[_COL['idea_present']] = 1
+                out[_COL['idea_impossible']] = 'idea_impossible' in hits['idea']
+                out[_COL['impossible_indicator']] = (
+                    'impossible_indicator' in tech or 'impossible_indicator' in hits['risks_challenges']
+                )
+        return features
+
+    def score_features(self, features: np.ndarray, weights: Optional[Dict[str, float]] = None) -> BatchScores:
+        """
+        Score a feature matrix with array operations
+
+        Mirrors score() exactly (same operations in the same order), so
+        totals are bit-identical to calculate_score().
+
+        Args:
+            features: Matrix from extract_features()
+            weights: Component weights (defaults to self.weights)
+
+        Returns:
+            BatchScores: Components, totals, caps and impossibility flags
+        """
+        weights = weights or self.weights
+        f = {name: features[:, index].astype(np.int64) for name, index in _COL.items()}
+
+        def keyword_score(prefix):
+            return np.clip(50 + f[f'{prefix}_positive'] * 10 - f[f'{prefix}_negative'] * 10, 0, 100)
+
+        base = keyword_score('problem')
+        problem = np.where((f['problem_long'] > 0) & (f['problem_specific'] > 0), np.minimum(100, base + 10), base)
+        problem = np.where(f['problem_present'] > 0, problem, 30)
+
+        base = keyword_score('market')
+        market = np.where(f['market_size'] > 0, np.minimum(100, base + 15), base)
+        market = np.where(f['market_present'] > 0, market, 30)
+
+        base = keyword_score('tech')
+        tech = np.select(
+            [f['tech_impossible'] > 0, f['tech_feasible'] > 0, f['tech_moderate'] > 0, f['tech_very_difficult'] > 0],
+            [np.maximum(0, np.minimum(20, base - 50)), np.minimum(100, base + 10),
+             np.maximum(0, base - 15), np.maximum(0, base - 30)],
+            base
+        )
+        tech = np.where(f['tech_present'] > 0, tech, 50)
+
+        base = keyword_score('innovation')
+        innovation = np.select(
+            [f['innovation_unique'] > 0, f['innovation_crowded'] > 0],
+            [np.minimum(100, base + 15), np.maximum(0, base - 15)],
+            base
+        )
+        innovation = np.where(f['innovation_present'] > 0, innovation, 40)
+
+        base = keyword_score('scalability')
+        scalability = np.where(f['scalability'] > 0, np.minimum(100, base + 15), base)
+
+        risk = 100 - keyword_score('risk')
+        risk = np.clip(np.where(f['high_risk'] > 0, np.maximum(0, risk - 20), risk), 0, 100)
+
+        columns = {
+            'problem_clarity': problem,
+            'market_demand': market,
+            'technical_feasibility': tech,
+            'innovation_level': innovation,
+            'scalability': scalability,
+            'risk_level': risk
         }
+        names = list(columns)
+
+        # Accumulate in the same order as the scalar sum() for identical rounding
+        weighted = np.zeros(len(features), dtype=np.float64)
+        for factor in weights:
+            weighted = weighted + columns[factor] * weights[factor]
+
+        capped = tech < 25
+        caps = np.where(capped, 10 + (tech * 0.2), np.nan)
+        final = np.where(capped, np.minimum(weighted, caps), weighted)
+        totals = np.clip(np.rint(final).astype(np.int64), 0, 100)
+
+        impossible = (f['idea_present'] > 0) & ((f['idea_impossible'] > 0) | (f['impossible_indicator'] > 0))
+        totals = np.where(impossible, 5, totals)
+        caps = np.where(impossible, np.nan, caps)
+
+        return BatchScores(
+            component_names=names,
+            components=np.stack([columns[name] for name in names], axis=1),
+            totals=totals,
+            weighted_scores=weighted,
+            caps=caps,
+            impossible=impossible
+        )
 
+    def score_batch(self, evaluations: Sequence[Dict],
+                    idea_texts: Optional[Sequence[str]] = None) -> BatchScores:
+        """
+        Score many evaluations at once
+
+        Args:
+            evaluations: Evaluation dictionaries
+            idea_texts: Original idea texts, aligned with evaluations (optional)
+
+        Returns:
+            BatchScores: Results identical to calling score() on each evaluation
+        """
+        return self.score_features(self.extract_features(evaluations, idea_texts))
@@ -0,0 +1,128 @@
+"""
+Similarity Index - MinHash/LSH index for near-duplicate idea detection
+"""
+
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from services.evaluation_cache import normalize_idea
+
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+class SimilarityIndex:
+    """
+    Near-duplicate index over idea texts
+
+    Each text is reduced to character shingles and a MinHash signature.
+    Signatures are split into bands and hashed into buckets (LSH), so a
+    lookup only compares against ideas sharing at least one bucket instead
+    of every stored idea.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 5,
+                 max_items: int = 500000, seed: int = 1):
+        """
+        Args:
+            num_perm: Number of MinHash permutations (signature length)
+            bands: Number of LSH bands; num_perm must be divisible by it
+            shingle_size: Characters per shingle
+            max_items: Maximum indexed ideas (oldest are dropped first)
+            seed: Seed for the permutation parameters
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_items = max_items
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self._signatures: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """Hash the character shingles of normalized text to 32-bit values"""
+        text = _NON_WORD_RE.sub(' ', normalize_idea(text)).strip()
+        k = self.shingle_size
+        if len(text) <= k:
+            shingles = {text}
+        else:
+            shingles = {text[i:i + k] for i in range(len(text) - k + 1)}
+        return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                           dtype=np.uint64, count=len(shingles))
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text"""
+        hashes = self._shingles(text)
+        # Universal hashing (a*x + b) mod p, one row per permutation
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, item_id: str, text: str) -> None:
+        """Index a text under an id (re-adding an id replaces it)"""
+        signature = self.signature(text)
+        with self._lock:
+            if item_id in self._signatures:
+                self._remove(item_id)
+            self._signatures[item_id] = signature
+            for bucket, key in zip(self._buckets, self._band_keys(signature)):
+                bucket.setdefault(key, set()).add(item_id)
+            while len(self._signatures) > self.max_items:
+                self._remove(next(iter(self._signatures)))
+
+    def remove(self, item_id: str) -> None:
+        """Drop an id from the index"""
+        with self._lock:
+            if item_id in self._signatures:
+                self._remove(item_id)
+
+    def _remove(self, item_id: str) -> None:
+        signature = self._signatures.pop(item_id)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            ids = bucket.get(key)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del bucket[key]
+
+    def query(self, text: str, threshold: float) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed text
+
+        Args:
+            text: Text to look up
+            threshold: Minimum estimated Jaccard similarity (0-1)
+
+        Returns:
+            tuple: (item_id, similarity) of the best match, or None
+        """
+        signature = self.signature(text)
+        with self._lock:
+            candidates = set()
+            for bucket, key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(bucket.get(key, ()))
+
+            best = None
+            for item_id in candidates:
+                similarity = float(np.count_nonzero(self._signatures[item_id] == signature)) / self.num_perm
+                if similarity >= threshold and (best is None or similarity > best[1]):
+                    best = (item_id, similarity)
+            return best
+
+    def __len__(self) -> int:
+        return len(self._signatures)
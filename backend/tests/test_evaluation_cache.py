@@ -0,0 +1,28 @@
+"""
+Tests for EvaluationCache: uncounted lookups leave the hit rate alone
+"""
+
+from services.evaluation_cache import EvaluationCache
+
+
+def test_uncounted_lookups_do_not_change_the_hit_rate(tmp_path):
+    cache = EvaluationCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("a", {"overall_score": 70})
+    assert cache.get("missing") is None   # the exact-match miss
+
+    assert cache.get("a", count=False) == {"overall_score": 70}
+    assert cache.get("gone", count=False) is None
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (0, 1, 0.0)
+
+
+def test_uncounted_disk_lookup_still_promotes_to_memory(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    EvaluationCache(db_path=db_path).set("a", {"overall_score": 70})
+    cache = EvaluationCache(db_path=db_path)
+
+    assert cache.get("a", count=False) == {"overall_score": 70}
+
+    stats = cache.stats()
+    assert (stats['disk_hits'], stats['memory_entries']) == (0, 1)
@@ -0,0 +1,35 @@
+"""
+Tests for IncrementalObjectParser: members emitted as they complete and
+malformed members left for the final repair
+"""
+
+from services.json_stream import IncrementalObjectParser
+from services.response_validator import ResponseValidator
+
+
+def _feed_in_chunks(parser, text, size=3):
+    members = []
+    for start in range(0, len(text), size):
+        members.extend(parser.feed(text[start:start + size]))
+    return members
+
+
+def test_members_are_emitted_as_they_complete():
+    parser = IncrementalObjectParser()
+    assert parser.feed('```json\n{"a": "x, {y}", "b"') == [("a", "x, {y}")]
+    assert parser.feed(': [1, {"c": 2}]') == []
+    assert parser.feed(', "d": "line\nbreak"}') == [("b", [1, {"c": 2}]), ("d", "line\nbreak")]
+    assert parser.done
+
+
+def test_trailing_comma_member_is_skipped_not_raised():
+    text = '{"executive_summary": "s", "strengths": ["p","q",], "weaknesses": ["w"]}'
+    parser = IncrementalObjectParser()
+
+    members = _feed_in_chunks(parser, text)
+
+    assert members == [("executive_summary", "s"), ("weaknesses", ["w"])]
+    assert parser.skipped == 1
+    # The full text is repaired afterwards, recovering the skipped field
+    evaluation, _ = ResponseValidator().parse(parser.text)
+    assert evaluation["strengths"] == ["p", "q"]
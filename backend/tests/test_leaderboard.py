@@ -0,0 +1,118 @@
+"""
+Tests for Leaderboard top-k, range, rank and percentile queries, checked
+against a brute-force ranking
+"""
+
+import random
+
+import pytest
+
+from services.leaderboard import Leaderboard
+
+METRICS = ("feasibility_score", "market_demand")
+
+
+def _expected(scores, metric, min_score=0, max_score=100):
+    """Brute-force listing: (id, score) by score descending, ties by id"""
+    rows = [(-values[metric], evaluation_id) for evaluation_id, values in scores.items()
+            if metric in values and min_score <= values[metric] <= max_score]
+    return [(evaluation_id, -negated) for negated, evaluation_id in sorted(rows)]
+
+
+@pytest.fixture
+def populated():
+    rng = random.Random(7)
+    board = Leaderboard(METRICS)
+    scores = {}
+    for i in range(2000):
+        evaluation_id = f"id{i:05d}"
+        scores[evaluation_id] = {metric: rng.randint(0, 100) for metric in METRICS}
+        board.add(evaluation_id, scores[evaluation_id])
+    # Removals and re-scored evaluations
+    for i in range(0, 2000, 9):
+        board.remove(f"id{i:05d}")
+        del scores[f"id{i:05d}"]
+    for i in range(1, 2000, 13):
+        evaluation_id = f"id{i:05d}"
+        if evaluation_id in scores:
+            scores[evaluation_id] = {metric: rng.randint(0, 100) for metric in METRICS}
+            board.add(evaluation_id, scores[evaluation_id])
+    return board, scores
+
+
+@pytest.mark.parametrize("min_score, max_score, offset, limit", [
+    (0, 100, 0, 10),
+    (0, 100, 40, 25),
+    (20, 60, 0, 500),
+    (20, 60, 17, 30),
+    (95, 100, 0, 1000),
+    (50, 50, 0, 100),
+    (0, 100, 1700, 200),
+    (0, 100, 10**6, 5),
+    (70, 30, 0, 10),
+])
+def test_top_matches_brute_force(populated, min_score, max_score, offset, limit):
+    board, scores = populated
+    for metric in METRICS:
+        result = board.top(metric, limit, offset, min_score, max_score)
+        expected = _expected(scores, metric, min_score, max_score)
+
+        assert result["total"] == len(scores)
+        assert result["count"] == len(expected)
+        assert [(entry["evaluation_id"], entry["score"]) for entry in result["entries"]] == \
+            expected[offset:offset + limit]
+
+
+def test_ranks_are_shared_by_ties(populated):
+    board, scores = populated
+    for entry in board.top("feasibility_score", 300)["entries"]:
+        higher = sum(1 for values in scores.values() if values["feasibility_score"] > entry["score"])
+        assert entry["rank"] == higher + 1
+
+
+def test_standing_and_percentile(populated):
+    board, scores = populated
+    for evaluation_id in list(scores)[:50]:
+        standing = board.standing(evaluation_id)
+        for metric in METRICS:
+            score = scores[evaluation_id][metric]
+            below = sum(1 for values in scores.values() if values[metric] < score)
+            equal = sum(1 for values in scores.values() if values[metric] == score)
+            assert standing[metric]["score"] == score
+            assert standing[metric]["rank"] == len(scores) - below - equal + 1
+            assert standing[metric]["percentile"] == round(100 * (below + equal / 2) / len(scores), 2)
+            assert board.percentile(metric, score) == standing[metric]["percentile"]
+    assert board.standing("unknown") is None
+
+
+def test_scores_are_clamped_and_invalid_ones_skipped():
+    board = Leaderboard(METRICS)
+    board.add("a", {"feasibility_score": 140, "market_demand": None})
+    board.add("b", {"feasibility_score": -3.2, "market_demand": True})
+
+    assert board.standing("a") == {
+        "feasibility_score": {"score": 100, "rank": 1, "total": 2, "percentile": 75.0}
+    }
+    assert board.top("feasibility_score")["entries"][1] == {"rank": 2, "evaluation_id": "b", "score": 0}
+    assert board.top("market_demand")["total"] == 0
+    assert board.percentile("market_demand", 50) is None
+
+
+def test_unknown_metric():
+    with pytest.raises(ValueError, match="Unknown metric"):
+        Leaderboard(METRICS).top("nope")
+
+
+def test_load_keeps_concurrent_adds():
+    board = Leaderboard(METRICS)
+    rows = [(f"id{i}", metric, i % 101) for i in range(300) for metric in METRICS]
+    # The same evaluation saved live and read from the store
+    board.add("id5", {"feasibility_score": 5, "market_demand": 5})
+    board.add("live", {"feasibility_score": 99, "market_demand": 1})
+
+    # id5 was already indexed, so only the other 299 are loaded
+    assert board.load(iter(rows)) == 299
+    assert not board.loading
+    assert board.stats()["evaluations"] == 301
+    assert board.top("feasibility_score", 1)["entries"] == [{"rank": 1, "evaluation_id": "id100", "score": 100}]
+    assert board.standing("id5")["feasibility_score"]["score"] == 5
@@ -0,0 +1,46 @@
+"""
+Tests for PromptBuilder's adaptive max_tokens: the ceiling after a
+truncation and how long it is held
+"""
+
+from services.prompt_builder import PromptBuilder
+
+
+def _warm_builder(**kwargs):
+    builder = PromptBuilder(max_max_tokens=2000, min_max_tokens=600, min_samples=20, **kwargs)
+    for _ in range(500):
+        builder.record_usage(1000, 800)
+    return builder
+
+
+def test_adapts_to_recent_completions():
+    assert _warm_builder().max_tokens() == 1000   # p99 800 * 1.25 headroom
+
+
+def test_truncation_restores_the_ceiling_immediately():
+    builder = _warm_builder()
+
+    builder.record_usage(1000, 1000, truncated=True)
+
+    assert builder.max_tokens() == 2000
+
+
+def test_ceiling_is_held_for_the_next_requests():
+    builder = _warm_builder(ceiling_hold=3)
+    builder.record_usage(1000, 1000, truncated=True)
+
+    for _ in range(2):
+        builder.record_usage(1000, 800)
+        assert builder.max_tokens() == 2000
+    builder.record_usage(1000, 800)
+
+    assert builder.max_tokens() == 1000
+
+
+def test_follow_up_requests_do_not_release_the_hold():
+    builder = _warm_builder(ceiling_hold=1)
+    builder.record_usage(1000, 1000, truncated=True)
+
+    builder.record_usage(300, 100, sample=False)
+
+    assert builder.max_tokens() == 2000
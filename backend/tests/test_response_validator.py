@@ -0,0 +1,69 @@
+"""
+Tests for repairing truncated LLM output and for the missing-field check
+"""
+
+import json
+
+import pytest
+
+from services.response_validator import REQUIRED_FIELDS, ResponseValidator, repair_json
+
+
+def _first_parsable(text):
+    for candidate in repair_json(text):
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Cut off inside a string
+    ('{"executive_summary": "A marketplace for', {"executive_summary": "A marketplace for"}),
+    # Cut off inside a list of strings
+    ('{"strengths": ["Large market", "Low co', {"strengths": ["Large market", "Low co"]}),
+    # Cut off after a complete member
+    ('{"a": "x", "b": ["y"],', {"a": "x", "b": ["y"]}),
+    # Cut off after a key: falls back to the last complete member
+    ('{"a": "x", "b": ', {"a": "x"}),
+    # Cut off in the middle of a literal
+    ('{"a": "x", "b": tr', {"a": "x"}),
+    # Trailing commas before closing brackets
+    ('{"a": [1, 2,], "b": "y",}', {"a": [1, 2], "b": "y"}),
+    # A dangling backslash would escape the closing quote
+    ('{"a": "line\\', {"a": "line"}),
+    # Brackets and quotes inside strings do not count
+    ('{"a": "has } and ] and \\" inside", "b": "cut', {"a": 'has } and ] and " inside', "b": "cut"}),
+    # Text around the object is ignored
+    ('Here you go: {"a": "x"} hope this helps', {"a": "x"}),
+])
+def test_repair_json_recovers_truncated_output(text, expected):
+    assert _first_parsable(text) == expected
+
+
+def test_repair_json_without_an_object():
+    assert repair_json("no json here") == []
+
+
+def test_load_repairs_and_counts():
+    validator = ResponseValidator()
+    assert validator.load('```json\n{"a": "x"}\n```') == {"a": "x"}
+    assert validator.load('{"a": "x", "b": "y') == {"a": "x", "b": "y"}
+    with pytest.raises(json.JSONDecodeError):
+        validator.load("not json")
+    assert validator.stats() == {'parsed': 1, 'repaired': 1, 'incomplete': 0, 'unrecoverable': 1}
+
+
+def test_null_fields_are_reported_missing():
+    validator = ResponseValidator()
+    fields = {field: "text" for field in REQUIRED_FIELDS}
+    fields.update(strengths=None, weaknesses=["Crowded market"], improvement_suggestions="Start small",
+                  target_users=None)
+
+    evaluation, missing = validator.parse(json.dumps(fields))
+
+    assert sorted(missing) == ["strengths", "target_users"]
+    assert evaluation["weaknesses"] == ["Crowded market"]
+    assert evaluation["improvement_suggestions"] == ["Start small"]
+    assert validator.stats()['incomplete'] == 1
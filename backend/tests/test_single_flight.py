@@ -0,0 +1,140 @@
+"""
+Tests for SingleFlight and AsyncSingleFlight: coalescing, result copies and
+error and cancellation propagation to waiters
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"items": [1]}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", fn)))
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=lambda: results.append(flight.do("key", fn))) for _ in range(4)]
+    for waiter in waiters:
+        waiter.start()
+    # Let the waiters reach the in-flight call before it finishes
+    while flight.stats()['saved_calls'] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"items": [1]}] * 5
+    # Every caller gets its own copy
+    assert len({id(result) for result in results}) == 5
+    assert flight.stats() == {'calls': 1, 'saved_calls': 4, 'in_flight': 0}
+
+
+def test_error_is_raised_to_every_waiter_and_not_cached():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    started.wait(5)
+    threads += [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads[1:]:
+        thread.start()
+    while flight.stats()['saved_calls'] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["upstream failed"] * 3
+    # The next call runs again instead of reusing the failure
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_async_waiters_share_one_call():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"score": 70}
+
+        results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [{"score": 70}] * 5
+    assert flight.stats() == {'calls': 1, 'saved_calls': 4, 'in_flight': 0}
+
+
+def test_async_error_reaches_every_waiter():
+    async def main():
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        return await asyncio.gather(*(flight.do("key", failing) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [ValueError] * 3
+
+
+def test_async_cancelled_leader_does_not_fail_waiters():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", fn))
+        await asyncio.sleep(0.01)
+        # e.g. the leader's client disconnected
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter, calls, flight.stats()
+
+    result, calls, stats = asyncio.run(main())
+    assert result == "done"
+    assert len(calls) == 1
+    assert stats['in_flight'] == 0
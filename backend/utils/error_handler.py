@@ -3,30 +3,67 @@ Error Handler - Centralized error handling utilities
 """
 
 from flask import jsonify
+import math
 import traceback
+from utils.metrics import ERRORS
 
 
-def handle_errors(error: Exception) -> tuple:
+def log_error(error: Exception, context: str = None) -> None:
     """
-    Centralized error handler
+    Log an error and count it by type
     
     Args:
         error: Exception object
-        
-    Returns:
-        tuple: (JSON response, HTTP status code)
+        context: What was being done, for errors that are not returned to the client
     """
-    error_message = str(error)
     error_type = type(error).__name__
+    ERRORS.inc(type=error_type)
     
     # Log error (in production, use proper logging)
-    print(f"Error: {error_type} - {error_message}")
+    prefix = f"Error ({context})" if context else "Error"
+    print(f"{prefix}: {error_type} - {str(error)}")
     print(traceback.format_exc())
+
+
+def error_payload(error: Exception) -> dict:
+    """
+    Log an error and build the JSON error body
     
-    # Return appropriate error response
-    return jsonify({
+    Args:
+        error: Exception object
+        
+    Returns:
+        dict: Error response body
+    """
+    error_message = str(error)
+    error_type = type(error).__name__
+    log_error(error)
+    
+    return {
         "success": False,
         "error": error_message,
         "error_type": error_type
-    }), 500
+    }
+
+
+def handle_errors(error: Exception) -> tuple:
+    """
+    Centralized error handler
+    
+    Args:
+        error: Exception object
+        
+    Returns:
+        tuple: (JSON response, HTTP status code)
+    """
+    # Overload errors that say when to come back (e.g. the LLM rate limit
+    # queue is full) are temporary: ask the client to retry
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        response = jsonify(error_payload(error))
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response, 503
+    
+    # Return appropriate error response
+    return jsonify(error_payload(error)), 500
 
@@ -0,0 +1,68 @@
+"""
+Lazy - Services built on first use instead of at import time
+Keeps module import (and so process cold start) free of heavy imports like
+groq and ReportLab until a request actually needs them
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict
+
+
+class Lazy:
+    """
+    Proxy that builds its target with factory() on first attribute access
+
+    Attribute reads and writes are forwarded to the target, so a Lazy can
+    stand in wherever the service object was used directly (the proxy's own
+    resolve, loaded and load_status shadow the target's). Construction
+    happens once, under a lock; if the factory raises, the error propagates
+    and the next access tries again.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        """
+        Args:
+            name: Name reported by load_status()
+            factory: Zero-argument callable that builds the service (and does its imports)
+        """
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, '_init_seconds', None)
+
+    def resolve(self) -> Any:
+        """The service, building it if needed"""
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    started = time.perf_counter()
+                    target = self._factory()
+                    object.__setattr__(self, '_init_seconds', time.perf_counter() - started)
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def load_status(self) -> Dict:
+        """Whether the service is built and how long building it took"""
+        seconds = self._init_seconds
+        return {
+            'name': self._name,
+            'loaded': self.loaded,
+            'init_ms': None if seconds is None else round(seconds * 1000, 1)
+        }
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.resolve(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self.resolve(), attribute, value)
+
+    def __repr__(self) -> str:
+        return f"Lazy({self._name}, loaded={self.loaded})"
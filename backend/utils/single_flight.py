@@ -0,0 +1,133 @@
+"""
+Single Flight - Coalesces concurrent calls for the same key into one
+"""
+
+import asyncio
+import copy
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """One in-flight call shared by every waiter"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time
+
+    Concurrent callers with the same key block until the leader's call
+    finishes and then share its result (each gets a deep copy so callers
+    can mutate it freely) or re-raise its exception.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0        # Upstream calls actually made
+        self.saved_calls = 0  # Callers served by another caller's in-flight call
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() for key, or wait for the call already in flight
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            The result of fn()
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.saved_calls += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+
+        if leader:
+            try:
+                call.result = fn()
+            except Exception as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    def stats(self) -> Dict:
+        """Upstream calls made and calls saved by coalescing"""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'saved_calls': self.saved_calls,
+                'in_flight': len(self._calls)
+            }
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight
+
+    Must be used from a single event loop. The shared call runs as its own
+    task, and every caller (the first one included) awaits it through
+    asyncio.shield, so a caller that is cancelled (e.g. on client
+    disconnect) neither cancels the call nor fails the other waiters.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.saved_calls = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn() for key, or wait for the call already in flight
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            A deep copy of the shared result
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.saved_calls += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            self.calls += 1
+            task.add_done_callback(functools.partial(self._finished, key))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        """Upstream calls made and calls saved by coalescing"""
+        return {
+            'calls': self.calls,
+            'saved_calls': self.saved_calls,
+            'in_flight': len(self._calls)
+        }